@@ -3,12 +3,33 @@
 import json
 from PySide6.QtCore import QSettings
 
+class _CharacterProgress:
+    """Per-character evaluation state: defeated boss names and unmet requirements per achievement."""
+    __slots__ = ("defeated_name_counts", "remaining")
+
+    def __init__(self, required_counts):
+        self.defeated_name_counts = {}   # boss name -> number of defeated bosses with that name
+        self.remaining = list(required_counts)
+
+
 class AchievementManager:
     def __init__(self, achievements_file):
         self.achievements_file = achievements_file
         self.achievements = self._load_achievements()
         self.settings = QSettings("TheTarnishedChronicle", "App")
 
+        # Inverted index: boss name -> indexes of the achievements that require it
+        self._achievements_by_boss = {}
+        self._required_counts = []
+        for achievement_index, achievement in enumerate(self.achievements):
+            required_bosses = set(achievement.get("bosses", []))
+            self._required_counts.append(len(required_bosses))
+            for boss_name in required_bosses:
+                self._achievements_by_boss.setdefault(boss_name, []).append(achievement_index)
+
+        self._progress = {}         # character name -> _CharacterProgress
+        self._unlocked_cache = {}   # character name -> set of unlocked achievement names
+
     def _load_achievements(self):
         """Loads achievement definitions from the JSON file."""
         try:
@@ -23,17 +44,23 @@ class AchievementManager:
         """Returns the list of all available achievements."""
         return self.achievements
 
+    def _get_unlocked_set(self, character_name):
+        """The cached unlocked set, read from QSettings on first use."""
+        unlocked = self._unlocked_cache.get(character_name)
+        if unlocked is None:
+            self.settings.beginGroup(f"achievements/{character_name}")
+            unlocked = set(self.settings.value("unlocked", [], type=list))
+            self.settings.endGroup()
+            self._unlocked_cache[character_name] = unlocked
+        return unlocked
+
     def get_unlocked_achievements(self, character_name):
         """
         Gets the set of unlocked achievement names for a specific character.
         """
         if not character_name:
             return set()
-        
-        self.settings.beginGroup(f"achievements/{character_name}")
-        unlocked = self.settings.value("unlocked", [], type=list)
-        self.settings.endGroup()
-        return set(unlocked)
+        return set(self._get_unlocked_set(character_name))
 
     def _save_unlocked_achievements(self, character_name, unlocked_set):
         """
@@ -46,31 +73,77 @@ class AchievementManager:
         self.settings.setValue("unlocked", list(unlocked_set))
         self.settings.endGroup()
 
-    def check_and_update_achievements(self, character_name, defeated_bosses):
+    def reset_progress(self, character_name):
+        """Forgets the evaluated boss state; the next update must list every defeated boss again."""
+        self._progress.pop(character_name, None)
+
+    def update_for_boss_changes(self, character_name, defeated_bosses, cleared_bosses=()):
         """
-        Checks for newly unlocked achievements and updates the character's record.
-        Returns a list of newly unlocked achievements.
+        Incremental check: `defeated_bosses` / `cleared_bosses` are only the bosses whose
+        state changed since the last call for this character. Only achievements that
+        require one of them are looked at. Returns a list of newly unlocked achievements.
         """
         if not character_name:
             return []
 
-        unlocked_achievements = self.get_unlocked_achievements(character_name)
-        newly_unlocked = []
-        
-        defeated_boss_names = {boss['name'] for boss in defeated_bosses}
+        progress = self._progress.get(character_name)
+        if progress is None:
+            progress = self._progress[character_name] = _CharacterProgress(self._required_counts)
+            # Achievements without requirements are met from the start.
+            touched = {i for i, count in enumerate(self._required_counts) if count == 0}
+        else:
+            touched = set()
 
-        for achievement in self.achievements:
-            name = achievement.get("name")
-            required_bosses = set(achievement.get("bosses", []))
-            
-            if name in unlocked_achievements:
+        counts = progress.defeated_name_counts
+        for boss in defeated_bosses:
+            name = boss['name']
+            counts[name] = counts.get(name, 0) + 1
+            if counts[name] == 1:
+                for achievement_index in self._achievements_by_boss.get(name, ()):
+                    progress.remaining[achievement_index] -= 1
+                    touched.add(achievement_index)
+        for boss in cleared_bosses:
+            name = boss['name']
+            if counts.get(name, 0) == 0:
                 continue
+            counts[name] -= 1
+            if counts[name] == 0:
+                del counts[name]
+                for achievement_index in self._achievements_by_boss.get(name, ()):
+                    progress.remaining[achievement_index] += 1
 
-            if required_bosses.issubset(defeated_boss_names):
+        unlocked_achievements = self._get_unlocked_set(character_name)
+        newly_unlocked = []
+        for achievement_index in sorted(touched):
+            achievement = self.achievements[achievement_index]
+            name = achievement.get("name")
+            if progress.remaining[achievement_index] == 0 and name not in unlocked_achievements:
                 unlocked_achievements.add(name)
                 newly_unlocked.append(achievement)
 
         if newly_unlocked:
             self._save_unlocked_achievements(character_name, unlocked_achievements)
             
-        return newly_unlocked
\ No newline at end of file
+        return newly_unlocked
+
+    def check_and_update_achievements(self, character_name, defeated_bosses):
+        """
+        Checks for newly unlocked achievements and updates the character's record.
+        `defeated_bosses` is the full list of defeated bosses; it is diffed against the
+        previous call, so only achievements affected by the difference are evaluated.
+        Returns a list of newly unlocked achievements.
+        """
+        if not character_name:
+            return []
+
+        progress = self._progress.get(character_name)
+        previous = set(progress.defeated_name_counts) if progress else set()
+        if progress is not None:
+            # The full list is compared by name, so each name counts once.
+            progress.defeated_name_counts = dict.fromkeys(previous, 1)
+        current = {boss['name'] for boss in defeated_bosses}
+        return self.update_for_boss_changes(
+            character_name,
+            [{'name': name} for name in current - previous],
+            [{'name': name} for name in previous - current]
+        )
@@ -1,4 +1,5 @@
 # src/app_config.py
+import os
 
 # Verze aplikace
 APP_VERSION = "1.0.0"
@@ -10,12 +11,27 @@ DEFAULT_OVERLAY_FONT_SIZE_STR = "15pt"
 
 # Monitoring settings
 DEFAULT_MONITORING_INTERVAL_SEC = 5
+# "watch": read the save only after it changes on disk, "poll": read it every interval
+MONITORING_MODE = "watch"
+SAVE_WATCH_DEBOUNCE_MS = 500
+# Used only when the file system watcher cannot watch the save file
+SAVE_STAT_POLL_INTERVAL_MS = 1000
+
+# Game process detection (override the name e.g. to test with a stand-in process on Linux)
+GAME_PROCESS_NAME = os.environ.get("TTC_GAME_PROCESS_NAME", "eldenring.exe")
+# Full process scans back off from the min to the max interval while the game isn't running
+GAME_PROCESS_SCAN_MIN_INTERVAL_SEC = 5
+GAME_PROCESS_SCAN_MAX_INTERVAL_SEC = 30
 
 # Rust CLI settings
 RUST_CLI_TOOL_PATH_PLACEHOLDER = "RUST_CLI_TOOL_PATH_PLACEHOLDER"
 DEFAULT_BOSS_REFERENCE_FILENAME = "boss_ids_reference.json"
 DLC_BOSS_REFERENCE_FILENAME = "boss_ids_reference_DLC.json" 
 
+# Save backend: "rust_cli" (flag_extractor_cli) or "python" (in-process SaveReader)
+SAVE_READER_BACKEND = "rust_cli"
+EVENT_FLAG_BST_FILENAME = "eventflag_bst.txt"
+
 
 # Lokace, které v tomto seznamu nebudou, se automaticky zařadí na konec.
 LOCATION_PROGRESSION_ORDER = [
@@ -69,4 +85,40 @@ GAME_PHASE_HEADINGS = {
         "property": "dlc"
     }
     # --- END ADDED SECTION ---
-}
\ No newline at end of file
+}
+
+# Colored icon pixmap cache (utils.create_colored_pixmap)
+PIXMAP_CACHE_MAX_ENTRIES = 128
+PIXMAP_CACHE_PREWARM = True
+
+# Kill timestamp journal (timestamp_manager.TimestampManager)
+TIMESTAMP_JOURNAL_FSYNC_BATCH = 8           # fsync after this many appended kills...
+TIMESTAMP_JOURNAL_FSYNC_INTERVAL_SEC = 5    # ...or once this long has passed since the last fsync
+TIMESTAMP_JOURNAL_COMPACT_THRESHOLD = 500   # journal records before folding them into the snapshot
+
+# Run history database (run_history_store.RunHistoryStore)
+RUN_HISTORY_ENABLED = True
+RUN_HISTORY_DB_FILENAME = "run_history.sqlite3"
+RUN_HISTORY_BATCH_SIZE = 200
+RUN_HISTORY_FLUSH_INTERVAL_SEC = 2
+
+# Local stats feed for browser sources (stats_feed_server.StatsFeedServer)
+STATS_FEED_ENABLED = False
+STATS_FEED_HOST = "127.0.0.1"
+STATS_FEED_PORT = 8765
+STATS_FEED_CLIENT_QUEUE_SIZE = 64   # queued events per client before a stalled client is dropped
+STATS_FEED_KEEPALIVE_SEC = 15
+
+# Startup profile (--profile-startup): reported with the first stats, or after this delay
+STARTUP_PROFILE_TIMEOUT_MS = 10000
+
+# Headless service (python -m src.headless), config in the app data folder by default
+HEADLESS_CONFIG_FILENAME = "headless.json"
+
+# Batch analytics (python -m src.batch_analytics)
+BATCH_ANALYTICS_CHUNK_SIZE = 8          # saves handed to a worker process at a time
+BATCH_ANALYTICS_ROW_GROUP_SIZE = 10000  # rows per Parquet row group (bounds buffered rows)
+BATCH_ANALYTICS_PROGRESS_EVERY = 500    # print files/sec every N files
+
+# Boss search: applied this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
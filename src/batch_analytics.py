@@ -0,0 +1,259 @@
+# src/batch_analytics.py
+"""
+Stats across a directory of archived .sl2 saves.
+Run with `python -m src.batch_analytics <directory> --output slots.csv [options]`.
+
+Every populated slot of every save becomes one row (deaths, play time, bosses
+defeated, completion). Snapshots of the same character (same folder, slot and
+name) are combined into a kills table: each boss is dated by the earliest
+snapshot (lowest play time) that has it defeated, with the deaths at that
+point, and numbered in that order.
+"""
+import os
+import csv
+import time
+import argparse
+import multiprocessing
+
+from .app_config import (
+    RUST_CLI_TOOL_PATH_PLACEHOLDER,
+    SAVE_READER_BACKEND,
+    DEFAULT_BOSS_REFERENCE_FILENAME,
+    DLC_BOSS_REFERENCE_FILENAME,
+    BATCH_ANALYTICS_CHUNK_SIZE,
+    BATCH_ANALYTICS_ROW_GROUP_SIZE,
+    BATCH_ANALYTICS_PROGRESS_EVERY
+)
+from .boss_data_manager import BossDataManager
+from .boss_status_store import BossStatusStore
+from .save_reader import create_save_backend
+
+SLOT_COLUMNS = ["file", "run", "slot_index", "character_name", "character_level", "seconds_played",
+                "deaths", "bosses_defeated", "bosses_total", "completion_pct"]
+KILL_COLUMNS = ["run", "slot_index", "character_name", "kill_order", "boss_name", "location",
+                "seconds_played", "deaths", "first_seen_file"]
+
+# Per worker process, set up once by _init_worker.
+_worker = {}
+
+
+def _init_worker(backend_name, content_filter):
+    backend = create_save_backend(backend_name, RUST_CLI_TOOL_PATH_PLACEHOLDER)
+    manager = BossDataManager(DEFAULT_BOSS_REFERENCE_FILENAME, DLC_BOSS_REFERENCE_FILENAME)
+    manager.load_definitions()
+    manager.set_content_filter(content_filter)
+    _worker.update(backend=backend, index=manager.boss_index, event_ids=manager.get_all_event_ids_to_monitor())
+
+
+def _read_save(task):
+    """
+    Worker: reads every populated slot of one save.
+    Returns (relative path, run, [(slot row, [defeated boss index, ...]), ...], error).
+    """
+    path, relative_path = task
+    run = os.path.dirname(relative_path)
+    statuses, err = _worker["backend"].get_multi_slot_status(path, _worker["event_ids"])
+    if err:
+        return relative_path, run, [], err
+
+    index = _worker["index"]
+    results = []
+    for slot_index, payload in sorted(statuses.items()):
+        store = BossStatusStore(index)
+        store.apply_statuses(payload.get("boss_statuses", {}))
+        stats = payload.get("stats", {})
+        defeated = store.defeated_count
+        row = {
+            "file": relative_path,
+            "run": run,
+            "slot_index": slot_index,
+            "character_name": stats.get("character_name", ""),
+            "character_level": stats.get("character_level"),
+            "seconds_played": stats.get("seconds_played"),
+            "deaths": stats.get("deaths"),
+            "bosses_defeated": defeated,
+            "bosses_total": store.total,
+            "completion_pct": round(100.0 * defeated / store.total, 2) if store.total else 0.0,
+        }
+        results.append((row, sorted(store.defeated_indexes)))
+    return relative_path, run, results, None
+
+
+def iter_save_files(directory):
+    """Yields (path, path relative to directory) of every .sl2 below directory, in a stable order."""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".sl2"):
+                path = os.path.join(root, name)
+                yield path, os.path.relpath(path, directory)
+
+
+class _CsvSink:
+    def __init__(self, path, columns):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetSink:
+    """Buffers up to `row_group_size` rows and writes them as one Parquet row group."""
+
+    def __init__(self, path, columns, row_group_size=BATCH_ANALYTICS_ROW_GROUP_SIZE):
+        import pyarrow
+        import pyarrow.parquet
+        self._pa = pyarrow
+        self._path = path
+        self._columns = columns
+        self._row_group_size = row_group_size
+        self._rows = []
+        self._writer = None
+        self._parquet = pyarrow.parquet
+
+    def write(self, row):
+        self._rows.append(row)
+        if len(self._rows) >= self._row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        table = self._pa.Table.from_pydict({column: [row[column] for row in self._rows] for column in self._columns})
+        if self._writer is None:
+            self._writer = self._parquet.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _open_sink(path, columns, output_format):
+    if output_format == "parquet":
+        return _ParquetSink(path, columns)
+    return _CsvSink(path, columns)
+
+
+def _kills_path(output_path):
+    stem, ext = os.path.splitext(output_path)
+    return f"{stem}_kills{ext}"
+
+
+def run_batch(directory, output_path, output_format="csv", workers=None, backend_name=SAVE_READER_BACKEND,
+              content_filter="all"):
+    """
+    Streams one row per populated slot to output_path while the saves are read in
+    a process pool, then writes the kills table next to it. Memory is bounded by
+    characters x bosses (for the kills table), not by the number of files.
+    Returns a summary dict.
+    """
+    if output_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return None, "Parquet output needs the 'pyarrow' package; use --format csv or install it."
+
+    # Definitions for naming the bosses of the kills table (the workers load their own copy).
+    manager = BossDataManager(DEFAULT_BOSS_REFERENCE_FILENAME, DLC_BOSS_REFERENCE_FILENAME)
+    manager.load_definitions()
+    manager.set_content_filter(content_filter)
+    index = manager.boss_index
+
+    # (run, slot, name) -> {boss index: (seconds_played, deaths, file)} of the earliest snapshot with it defeated
+    first_kills = {}
+    files_read = 0
+    files_failed = 0
+    slot_rows = 0
+    started = time.perf_counter()
+
+    slots_sink = _open_sink(output_path, SLOT_COLUMNS, output_format)
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(backend_name, content_filter)) as pool:
+            for relative_path, run, results, err in pool.imap_unordered(
+                    _read_save, iter_save_files(directory), chunksize=BATCH_ANALYTICS_CHUNK_SIZE):
+                if err:
+                    files_failed += 1
+                    print(f"Skipping {relative_path}: {err}")
+                    continue
+                files_read += 1
+                for row, defeated_indexes in results:
+                    slots_sink.write(row)
+                    slot_rows += 1
+                    kills = first_kills.setdefault((run, row["slot_index"], row["character_name"]), {})
+                    seconds_played = row["seconds_played"] or 0
+                    for boss_index in defeated_indexes:
+                        previous = kills.get(boss_index)
+                        if previous is None or seconds_played < previous[0]:
+                            kills[boss_index] = (seconds_played, row["deaths"], relative_path)
+                if files_read % BATCH_ANALYTICS_PROGRESS_EVERY == 0:
+                    elapsed = time.perf_counter() - started
+                    print(f"{files_read} files, {files_read / elapsed:.1f} files/sec")
+    finally:
+        slots_sink.close()
+
+    kill_rows = 0
+    kills_sink = _open_sink(_kills_path(output_path), KILL_COLUMNS, output_format)
+    try:
+        for (run, slot_index, character_name), kills in sorted(first_kills.items()):
+            ordered = sorted(kills.items(), key=lambda item: (item[1][0], item[0]))
+            for kill_order, (boss_index, (seconds_played, deaths, file_name)) in enumerate(ordered, start=1):
+                kills_sink.write({
+                    "run": run,
+                    "slot_index": slot_index,
+                    "character_name": character_name,
+                    "kill_order": kill_order,
+                    "boss_name": index.bosses[boss_index].get("name", ""),
+                    "location": index.boss_locations[boss_index],
+                    "seconds_played": seconds_played,
+                    "deaths": deaths,
+                    "first_seen_file": file_name,
+                })
+                kill_rows += 1
+    finally:
+        kills_sink.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "files_read": files_read,
+        "files_failed": files_failed,
+        "slot_rows": slot_rows,
+        "kill_rows": kill_rows,
+        "characters": len(first_kills),
+        "elapsed_sec": elapsed,
+        "files_per_sec": (files_read + files_failed) / elapsed if elapsed > 0 else 0.0,
+    }, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch stats over a directory of Elden Ring saves")
+    parser.add_argument("directory")
+    parser.add_argument("--output", required=True, help="Per-slot table; the kills table goes to <name>_kills.<ext>")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--backend", choices=("python", "rust_cli"), default=SAVE_READER_BACKEND)
+    parser.add_argument("--content-filter", choices=("all", "base", "dlc"), default="all")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Not a directory: {args.directory}")
+        return 1
+    summary, err = run_batch(args.directory, args.output, args.format, args.workers, args.backend, args.content_filter)
+    if err:
+        print(err)
+        return 1
+    print(f"Read {summary['files_read']} files ({summary['files_failed']} failed), {summary['slot_rows']} slots, "
+          f"{summary['kill_rows']} kills for {summary['characters']} characters in {summary['elapsed_sec']:.1f} s "
+          f"({summary['files_per_sec']:.1f} files/sec).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,516 @@
+# src/benchmarks.py
+"""
+Ad-hoc performance measurements for the monitoring pipeline.
+Run with `python -m src.benchmarks <benchmark> [options]`.
+"""
+import os
+import json
+import argparse
+import hashlib
+import asyncio
+import statistics
+import struct
+import tempfile
+import time
+
+from .app_config import RUST_CLI_TOOL_PATH_PLACEHOLDER
+from .boss_data_manager import BossDataManager
+from .rust_cli_handler import RustCliHandler
+from . import save_reader as sr
+from .save_reader import SaveReader
+from .stats_feed_server import StatsFeedServer
+from .status_delta import StatusDelta, compute_status_delta
+
+
+def _report(label, samples_sec):
+    """Prints median / p95 / max of a list of durations in seconds."""
+    if not samples_sec:
+        print(f"{label}: no samples")
+        return
+    ordered = sorted(samples_sec)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label}: median {statistics.median(ordered) * 1000:.2f} ms | "
+          f"p95 {p95 * 1000:.2f} ms | max {ordered[-1] * 1000:.2f} ms | n={len(ordered)}")
+
+
+def _time_calls(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _, err = func()
+        samples.append(time.perf_counter() - start)
+        if err:
+            print(f"  error: {err}")
+            break
+    return samples
+
+
+def _load_event_ids():
+    manager = BossDataManager()
+    manager.load_definitions()
+    manager.set_content_filter("all")
+    return manager.get_all_event_ids_to_monitor()
+
+
+def bench_tick_latency(args):
+    """
+    Per-tick get_full_status latency: one CLI process per call vs. the in-process
+    SaveReader, created per call (cold) and kept for the session like the monitor
+    does (warm: event flag table and bit positions cached).
+    """
+    event_ids = _load_event_ids()
+
+    def call(backend):
+        return backend.get_full_status(args.save_file_path, args.slot_index, event_ids)
+
+    cli = RustCliHandler(RUST_CLI_TOOL_PATH_PLACEHOLDER)
+    if cli.is_cli_available():
+        _report("rust CLI (spawn per call)", _time_calls(lambda: call(cli), args.iterations))
+    else:
+        print("Rust CLI tool not found, skipping the spawn-per-call path.")
+
+    reader = SaveReader()
+    if not reader.is_available():
+        print(f"Event flag table '{reader._get_bst_path()}' not found, skipping the SaveReader paths.")
+        return
+    _report("python SaveReader (new reader per call)", _time_calls(lambda: call(SaveReader()), args.iterations))
+    call(reader)   # the first call loads the table and resolves the bit positions
+    _report("python SaveReader (kept for the session)", _time_calls(lambda: call(reader), args.iterations))
+
+
+def build_synthetic_save(path, characters, event_flag_bst):
+    """
+    Writes a minimal BND4 save that SaveReader can parse.
+    `characters` maps slot index -> {"name", "level", "seconds_played", "deaths", "flags"}.
+    """
+    slot_size = 0x280000
+    user_data_10_size = 0x60000
+    entry_sizes = [slot_size + sr.ENTRY_CHECKSUM_SIZE] * sr.CHARACTER_SLOT_COUNT
+    entry_sizes.append(user_data_10_size + sr.ENTRY_CHECKSUM_SIZE)
+
+    data_start = sr.BND4_ENTRY_HEADERS_OFFSET + len(entry_sizes) * sr.BND4_ENTRY_HEADER_SIZE
+    buf = bytearray(data_start + sum(entry_sizes))
+    buf[0:4] = sr.BND4_MAGIC
+    struct.pack_into("<i", buf, sr.BND4_FILE_COUNT_OFFSET, len(entry_sizes))
+
+    offsets = []
+    pos = data_start
+    for i, size in enumerate(entry_sizes):
+        header = sr.BND4_ENTRY_HEADERS_OFFSET + i * sr.BND4_ENTRY_HEADER_SIZE
+        struct.pack_into("<q", buf, header + sr.BND4_ENTRY_SIZE_OFFSET, size)
+        struct.pack_into("<I", buf, header + sr.BND4_ENTRY_DATA_OFFSET, pos)
+        offsets.append(pos + sr.ENTRY_CHECKSUM_SIZE)
+        pos += size
+
+    user_data = offsets[sr.USER_DATA_10_INDEX]
+    for slot_index, char in characters.items():
+        buf[user_data + sr.PROFILE_ACTIVE_FLAGS_OFFSET + slot_index] = 1
+        base = user_data + sr.PROFILE_SUMMARIES_OFFSET + slot_index * sr.PROFILE_SUMMARY_SIZE
+        name = char["name"].encode('utf-16-le')[:sr.PROFILE_NAME_SIZE - 2]
+        buf[base:base + len(name)] = name
+        struct.pack_into("<I", buf, base + sr.PROFILE_LEVEL_OFFSET, char.get("level", 1))
+        struct.pack_into("<I", buf, base + sr.PROFILE_SECONDS_PLAYED_OFFSET, char.get("seconds_played", 0))
+
+        # Empty gaitem map, no projectiles and no regions -> fixed layout.
+        slot = offsets[slot_index]
+        struct.pack_into("<I", buf, slot, 0xFF)
+        deaths_offset = (slot + sr.SLOT_HEADER_SIZE + sr.SLOT_GAITEM_COUNT * sr.GAITEM_BASE_SIZE
+                         + sum(sr.SLOT_SECTIONS_AFTER_GAITEMS) + 4
+                         + sum(sr.SLOT_SECTIONS_AFTER_PROJECTILES) + 4
+                         + sum(sr.SLOT_SECTIONS_AFTER_REGIONS))
+        struct.pack_into("<I", buf, deaths_offset, char.get("deaths", 0))
+        flags_start = deaths_offset + sr.DEATHS_TO_EVENT_FLAGS
+        for eid in char.get("flags", ()):
+            remainder = eid % 1000
+            byte = flags_start + event_flag_bst[eid // 1000] * sr.EVENT_FLAG_BLOCK_SIZE + remainder // 8
+            buf[byte] |= 1 << (7 - remainder % 8)
+
+    # Entry checksums, like the game writes them (MultiSlotChangeDetector compares these).
+    for data_start, size in zip(offsets, entry_sizes):
+        checksum_start = data_start - sr.ENTRY_CHECKSUM_SIZE
+        buf[checksum_start:data_start] = hashlib.md5(buf[data_start:checksum_start + size]).digest()
+
+    with open(path, 'wb') as f:
+        f.write(buf)
+
+
+def bench_save_reader(args):
+    """get_full_status latency: in-process SaveReader vs. spawning the Rust CLI."""
+    event_ids = _load_event_ids()
+    event_flag_bst = None
+    save_file_path = args.save_file_path
+    temp_dir = None
+    if args.synthetic or not event_ids:
+        event_ids = event_ids or list(range(10000000, 10000000 + args.synthetic_ids))
+        event_flag_bst = {block: i for i, block in enumerate(sorted({eid // 1000 for eid in event_ids}))}
+        temp_dir = tempfile.TemporaryDirectory()
+        save_file_path = os.path.join(temp_dir.name, "ER0000.sl2")
+        build_synthetic_save(save_file_path, {args.slot_index: {
+            "name": "Synthetic", "level": 50, "seconds_played": 3600, "deaths": 42, "flags": event_ids[::3]
+        }}, event_flag_bst)
+
+    reader = SaveReader(event_flag_bst=event_flag_bst)
+    _report("python SaveReader", _time_calls(
+        lambda: reader.get_full_status(save_file_path, args.slot_index, event_ids), args.iterations))
+
+    cli = RustCliHandler(RUST_CLI_TOOL_PATH_PLACEHOLDER)
+    if cli.is_cli_available() and not temp_dir:
+        _report("rust CLI (spawn per call)", _time_calls(
+            lambda: cli.get_full_status(save_file_path, args.slot_index, event_ids), args.iterations))
+    if temp_dir:
+        temp_dir.cleanup()
+
+
+def bench_delta(args):
+    """Old JSON-string comparison vs. compute_status_delta on large payloads."""
+    statuses = {str(10000000 + i): i % 4 == 0 for i in range(args.event_ids)}
+    old = {"stats": {"deaths": 10, "seconds_played": 3600}, "boss_statuses": statuses}
+    # Typical tick: play time moved, one boss died.
+    new_statuses = dict(statuses)
+    new_statuses[str(10000001)] = True
+    new = {"stats": {"deaths": 10, "seconds_played": 3605}, "boss_statuses": new_statuses}
+
+    def json_compare():
+        changed = json.dumps(new, sort_keys=True) != json.dumps(old, sort_keys=True)
+        defeated = [eid for eid, is_set in new_statuses.items() if is_set and not statuses.get(eid, False)]
+        return (changed, defeated), None
+
+    def delta_compare():
+        return compute_status_delta(old, new), None
+
+    print(f"{args.event_ids} event IDs")
+    _report("json.dumps + kill scan", _time_calls(json_compare, args.iterations))
+    _report("compute_status_delta", _time_calls(delta_compare, args.iterations))
+
+
+def build_synthetic_definitions(boss_count, bosses_per_location=50, first_event_id=10000000):
+    """Boss definitions shaped like boss_ids_reference.json; every 10th boss has two event IDs."""
+    definitions = {}
+    for i in range(boss_count):
+        location = f"Location {i // bosses_per_location}"
+        event_id = first_event_id + i * 2
+        boss = {"name": f"Boss {i}", "event_id": [event_id, event_id + 1] if i % 10 == 0 else event_id}
+        definitions.setdefault(location, []).append(boss)
+    return definitions
+
+
+def bench_boss_index(args):
+    """Filter view build/switch times, then kill attribution by scan vs. by the event ID index."""
+    manager = BossDataManager()
+    dlc_bosses = max(1, args.bosses // 5)
+    manager._set_definitions(
+        build_synthetic_definitions(args.bosses),
+        build_synthetic_definitions(dlc_bosses, first_event_id=20000000)
+    )
+    for filter_mode in ("base", "dlc", "all"):
+        start = time.perf_counter()
+        manager.set_content_filter(filter_mode)
+        print(f"first set_content_filter('{filter_mode}'): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    modes = iter(["base", "all"] * args.iterations)
+    def switch_filter():
+        manager.set_content_filter(next(modes))
+        return None, None
+
+    _report("filter switch (cached view)", _time_calls(switch_filter, args.iterations))
+    manager.set_content_filter("base")
+    print(f"{args.bosses} base + {dlc_bosses} DLC bosses")
+
+    event_ids = manager.get_all_event_ids_to_monitor()
+    # Worst case for the scan: the last defined boss.
+    target = str(max(event_ids))
+
+    def linear_scan():
+        for location, bosses in manager.get_boss_data_by_location().items():
+            for boss_info in bosses:
+                ids = boss_info.get("event_id", [])
+                if not isinstance(ids, list):
+                    ids = [ids]
+                if target in [str(eid) for eid in ids]:
+                    return (location, boss_info), None
+        return None, "not found"
+
+    def index_lookup():
+        entry = manager.get_boss_by_event_id(target)
+        return entry, None if entry else "not found"
+
+    _report("linear scan", _time_calls(linear_scan, args.iterations))
+    _report("event ID index", _time_calls(index_lookup, args.iterations))
+
+
+def bench_definitions_load(args):
+    """load_definitions + first set_content_filter: parsing the JSON vs. the compiled cache."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        dlc_bosses = max(1, args.bosses // 5)
+        for filename, definitions in (
+                ("base.json", build_synthetic_definitions(args.bosses)),
+                ("dlc.json", build_synthetic_definitions(dlc_bosses, first_event_id=20000000))):
+            with open(os.path.join(data_dir, filename), 'w', encoding='utf-8') as f:
+                json.dump(definitions, f)
+
+        def load(cache_filename):
+            manager = BossDataManager("base.json", "dlc.json", cache_filename=cache_filename)
+            manager._get_reference_data_path = lambda filename: os.path.join(data_dir, filename)
+            manager.load_definitions()
+            manager.set_content_filter("all")
+            return None, None
+
+        print(f"{args.bosses} base + {dlc_bosses} DLC bosses")
+        _report("JSON parse", _time_calls(lambda: load(None), args.iterations))
+        _report("first load (JSON + cache write)", _time_calls(lambda: load("defs.cache"), 1))
+        _report("compiled cache", _time_calls(lambda: load("defs.cache"), args.iterations))
+
+
+def bench_search(args):
+    """Per-keystroke search cost while typing a boss name: linear scan vs. the search index."""
+    from .boss_search_index import BossSearchIndex
+    from .boss_status_store import BossIndex
+
+    for boss_count in args.bosses:
+        index = BossIndex(build_synthetic_definitions(boss_count))
+        # Worst case for the scan: the last defined boss.
+        target = index.bosses[-1]["name"].lower()
+        keystrokes = [target[:length] for length in range(1, len(target) + 1)]
+
+        def linear_scan():
+            for term in keystrokes:
+                matching = set()
+                for location, bosses in index.records_by_location.items():
+                    if term in location.lower() or any(term in boss.get("name", "").lower() for boss in bosses):
+                        matching.add(location)
+            return None, None
+
+        search_index = BossSearchIndex(index)
+        start = time.perf_counter()
+        search_index.search("x")
+        print(f"{boss_count} bosses: index built in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{len(keystrokes)} keystrokes per sample")
+
+        def indexed(narrow):
+            def run():
+                result = None
+                for term in keystrokes:
+                    result = search_index.search(term, result if narrow else None)
+                return None, None
+            return run
+
+        _report("  linear scan", _time_calls(linear_scan, args.iterations))
+        _report("  index", _time_calls(indexed(False), args.iterations))
+        _report("  index, narrowing", _time_calls(indexed(True), args.iterations))
+
+
+def bench_boss_tree(args):
+    """Cost of a stats update in the boss tree model: changed rows vs. total bosses."""
+    # Qt is only needed here; run without a display.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from .boss_tree_model import BossTreeModel, BossFilterProxyModel
+    from .ui_components import create_main_boss_area
+
+    app = QApplication.instance() or QApplication([])
+    for boss_count in args.bosses:
+        manager = BossDataManager()
+        manager._set_definitions(build_synthetic_definitions(boss_count), {})
+        manager.set_content_filter("base")
+        model = BossTreeModel()
+        proxy = BossFilterProxyModel()
+        proxy.setSourceModel(model)
+        proxy.set_hide_defeated(True)
+        view = create_main_boss_area(None, proxy)
+        layout = [("location", location) for location in manager.get_boss_data_by_location()]
+        model.load(layout, manager.status_store, {})
+        emitted = []
+        model.dataChanged.connect(lambda top_left, bottom_right: emitted.append(1))
+
+        event_ids = [str(eid) for eid in manager.get_all_event_ids_to_monitor()]
+        for changed_count in args.changed:
+            batches = iter(range(0, len(event_ids), changed_count))
+
+            def update():
+                start = next(batches)
+                changed = manager.update_boss_statuses({}, StatusDelta(flags_set=event_ids[start:start + changed_count]))
+                model.update_bosses(changed)
+                return None, None
+
+            emitted.clear()
+            iterations = min(args.iterations, len(event_ids) // changed_count)
+            samples = _time_calls(update, iterations)
+            per_update = len(emitted) / max(1, len(samples))
+            _report(f"{boss_count} bosses, {changed_count} flags set ({per_update:.1f} dataChanged/update)", samples)
+        view.deleteLater()
+    app.processEvents()
+
+
+def bench_multi_slot(args):
+    """Several characters per save: per-slot reads vs. one multi-slot pass, and monitor ticks by changed slots."""
+    from .multi_slot_monitor import MultiSlotMonitor
+
+    event_ids = list(range(10000000, 10000000 + args.synthetic_ids))
+    event_flag_bst = {block: i for i, block in enumerate(sorted({eid // 1000 for eid in event_ids}))}
+
+    def characters(changed_slots=(), generation=0):
+        return {slot_index: {
+            "name": f"Char{slot_index}", "level": 10 + slot_index, "seconds_played": 3600,
+            "deaths": generation if slot_index in changed_slots else 0,
+            "flags": event_ids[slot_index::7]
+        } for slot_index in range(args.slots)}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        save_file_path = os.path.join(temp_dir, "ER0000.sl2")
+        build_synthetic_save(save_file_path, characters(), event_flag_bst)
+        reader = SaveReader(event_flag_bst=event_flag_bst)
+
+        def per_slot():
+            for slot_index in range(args.slots):
+                reader.get_full_status(save_file_path, slot_index, event_ids)
+            return None, None
+
+        _report(f"{args.slots} x get_full_status", _time_calls(per_slot, args.iterations))
+        _report(f"get_multi_slot_status ({args.slots} slots)", _time_calls(
+            lambda: reader.get_multi_slot_status(save_file_path, event_ids), args.iterations))
+
+        for changed_count in sorted({1, args.slots}):
+            monitor = MultiSlotMonitor(reader)
+            monitor.poll(save_file_path, event_ids)
+            samples = []
+            for generation in range(1, args.iterations + 1):
+                build_synthetic_save(save_file_path, characters(range(changed_count), generation), event_flag_bst)
+                start = time.perf_counter()
+                updates, err = monitor.poll(save_file_path, event_ids)
+                samples.append(time.perf_counter() - start)
+                if err or len(updates) != changed_count:
+                    print(f"Unexpected poll result: {err or sorted(updates)}")
+                    return
+            _report(f"monitor tick, {changed_count}/{args.slots} slots changed", samples)
+            start = time.perf_counter()
+            monitor.poll(save_file_path, event_ids)
+            print(f"monitor tick, file unchanged: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+
+def bench_stats_feed(args):
+    """Fan-out latency of the stats feed: publish() until every local SSE client has the delta."""
+    server = StatsFeedServer(port=0)
+    started, err = server.start()
+    if not started:
+        print(f"Stats feed did not start: {err}")
+        return
+
+    async def read_event(reader):
+        event = {}
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("stream closed")
+            line = line.decode("utf-8").rstrip("\n")
+            if not line:
+                if "data" in event:
+                    return event.get("event"), json.loads(event["data"])
+                continue
+            field, _, value = line.partition(": ")
+            event[field] = value
+
+    async def run():
+        clients = []
+        for _ in range(args.clients):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            event, _ = await read_event(reader)
+            assert event == "snapshot"
+            clients.append((reader, writer))
+        while server.client_count < args.clients:
+            await asyncio.sleep(0.01)
+
+        samples = []
+        for update in range(1, args.updates + 1):
+            start = time.perf_counter()
+            server.publish({"stats": {"deaths": update, "seconds_played": update * 60}, "last_kill": None})
+            deltas = await asyncio.gather(*(read_event(reader) for reader, _ in clients))
+            samples.append(time.perf_counter() - start)
+            assert all(data["seq"] == update for _, data in deltas)
+        for _, writer in clients:
+            writer.close()
+        return samples
+
+    samples = asyncio.run(run())
+    _report(f"{args.clients} SSE clients, all received delta", samples)
+
+    def fetch_snapshot():
+        async def get():
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /stats HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+            return json.loads(response.split(b"\r\n\r\n", 1)[1])
+        return asyncio.run(get()), None
+
+    snapshot, _ = fetch_snapshot()
+    print(f"/stats snapshot: seq {snapshot['seq']}, stats {snapshot['stats']}")
+    _report("GET /stats", _time_calls(fetch_snapshot, args.updates))
+    server.stop()
+    print(f"Published {server.deltas_published} deltas, dropped {server.clients_dropped} clients.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="The Tarnished's Chronicle benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    tick = subparsers.add_parser("tick-latency", help="Compare per-tick extractor latency")
+    tick.add_argument("save_file_path")
+    tick.add_argument("--slot-index", type=int, default=0)
+    tick.add_argument("--iterations", type=int, default=50)
+    tick.set_defaults(func=bench_tick_latency)
+
+    reader = subparsers.add_parser("save-reader", help="Compare the Python SaveReader with the Rust CLI")
+    reader.add_argument("save_file_path", nargs="?")
+    reader.add_argument("--slot-index", type=int, default=0)
+    reader.add_argument("--iterations", type=int, default=50)
+    reader.add_argument("--synthetic", action="store_true", help="Measure against a generated save file")
+    reader.add_argument("--synthetic-ids", type=int, default=2000)
+    reader.set_defaults(func=bench_save_reader)
+
+    delta = subparsers.add_parser("delta", help="Compare JSON diffing with the structural delta")
+    delta.add_argument("--event-ids", type=int, default=2000)
+    delta.add_argument("--iterations", type=int, default=200)
+    delta.set_defaults(func=bench_delta)
+
+    boss_index = subparsers.add_parser("boss-index", help="Filter switching and kill attribution on large definition sets")
+    boss_index.add_argument("--bosses", type=int, default=50000)
+    boss_index.add_argument("--iterations", type=int, default=200)
+    boss_index.set_defaults(func=bench_boss_index)
+
+    definitions = subparsers.add_parser("definitions-load", help="Boss definition load from JSON vs. the compiled cache")
+    definitions.add_argument("--bosses", type=int, default=5000)
+    definitions.add_argument("--iterations", type=int, default=20)
+    definitions.set_defaults(func=bench_definitions_load)
+
+    search = subparsers.add_parser("search", help="Boss search keystroke cost by definition set size")
+    search.add_argument("--bosses", type=int, nargs="+", default=[1000, 10000, 50000])
+    search.add_argument("--iterations", type=int, default=20)
+    search.set_defaults(func=bench_search)
+
+    tree = subparsers.add_parser("boss-tree", help="Boss tree update cost by changed rows and total bosses")
+    tree.add_argument("--bosses", type=int, nargs="+", default=[1000, 10000, 50000])
+    tree.add_argument("--changed", type=int, nargs="+", default=[1, 10, 100])
+    tree.add_argument("--iterations", type=int, default=50)
+    tree.set_defaults(func=bench_boss_tree)
+
+    multi = subparsers.add_parser("multi-slot", help="Multi-slot status reads and monitor ticks")
+    multi.add_argument("--slots", type=int, default=10)
+    multi.add_argument("--synthetic-ids", type=int, default=2000)
+    multi.add_argument("--iterations", type=int, default=20)
+    multi.set_defaults(func=bench_multi_slot)
+
+    feed = subparsers.add_parser("stats-feed", help="Stats feed fan-out to local SSE clients")
+    feed.add_argument("--clients", type=int, default=50)
+    feed.add_argument("--updates", type=int, default=100)
+    feed.set_defaults(func=bench_stats_feed)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,43 @@
 # src/boss_data_manager.py
 import os
 import json
-import copy
+import pickle
+from types import MappingProxyType
+from .boss_search_index import BossSearchIndex
+from .boss_status_store import BossIndex, BossStatusStore
+
+# Bump when the cache layout (or what BossIndex derives from the JSON) changes.
+DEFINITIONS_CACHE_VERSION = 1
+FILTER_MODES = ("base", "dlc", "all")
 
 class BossDataManager:
-    def __init__(self, base_filename="boss_ids_reference.json", dlc_filename="boss_ids_reference_DLC.json"):
+    def __init__(self, base_filename="boss_ids_reference.json", dlc_filename="boss_ids_reference_DLC.json",
+                 cache_filename="boss_definitions.cache"):
         self.base_filename = base_filename
         self.dlc_filename = dlc_filename
+        # Compiled definitions next to the JSON (None = always parse the JSON)
+        self.cache_filename = cache_filename
         
         # Interní úložiště pro nesloučená data
+        # (location -> tuple of read-only boss records, shared by every filter view)
         self._base_data = {}
         self._dlc_data = {}
+        # filter mode -> BossIndex, built on first use
+        self._filter_views = {}
+        # filter mode -> parsed event ID layout from the definitions cache
+        self._cached_event_layouts = {}
+        # filter mode -> BossSearchIndex, built on first use
+        self._search_indexes = {}
+        self.content_filter_mode = None
         
         # Veřejná data, se kterými pracuje zbytek aplikace
-        self.boss_data_by_location = {}
+        self.boss_data_by_location = MappingProxyType({})
         self.all_event_ids_to_monitor = []
+        # Per-character defeated state over the current filter view
+        self.boss_index = BossIndex({})
+        self.status_store = BossStatusStore(self.boss_index)
+        # str(event ID) -> (location, boss record) for the current filter, read-only
+        self.event_id_index = self.boss_index.event_id_lookup
         
 
     def _get_reference_data_path(self, filename):
@@ -43,60 +66,152 @@ class BossDataManager:
             print(f"ERROR loading '{filename}': {e}")
             return {}
 
+    @staticmethod
+    def _freeze_definitions(data):
+        """Turns loaded JSON into location -> tuple of read-only boss records."""
+        frozen = {}
+        for location, bosses in data.items():
+            if not isinstance(bosses, list):
+                continue
+            frozen[location] = tuple(MappingProxyType(boss) for boss in bosses if isinstance(boss, dict))
+        return frozen
+
+    def _set_definitions(self, base_data, dlc_data):
+        self._base_data = self._freeze_definitions(base_data)
+        self._dlc_data = self._freeze_definitions(dlc_data)
+        self._filter_views = {}
+        self._cached_event_layouts = {}
+        self._search_indexes = {}
+
     def load_definitions(self):
-        """Loads base and DLC definitions into internal storage."""
-        print("Loading base game boss definitions...")
-        self._base_data = self._load_json_file(self.base_filename)
-        
-        print("Loading DLC boss definitions...")
-        self._dlc_data = self._load_json_file(self.dlc_filename)
-        
+        """
+        Loads base and DLC definitions into internal storage.
+        Uses the compiled cache while it matches the JSON files (size + mtime);
+        otherwise parses the JSON and rewrites the cache.
+        """
+        sources = [self._source_signature(self.base_filename), self._source_signature(self.dlc_filename)]
+        if self._load_definitions_cache(sources):
+            print("Boss definitions loaded from cache.")
+        else:
+            print("Loading base game boss definitions...")
+            base_data = self._load_json_file(self.base_filename)
+
+            print("Loading DLC boss definitions...")
+            dlc_data = self._load_json_file(self.dlc_filename)
+            self._set_definitions(base_data, dlc_data)
+            self._write_definitions_cache(sources)
+
         # This will be set properly by the GUI on startup
-        self.boss_data_by_location = {}
-        
+        self.boss_data_by_location = MappingProxyType({})
+
         return True, "Definitions loaded."
 
+    def _source_signature(self, filename):
+        """(file name, size, mtime) of a JSON source, or None if it doesn't exist."""
+        filepath = self._get_reference_data_path(filename)
+        try:
+            st = os.stat(filepath)
+        except (OSError, TypeError):
+            return None
+        return (filename, st.st_size, st.st_mtime_ns)
+
+    def _load_definitions_cache(self, sources):
+        """Restores definitions and filter views from the cache. Returns False if it is missing or stale."""
+        if not self.cache_filename:
+            return False
+        cache_path = self._get_reference_data_path(self.cache_filename)
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable definitions cache '{cache_path}': {e}")
+            return False
+        if not isinstance(cache, dict) or cache.get("version") != DEFINITIONS_CACHE_VERSION \
+                or cache.get("sources") != sources:
+            return False
+
+        # Records were validated when the cache was written.
+        self._base_data = {location: tuple(map(MappingProxyType, bosses)) for location, bosses in cache["base"].items()}
+        self._dlc_data = {location: tuple(map(MappingProxyType, bosses)) for location, bosses in cache["dlc"].items()}
+        self._filter_views = {}
+        self._cached_event_layouts = cache["event_layouts"]
+        self._search_indexes = {}
+        return True
+
+    def _write_definitions_cache(self, sources):
+        if not self.cache_filename or not any(sources):
+            return
+        # Build every filter view now, so their parsed event IDs can be stored (and reused right away).
+        for filter_mode in FILTER_MODES:
+            if filter_mode not in self._filter_views:
+                self._filter_views[filter_mode] = self._build_filter_view(filter_mode)
+        cache = {
+            "version": DEFINITIONS_CACHE_VERSION,
+            "sources": sources,
+            "base": {location: [dict(boss) for boss in bosses] for location, bosses in self._base_data.items()},
+            "dlc": {location: [dict(boss) for boss in bosses] for location, bosses in self._dlc_data.items()},
+            "event_layouts": {filter_mode: view.event_layout() for filter_mode, view in self._filter_views.items()},
+        }
+        cache_path = self._get_reference_data_path(self.cache_filename)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # e.g. a read-only install folder; the JSON is simply parsed again next time.
+            print(f"Warning: Could not write definitions cache '{cache_path}': {e}")
+
+    def _build_filter_view(self, filter_mode, event_layout=None):
+        if filter_mode == "all":
+            merged = dict(self._base_data)
+            for location, dlc_bosses in self._dlc_data.items():
+                merged[location] = merged.get(location, ()) + dlc_bosses
+            return BossIndex(merged, event_layout)
+        if filter_mode == "dlc":
+            return BossIndex(self._dlc_data, event_layout)
+        return BossIndex(self._base_data, event_layout)
+
     def set_content_filter(self, filter_mode: str):
         """
-        Builds the final boss data based on the selected filter mode ('all', 'base', 'dlc').
-        This replaces the old set_dlc_inclusion method.
+        Selects the boss data for the filter mode ('all', 'base', 'dlc').
+        Views share the loaded records and are cached, so only the per-character
+        defeated state is rebuilt here.
         """
         print(f"Setting content filter to: {filter_mode}")
-        final_data = {}
+        if filter_mode not in ("all", "dlc"):
+            filter_mode = "base"  # Default to "base"
+        view = self._filter_views.get(filter_mode)
+        if view is None:
+            view = self._filter_views[filter_mode] = self._build_filter_view(
+                filter_mode, self._cached_event_layouts.get(filter_mode))
 
-        if filter_mode == "all":
-            final_data = copy.deepcopy(self._base_data)
-            if self._dlc_data:
-                for location, dlc_bosses in self._dlc_data.items():
-                    if location in final_data:
-                        final_data[location].extend(dlc_bosses)
-                    else:
-                        final_data[location] = dlc_bosses
-        elif filter_mode == "dlc":
-            final_data = copy.deepcopy(self._dlc_data)
-        else: # Default to "base"
-            final_data = copy.deepcopy(self._base_data)
-        
-        self.boss_data_by_location = final_data
-        self._recalculate_event_ids()
+        self.content_filter_mode = filter_mode
+        self.boss_index = view
+        self.boss_data_by_location = view.records_by_location
+        self.all_event_ids_to_monitor = view.event_ids
+        self.event_id_index = view.event_id_lookup
+        self.status_store = BossStatusStore(view)
         print(f"Data source updated. Total event IDs: {len(self.all_event_ids_to_monitor)}")
 
-    def _recalculate_event_ids(self):
-        """Přepočítá všechny event ID na základě aktuálního `boss_data_by_location`."""
-        all_ids = set()
-        for bosses_in_location in self.boss_data_by_location.values():
-            if isinstance(bosses_in_location, list):
-                for boss_info in bosses_in_location:
-                    if isinstance(boss_info, dict):
-                        event_id_value = boss_info.get("event_id")
-                        if event_id_value is not None:
-                            ids_to_add = event_id_value if isinstance(event_id_value, list) else [event_id_value]
-                            for eid in ids_to_add:
-                                try:
-                                    all_ids.add(int(str(eid)))
-                                except ValueError:
-                                    print(f"Warning: Invalid event_id '{eid}' for '{boss_info.get('name')}'")
-        self.all_event_ids_to_monitor = list(all_ids)
+    def get_boss_by_event_id(self, event_id):
+        """Returns (location, boss record) for an event ID, or None if it isn't monitored."""
+        entry = self.event_id_index.get(str(event_id))
+        if entry is None:
+            try:
+                entry = self.event_id_index.get(str(int(str(event_id))))
+            except ValueError:
+                return None
+        return entry
+
+    def get_search_index(self):
+        """Search index over the locations, bosses and aliases of the current filter (shared per filter)."""
+        index = self._search_indexes.get(self.content_filter_mode)
+        if index is None:
+            index = self._search_indexes[self.content_filter_mode] = BossSearchIndex(self.boss_index)
+        return index
 
     def get_boss_data_by_location(self):
         return self.boss_data_by_location
@@ -110,34 +225,43 @@ class BossDataManager:
             return self._dlc_data.keys()
         return []
 
-    def update_boss_statuses(self, statuses_dict):
-        # Tato metoda zůstává beze změny, pracuje s aktuálními daty
-        if not self.boss_data_by_location:
-            return False
-        for bosses_in_location in self.boss_data_by_location.values():
-            if isinstance(bosses_in_location, list):
-                for boss_info in bosses_in_location:
-                    if not isinstance(boss_info, dict): continue
-                    event_id_value = boss_info.get("event_id")
-                    if event_id_value is None: continue
-                    ids_for_this_boss = [str(eid) for eid in event_id_value] if isinstance(event_id_value, list) else [str(event_id_value)]
-                    boss_info["is_defeated"] = any(statuses_dict.get(eid_str) for eid_str in ids_for_this_boss)
-        return True
+    def update_boss_statuses(self, statuses_dict, delta=None):
+        """
+        Updates defeated states. With a non-initial StatusDelta only the changed
+        flags are touched; otherwise the whole payload is applied.
+        Returns the indexes (into status_store.bosses) of bosses whose state changed.
+        """
+        store = self.status_store
+        if delta is not None and not delta.is_initial:
+            return store.apply_flag_changes(delta.flags_set, delta.flags_cleared)
+        return store.apply_statuses(statuses_dict)
+
+    def reset_statuses(self):
+        """Starts a fresh per-character state over the current filter view (e.g. on character change)."""
+        self.status_store = BossStatusStore(self.boss_index)
+
+    def split_changed_bosses(self, boss_indexes):
+        """Splits changed boss indexes into (newly defeated, no longer defeated) boss records."""
+        store = self.status_store
+        defeated, cleared = [], []
+        for boss_index in boss_indexes:
+            (defeated if store.defeated[boss_index] else cleared).append(store.bosses[boss_index])
+        return defeated, cleared
+
+    def iter_location_bosses(self, location_name):
+        """Yields (boss record, is_defeated) for one location of the current filter."""
+        store = self.status_store
+        for boss_index in self.boss_index.location_bosses.get(location_name, ()):
+            yield store.bosses[boss_index], bool(store.defeated[boss_index])
 
     def get_boss_counts(self):
-        # Tato metoda zůstává beze změny
-        defeated = 0
-        total = 0
-        if not self.boss_data_by_location:
-            return defeated, total
-        for bosses_in_location in self.boss_data_by_location.values():
-            if isinstance(bosses_in_location, list):
-                for boss in bosses_in_location:
-                    if isinstance(boss, dict):
-                        total += 1
-                        if boss.get("is_defeated", False):
-                            defeated += 1
-        return defeated, total
+        """Returns (defeated, total) for the current filter."""
+        return self.status_store.defeated_count, self.status_store.total
+
+    def get_location_counts(self, location_name):
+        """Returns (defeated, total) for one location."""
+        store = self.status_store
+        return store.location_defeated.get(location_name, 0), store.location_total.get(location_name, 0)
 
     def get_defeated_bosses_for_character(self, character_name: str):
         """
@@ -145,13 +269,5 @@ class BossDataManager:
         This does not depend on the character, but on the loaded data,
         which is updated per character.
         """
-        defeated_bosses = []
-        if not self.boss_data_by_location:
-            return defeated_bosses
-        
-        for bosses_in_location in self.boss_data_by_location.values():
-            if isinstance(bosses_in_location, list):
-                for boss in bosses_in_location:
-                    if isinstance(boss, dict) and boss.get("is_defeated", False):
-                        defeated_bosses.append(boss)
-        return defeated_bosses
\ No newline at end of file
+        store = self.status_store
+        return [store.bosses[boss_index] for boss_index in sorted(store.defeated_indexes)]
@@ -0,0 +1,204 @@
+# src/boss_search_index.py
+from collections import Counter
+
+# Substrings (and word prefixes) up to this length are indexed; longer terms are looked up by their trigrams.
+GRAM_SIZE = 3
+# Share of the term's trigrams a text needs for a fuzzy match (typos like "margot" -> "margit")
+FUZZY_MIN_SIMILARITY = 0.5
+
+# Match scores; fuzzy matches score their trigram similarity, which stays below SCORE_SUBSTRING.
+SCORE_EXACT, SCORE_WORD_PREFIX, SCORE_SUBSTRING = 3, 2, 1
+
+
+def _grams(text, max_size=GRAM_SIZE):
+    """Every substring of text up to max_size characters."""
+    grams = set()
+    for size in range(1, max_size + 1):
+        for start in range(len(text) - size + 1):
+            grams.add(text[start:start + size])
+    return grams
+
+
+def _word_prefixes(text, max_size=GRAM_SIZE):
+    """Prefixes up to max_size characters of every word of text (they may run into the next word)."""
+    starts = [0] + [i + 1 for i, char in enumerate(text) if char == " "]
+    return {text[start:start + size] for start in starts for size in range(1, max_size + 1) if start + size <= len(text)}
+
+
+def _trigrams(text):
+    return {text[start:start + GRAM_SIZE] for start in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _add_posting(table, key, text_id):
+    text_ids = table.get(key)
+    if text_ids is None:
+        table[key] = {text_id}
+    else:
+        text_ids.add(text_id)
+
+
+class SearchResult:
+    """
+    Texts matching one term. Filtering only needs `locations`; the ranking is
+    worked out when `ranked` or best_location() is first used, so a broad
+    term (one or two letters) doesn't pay for scoring every match.
+    """
+
+    def __init__(self, index, term, text_ids, fuzzy=False, fuzzy_scores=None):
+        self._index = index
+        self.term = term
+        self.text_ids = text_ids
+        self.fuzzy = fuzzy
+        self._fuzzy_scores = fuzzy_scores   # text id -> similarity, for fuzzy results
+        self._locations = None
+        self._ranked = None
+
+    @property
+    def locations(self):
+        """Names of the matching locations."""
+        if self._locations is None:
+            self._locations = self._index._locations_of(self.text_ids)
+        return self._locations
+
+    @property
+    def ranked(self):
+        """[(location, score), ...], best first; ties keep the definition order."""
+        if self._ranked is None:
+            if self.fuzzy:
+                scored = self._fuzzy_scores.items()
+            else:
+                scored = ((text_id, self._index._match_score(self.term, text_id)) for text_id in self.text_ids)
+            self._ranked = self._index._rank(scored)
+        return self._ranked
+
+    def best_location(self):
+        """The top ranked location, or None."""
+        if not self.text_ids:
+            return None
+        if self.fuzzy or self._ranked is not None:
+            return self.ranked[0][0]
+        return self._index._best_substring_location(self.term, self.text_ids)
+
+
+class BossSearchIndex:
+    """
+    Search over the locations of one content filter (a BossIndex): a location
+    matches when the term is in its name, one of its boss names or a boss alias
+    ("aliases" in the boss record, a string or a list).
+
+    The lowercased texts are indexed by every substring up to GRAM_SIZE
+    characters, so a short term is one lookup and a longer one only verifies
+    the texts sharing its rarest trigram, or the previous result when the user
+    kept typing and that is smaller. When nothing contains the term, texts
+    sharing most of its trigrams are returned as fuzzy matches. The tables are
+    built on the first search.
+    """
+
+    def __init__(self, boss_index):
+        self._boss_index = boss_index
+        self._texts = []           # text id -> lowercased text, in definition order
+        self._text_locations = []  # text id -> location order (position in location_bosses)
+        self._locations = []       # location order -> location name
+        self._grams = None         # substring -> set of text ids
+        self._prefixes = None      # word prefix -> set of text ids
+        self._exact = None         # text -> set of text ids
+
+    def _add_text(self, text, location_order):
+        text = str(text).lower().strip()
+        if text:
+            self._texts.append(text)
+            self._text_locations.append(location_order)
+
+    def _build(self):
+        bosses = self._boss_index.bosses
+        for location_order, (location, boss_indexes) in enumerate(self._boss_index.location_bosses.items()):
+            self._locations.append(location)
+            self._add_text(location, location_order)
+            for boss_index in boss_indexes:
+                boss_info = bosses[boss_index]
+                self._add_text(boss_info.get("name", ""), location_order)
+                aliases = boss_info.get("aliases") or ()
+                for alias in [aliases] if isinstance(aliases, str) else aliases:
+                    self._add_text(alias, location_order)
+
+        self._grams, self._prefixes, self._exact = {}, {}, {}
+        for text_id, text in enumerate(self._texts):
+            for gram in _grams(text):
+                _add_posting(self._grams, gram, text_id)
+            for prefix in _word_prefixes(text):
+                _add_posting(self._prefixes, prefix, text_id)
+            _add_posting(self._exact, text, text_id)
+
+    def search(self, term, previous=None):
+        """
+        Returns a SearchResult for a lowercased, stripped term. `previous` is the
+        result for an earlier term; if the new term contains it, the search
+        narrows it instead of checking more candidates.
+        """
+        if self._grams is None:
+            self._build()
+        if not term:
+            return SearchResult(self, term, set())
+
+        texts = self._texts
+        if len(term) <= GRAM_SIZE:
+            text_ids = self._grams.get(term, set())
+        else:
+            # Verify the smaller candidate set: the previous result or the texts with the rarest trigram.
+            postings = [self._grams.get(gram) for gram in _trigrams(term)]
+            candidates = min(postings, key=len) if all(postings) else set()
+            if previous is not None and not previous.fuzzy and previous.term and previous.term in term \
+                    and len(previous.text_ids) < len(candidates):
+                candidates = previous.text_ids
+            text_ids = {text_id for text_id in candidates if term in texts[text_id]}
+
+        if text_ids:
+            return SearchResult(self, term, text_ids)
+        return self._fuzzy_search(term)
+
+    def _fuzzy_search(self, term):
+        term_grams = _trigrams(term)
+        if not term_grams:
+            return SearchResult(self, term, set(), fuzzy=True, fuzzy_scores={})
+        hits = Counter()
+        for gram in term_grams:
+            hits.update(self._grams.get(gram, ()))
+        needed = FUZZY_MIN_SIMILARITY * len(term_grams)
+        scores = {text_id: count / len(term_grams) for text_id, count in hits.items() if count >= needed}
+        return SearchResult(self, term, set(scores), fuzzy=True, fuzzy_scores=scores)
+
+    # --- used by SearchResult ---
+
+    def _locations_of(self, text_ids):
+        text_locations, locations = self._text_locations, self._locations
+        return {locations[location_order] for location_order in {text_locations[text_id] for text_id in text_ids}}
+
+    def _match_score(self, term, text_id):
+        text = self._texts[text_id]
+        if text == term:
+            return SCORE_EXACT
+        if text.startswith(term) or f" {term}" in text:
+            return SCORE_WORD_PREFIX
+        return SCORE_SUBSTRING
+
+    def _best_substring_location(self, term, text_ids):
+        """Best location of a substring result from the exact / word prefix tables, without scoring every match."""
+        exact = self._exact.get(term)
+        if exact:
+            best = exact
+        else:
+            prefixed = self._prefixes.get(term[:GRAM_SIZE], ())
+            if len(term) > GRAM_SIZE:
+                prefixed = [text_id for text_id in prefixed
+                            if text_id in text_ids and self._match_score(term, text_id) == SCORE_WORD_PREFIX]
+            best = prefixed or text_ids
+        return self._locations[self._text_locations[min(best)]]
+
+    def _rank(self, scored_texts):
+        best = {}   # location order -> best score
+        for text_id, score in scored_texts:
+            location_order = self._text_locations[text_id]
+            if score > best.get(location_order, 0):
+                best[location_order] = score
+        ordered = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+        return [(self._locations[location_order], score) for location_order, score in ordered]
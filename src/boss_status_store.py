@@ -0,0 +1,155 @@
+# src/boss_status_store.py
+from array import array
+from types import MappingProxyType
+
+
+class BossIndex:
+    """
+    Read-only layout of one content filter, built once and shared.
+
+    Bosses and event IDs get dense indexes in definition order. The boss records
+    themselves are the shared definition records; nothing here is per-character.
+    """
+
+    def __init__(self, records_by_location, event_layout=None):
+        """
+        `event_layout` is a trusted layout from event_layout() over the same
+        records (the definitions cache); the event IDs are then not parsed again.
+        """
+        self.bosses = []              # boss index -> boss record
+        self.boss_locations = []      # boss index -> location name
+        self.event_index = {}         # str(event ID) -> event index
+        self.event_to_bosses = []     # event index -> [boss index, ...]
+        self.location_total = {}
+        location_bosses = {}
+
+        for location, bosses in records_by_location.items():
+            self.location_total[location] = len(bosses)
+            indexes = location_bosses[location] = []
+            for boss_info in bosses:
+                indexes.append(len(self.bosses))
+                self.bosses.append(boss_info)
+                self.boss_locations.append(location)
+
+        if event_layout is not None:
+            self._restore_event_layout(event_layout)
+        else:
+            self._index_event_ids()
+
+        self.total = len(self.bosses)
+        self.records_by_location = MappingProxyType(
+            {location: tuple(bosses) for location, bosses in records_by_location.items()})
+        self.location_bosses = MappingProxyType(
+            {location: tuple(indexes) for location, indexes in location_bosses.items()})
+        self.event_ids = [int(key) for key in self.event_index]
+        # str(event ID) -> (location, boss record) of the first boss using it
+        self.event_id_lookup = MappingProxyType({
+            key: (self.boss_locations[self.event_to_bosses[event_index][0]],
+                  self.bosses[self.event_to_bosses[event_index][0]])
+            for key, event_index in self.event_index.items()
+        })
+
+    def _index_event_ids(self):
+        for boss_index, boss_info in enumerate(self.bosses):
+            event_id_value = boss_info.get("event_id")
+            if event_id_value is None:
+                continue
+            ids = event_id_value if isinstance(event_id_value, list) else [event_id_value]
+            for eid in ids:
+                try:
+                    key = str(int(str(eid)))
+                except ValueError:
+                    print(f"Warning: Invalid event_id '{eid}' for '{boss_info.get('name')}'")
+                    continue
+                event_index = self.event_index.get(key)
+                if event_index is None:
+                    event_index = len(self.event_to_bosses)
+                    self.event_index[key] = event_index
+                    self.event_to_bosses.append([])
+                self.event_to_bosses[event_index].append(boss_index)
+
+    def event_layout(self):
+        """
+        The parsed event IDs as compact data for the definitions cache:
+        (event keys in event index order, boss indexes of all events back to
+        back, offset of each event's first boss index).
+        """
+        boss_indexes = array('i')
+        offsets = array('i')
+        for event_bosses in self.event_to_bosses:
+            offsets.append(len(boss_indexes))
+            boss_indexes.extend(event_bosses)
+        offsets.append(len(boss_indexes))
+        return list(self.event_index), boss_indexes, offsets
+
+    def _restore_event_layout(self, event_layout):
+        keys, boss_indexes, offsets = event_layout
+        self.event_index = dict(zip(keys, range(len(keys))))
+        self.event_to_bosses = [boss_indexes[offsets[i]:offsets[i + 1]].tolist() for i in range(len(keys))]
+
+
+class BossStatusStore:
+    """
+    Defeated state of one character over a BossIndex.
+
+    Flag and defeated state live in bytearrays and the per-location / total counts
+    are adjusted as flags change, so an update costs O(changed flags) instead of
+    a walk over every boss. A boss counts as defeated when any of its event
+    flags is set.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.bosses = index.bosses
+        self.total = index.total
+        self.location_total = index.location_total
+        self.location_defeated = dict.fromkeys(index.location_total, 0)
+        self.event_flags = bytearray(len(index.event_to_bosses))
+        self.boss_set_flag_counts = [0] * index.total
+        self.defeated = bytearray(index.total)
+        self.defeated_indexes = set()
+
+    @property
+    def defeated_count(self):
+        return len(self.defeated_indexes)
+
+    def _set_flag(self, event_index, is_set, changed_bosses):
+        if self.event_flags[event_index] == is_set:
+            return
+        self.event_flags[event_index] = is_set
+        step = 1 if is_set else -1
+        for boss_index in self.index.event_to_bosses[event_index]:
+            self.boss_set_flag_counts[boss_index] += step
+            now_defeated = 1 if self.boss_set_flag_counts[boss_index] > 0 else 0
+            if now_defeated == self.defeated[boss_index]:
+                continue
+            self.defeated[boss_index] = now_defeated
+            location = self.index.boss_locations[boss_index]
+            if now_defeated:
+                self.defeated_indexes.add(boss_index)
+                self.location_defeated[location] += 1
+            else:
+                self.defeated_indexes.discard(boss_index)
+                self.location_defeated[location] -= 1
+            changed_bosses.append(boss_index)
+
+    def apply_flag_changes(self, flags_set, flags_cleared):
+        """Applies only the changed flags (from a StatusDelta). Returns changed boss indexes."""
+        changed_bosses = []
+        event_index_of = self.index.event_index
+        for eid in flags_set:
+            event_index = event_index_of.get(str(eid))
+            if event_index is not None:
+                self._set_flag(event_index, 1, changed_bosses)
+        for eid in flags_cleared:
+            event_index = event_index_of.get(str(eid))
+            if event_index is not None:
+                self._set_flag(event_index, 0, changed_bosses)
+        return changed_bosses
+
+    def apply_statuses(self, statuses_dict):
+        """Applies a complete boss_statuses payload. Returns changed boss indexes."""
+        changed_bosses = []
+        for key, event_index in self.index.event_index.items():
+            self._set_flag(event_index, 1 if statuses_dict.get(key) else 0, changed_bosses)
+        return changed_bosses
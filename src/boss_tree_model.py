@@ -0,0 +1,331 @@
+# src/boss_tree_model.py
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel, QSize
+from PySide6.QtGui import QColor, QFont, QIcon
+
+from .styles import (
+    LOCATION_TEXT_COLOR, BOSS_NAME_TEXT_COLOR, LOCATION_ITEM_BG_COLOR, BOSS_ITEM_BG_COLOR,
+    PHASE_HEADING_COLORS
+)
+from .utils import create_colored_pixmap, format_seconds_to_hms
+
+ROW_KIND_ROLE = Qt.ItemDataRole.UserRole + 1     # "heading", "location" or "boss"
+ROW_NAME_ROLE = Qt.ItemDataRole.UserRole + 2     # location or boss name
+IS_DEFEATED_ROLE = Qt.ItemDataRole.UserRole + 3
+
+COLUMN_NAME, COLUMN_STATUS, COLUMN_TIMESTAMP = range(3)
+COLUMN_HEADERS = ["Boss / Event", "Status", "Timestamp"]
+
+# (icon path, color, size) of the status column, by defeated state
+STATUS_ICONS = {
+    True: ("assets/icons/check.svg", QColor("#A3BE8C"), QSize(18, 18)),
+    False: ("assets/icons/x.svg", QColor("#BF616A"), QSize(18, 18)),
+}
+
+
+class _TopRow:
+    __slots__ = ("kind", "text", "phase", "boss_indexes")
+
+    def __init__(self, kind, text, phase=None, boss_indexes=()):
+        self.kind = kind
+        self.text = text
+        self.phase = phase
+        self.boss_indexes = boss_indexes
+
+
+class BossTreeModel(QAbstractItemModel):
+    """
+    Locations (with phase headings between them) and their bosses as a two-level tree.
+
+    The rows are laid out once per load(); defeated state is read straight from
+    the BossStatusStore, so a stats update only has to announce the rows that
+    changed (update_bosses / set_timestamp) instead of rebuilding anything.
+
+    Top-level indexes carry internalId 0, boss indexes carry their location's
+    row + 1.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._store = None
+        self._timestamps = {}
+        self._boss_positions = {}    # boss index -> (top row, child row)
+        self._bosses_by_name = {}    # boss name -> [boss index, ...]
+        self._location_icon = None
+
+    # --- LOADING / UPDATES ---
+
+    def load(self, layout, status_store, timestamps):
+        """
+        `layout` is a list of ("heading", text, phase) and ("location", name) entries
+        in display order; `timestamps` maps boss name -> kill time in seconds.
+        """
+        self.beginResetModel()
+        self._store = status_store
+        self._timestamps = dict(timestamps or {})
+        self._rows = []
+        self._boss_positions = {}
+        self._bosses_by_name = {}
+        location_bosses = status_store.index.location_bosses
+        for entry in layout:
+            if entry[0] == "heading":
+                self._rows.append(_TopRow("heading", entry[1], entry[2]))
+                continue
+            top_row = len(self._rows)
+            boss_indexes = location_bosses.get(entry[1], ())
+            self._rows.append(_TopRow("location", entry[1], boss_indexes=boss_indexes))
+            for child_row, boss_index in enumerate(boss_indexes):
+                self._boss_positions[boss_index] = (top_row, child_row)
+                name = status_store.bosses[boss_index].get("name")
+                self._bosses_by_name.setdefault(name, []).append(boss_index)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._store = None
+        self._timestamps = {}
+        self._boss_positions = {}
+        self._bosses_by_name = {}
+        self.endResetModel()
+
+    def update_bosses(self, boss_indexes):
+        """Announces a defeated-state change for the given bosses and their locations."""
+        touched_locations = set()
+        for boss_index in boss_indexes:
+            position = self._boss_positions.get(boss_index)
+            if position is None:
+                continue
+            top_row, child_row = position
+            parent = self.index(top_row, 0)
+            self.dataChanged.emit(self.index(child_row, COLUMN_NAME, parent),
+                                  self.index(child_row, COLUMN_STATUS, parent))
+            touched_locations.add(top_row)
+        for top_row in touched_locations:
+            self.dataChanged.emit(self.index(top_row, COLUMN_NAME), self.index(top_row, COLUMN_STATUS))
+
+    def set_timestamp(self, boss_name, seconds):
+        if self._timestamps.get(boss_name) == seconds:
+            return
+        self._timestamps[boss_name] = seconds
+        for boss_index in self._bosses_by_name.get(boss_name, ()):
+            top_row, child_row = self._boss_positions[boss_index]
+            timestamp_index = self.index(child_row, COLUMN_TIMESTAMP, self.index(top_row, 0))
+            self.dataChanged.emit(timestamp_index, timestamp_index)
+
+    # --- LOOKUPS (also used by BossFilterProxyModel) ---
+
+    def row_kind(self, top_row):
+        return self._rows[top_row].kind
+
+    def location_name(self, top_row):
+        return self._rows[top_row].text
+
+    def is_boss_defeated(self, top_row, child_row):
+        return bool(self._store.defeated[self._rows[top_row].boss_indexes[child_row]])
+
+    # --- QAbstractItemModel ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid():
+            if parent.internalId() != 0 or not 0 <= parent.row() < len(self._rows):
+                return QModelIndex()
+            if not 0 <= row < len(self._rows[parent.row()].boss_indexes):
+                return QModelIndex()
+            return self.createIndex(row, column, parent.row() + 1)
+        if not 0 <= row < len(self._rows):
+            return QModelIndex()
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._rows)
+        if parent.internalId() != 0 or parent.column() != 0:
+            return 0
+        return len(self._rows[parent.row()].boss_indexes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        parent_id = index.internalId()
+        if parent_id == 0:
+            return self._top_row_data(self._rows[index.row()], index.column(), role)
+        boss_index = self._rows[parent_id - 1].boss_indexes[index.row()]
+        return self._boss_data(boss_index, index.column(), role)
+
+    def _top_row_data(self, row, column, role):
+        if role == ROW_KIND_ROLE:
+            return row.kind
+        if role == ROW_NAME_ROLE:
+            return row.text
+        if row.kind == "heading":
+            if column != COLUMN_NAME:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return row.text.upper()
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return PHASE_HEADING_COLORS.get(row.phase, LOCATION_TEXT_COLOR)
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+            return None
+
+        total = len(row.boss_indexes)
+        defeated = self._store.location_defeated.get(row.text, 0)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return LOCATION_ITEM_BG_COLOR
+        if column == COLUMN_NAME:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"{row.text} ({defeated}/{total})"
+            if role == Qt.ItemDataRole.DecorationRole:
+                if self._location_icon is None:
+                    self._location_icon = QIcon("assets/icons/map.svg")
+                return self._location_icon
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return LOCATION_TEXT_COLOR
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+        elif column == COLUMN_STATUS and role == Qt.ItemDataRole.CheckStateRole:
+            is_complete = total > 0 and defeated == total
+            return Qt.CheckState.Checked if is_complete else Qt.CheckState.Unchecked
+        return None
+
+    def _boss_data(self, boss_index, column, role):
+        boss_info = self._store.bosses[boss_index]
+        is_defeated = bool(self._store.defeated[boss_index])
+        if role == ROW_KIND_ROLE:
+            return "boss"
+        if role == ROW_NAME_ROLE:
+            return boss_info.get("name", "")
+        if role == IS_DEFEATED_ROLE:
+            return is_defeated
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return BOSS_ITEM_BG_COLOR
+        if column == COLUMN_NAME:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f" {boss_info.get('name', 'N/A')}"
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return BOSS_NAME_TEXT_COLOR
+        elif column == COLUMN_STATUS:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return create_colored_pixmap(*STATUS_ICONS[is_defeated])
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return "Defeated" if is_defeated else "Active"
+        elif column == COLUMN_TIMESTAMP:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return format_seconds_to_hms(self._timestamps.get(boss_info.get("name")))
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+        return None
+
+
+class BossFilterProxyModel(QSortFilterProxyModel):
+    """
+    Applies the 'Hide Defeated Bosses' and search filters to a BossTreeModel.
+    A location is shown while any of its bosses is; headings always stay.
+    Search terms are looked up in the BossSearchIndex set by set_search_index().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setRecursiveFilteringEnabled(True)
+        self.setDynamicSortFilter(True)
+        self.hide_defeated = False
+        self.search_term = ""
+        self.search_index = None     # BossSearchIndex of the source model's filter
+        self.search_result = None    # SearchResult for search_term, kept to narrow the next one
+        self._matching_rows = None   # top rows matching search_term, None = no search
+        self._location_rows = {}     # location name -> top row
+
+    def set_hide_defeated(self, hide_defeated: bool):
+        if hide_defeated == self.hide_defeated:
+            return
+        self.hide_defeated = hide_defeated
+        self.invalidateFilter()
+
+    def set_search_index(self, search_index):
+        """Set before the source model is (re)loaded; the matches are recomputed on its reset."""
+        if search_index is not self.search_index:
+            self.search_index = search_index
+            self.search_result = None
+
+    def set_search_term(self, text: str):
+        search_term = text.lower().strip()
+        if search_term == self.search_term:
+            return
+        self.search_term = search_term
+        self._update_matching_rows()
+        self.invalidateFilter()
+
+    def _update_matching_rows(self):
+        if not self.search_term or self.sourceModel() is None:
+            self._matching_rows = None
+            self.search_result = None
+            return
+        if self.search_index is None:
+            self._matching_rows = set()
+            self.search_result = None
+            return
+        self.search_result = self.search_index.search(self.search_term, self.search_result)
+        self._matching_rows = {
+            self._location_rows[location]
+            for location in self.search_result.locations if location in self._location_rows
+        }
+
+    def best_match_index(self):
+        """Proxy index of the best ranked location if it is shown, or an invalid index."""
+        if self.search_result is None:
+            return QModelIndex()
+        top_row = self._location_rows.get(self.search_result.best_location())
+        if top_row is None:
+            return QModelIndex()
+        return self.mapFromSource(self.sourceModel().index(top_row, 0))
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelReset.connect(self._on_source_reset)
+        self._on_source_reset()
+
+    def _on_source_reset(self):
+        model = self.sourceModel()
+        self._location_rows = {
+            model.location_name(top_row): top_row
+            for top_row in range(model.rowCount()) if model.row_kind(top_row) == "location"
+        }
+        if self.search_term:
+            self.search_result = None
+            self._update_matching_rows()
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if not source_parent.isValid():
+            # Locations are shown through their bosses (recursive filtering).
+            return model.row_kind(source_row) == "heading"
+        top_row = source_parent.row()
+        if self._matching_rows is not None and top_row not in self._matching_rows:
+            return False
+        if self.hide_defeated and model.is_boss_defeated(top_row, source_row):
+            return False
+        return True
@@ -0,0 +1,32 @@
+# src/file_utils.py
+import os
+import tempfile
+
+
+def atomic_write_text(path, text, fsync=True):
+    """
+    Writes `text` to a temporary file next to `path` and renames it over `path`,
+    so readers see either the old or the new content, never a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def get_app_data_path(filename):
+    """Path of a file in the per-user data folder (~/.TheTarnishedChronicle), created on demand."""
+    app_data_dir = os.path.join(os.path.expanduser("~"), ".TheTarnishedChronicle")
+    os.makedirs(app_data_dir, exist_ok=True)
+    return os.path.join(app_data_dir, filename)
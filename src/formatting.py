@@ -0,0 +1,12 @@
+# src/formatting.py
+# Text helpers without Qt imports (used by the GUI and the headless service).
+
+
+def format_seconds_to_hms(seconds: int) -> str:
+    """Formats a duration in seconds to a HH:MM:SS string."""
+    if not isinstance(seconds, (int, float)) or seconds < 0:
+        return "--:--"
+    
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
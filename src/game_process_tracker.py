@@ -0,0 +1,77 @@
+# src/game_process_tracker.py
+import time
+import psutil
+
+from .app_config import (
+    GAME_PROCESS_NAME,
+    GAME_PROCESS_SCAN_MIN_INTERVAL_SEC,
+    GAME_PROCESS_SCAN_MAX_INTERVAL_SEC
+)
+
+
+class GameProcessTracker:
+    """
+    Tracks the game process without walking the whole process list on every tick.
+
+    Once the game is found its psutil.Process is kept and later checks only test
+    that PID (psutil also compares the creation time, so a reused PID is not
+    mistaken for the game). While the game isn't running, full scans back off
+    from `min_scan_interval_sec` up to `max_scan_interval_sec`.
+    """
+
+    def __init__(self, process_name=GAME_PROCESS_NAME,
+                 min_scan_interval_sec=GAME_PROCESS_SCAN_MIN_INTERVAL_SEC,
+                 max_scan_interval_sec=GAME_PROCESS_SCAN_MAX_INTERVAL_SEC,
+                 clock=time.monotonic):
+        self.process_name = process_name.lower()
+        self.min_scan_interval_sec = min_scan_interval_sec
+        self.max_scan_interval_sec = max_scan_interval_sec
+        self._clock = clock
+
+        self._process = None
+        self._scan_interval_sec = min_scan_interval_sec
+        self._next_scan_at = 0.0
+        self.full_scans = 0
+        self.pid_checks = 0
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process else None
+
+    def reset(self):
+        """Forgets the cached process; the next check does a full scan."""
+        self._process = None
+        self._scan_interval_sec = self.min_scan_interval_sec
+        self._next_scan_at = 0.0
+
+    def _scan(self):
+        self.full_scans += 1
+        for proc in psutil.process_iter(['name']):
+            if (proc.info['name'] or "").lower() == self.process_name:
+                return proc
+        return None
+
+    def is_running(self):
+        if self._process is not None:
+            self.pid_checks += 1
+            try:
+                if self._process.is_running():
+                    return True
+            except psutil.Error:
+                pass
+            # The game just closed; scan again promptly in case it's restarted.
+            self.reset()
+            return False
+
+        now = self._clock()
+        if now < self._next_scan_at:
+            return False
+
+        self._process = self._scan()
+        if self._process is not None:
+            self._scan_interval_sec = self.min_scan_interval_sec
+            return True
+
+        self._next_scan_at = now + self._scan_interval_sec
+        self._scan_interval_sec = min(self._scan_interval_sec * 2, self.max_scan_interval_sec)
+        return False
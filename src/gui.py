@@ -1,12 +1,14 @@
 # src/gui.py
+from .startup_profiler import startup_profiler  # first, so the import phase covers everything below
 import sys
 import os
 import time
+import argparse
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFileDialog, QLineEdit, QCheckBox, QFrame, QMessageBox
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QFileDialog, QLineEdit, QCheckBox, QFrame, QMessageBox, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QTimer, QSettings
+from PySide6.QtCore import QTimer, QSettings
 from PySide6.QtGui import QIcon
 
 from .styles import apply_app_styles
@@ -14,20 +16,32 @@ from .overlay_window import OverlayWindow
 from .overlay_manager import OverlayManager
 from .ui_components import (
     create_file_slot_layout, create_main_boss_area,
-    create_overlay_settings_panel_layout, LocationSectionWidget, FooterWidget,
-    create_obs_panel_layout, AchievementsSectionWidget
+    create_overlay_settings_panel_layout, FooterWidget,
+    create_obs_panel_layout, AchievementsSectionWidget, ICON_PIXMAPS
 )
 from .app_config import (
     RUST_CLI_TOOL_PATH_PLACEHOLDER,
+    SAVE_READER_BACKEND,
     DEFAULT_BOSS_REFERENCE_FILENAME,
     DLC_BOSS_REFERENCE_FILENAME,
     LOCATION_PROGRESSION_ORDER,
-    GAME_PHASE_HEADINGS
+    GAME_PHASE_HEADINGS,
+    PIXMAP_CACHE_PREWARM,
+    RUN_HISTORY_ENABLED,
+    RUN_HISTORY_DB_FILENAME,
+    STATS_FEED_ENABLED,
+    STARTUP_PROFILE_TIMEOUT_MS,
+    SEARCH_DEBOUNCE_MS
 )
-from .rust_cli_handler import RustCliHandler
+from .save_reader import create_save_backend
+from .boss_tree_model import BossTreeModel, BossFilterProxyModel, ROW_KIND_ROLE, ROW_NAME_ROLE, STATUS_ICONS
+from .utils import prewarm_pixmap_cache, get_pixmap_cache_stats
 from .boss_data_manager import BossDataManager
 from .save_monitor_logic import SaveMonitorLogic
+from .run_history_store import RunHistoryStore
+from .file_utils import get_app_data_path
 from .obs_manager import ObsManager
+from .stats_feed_server import StatsFeedServer
 from .timestamp_manager import TimestampManager
 from .achievement_manager import AchievementManager
 
@@ -39,24 +53,19 @@ class BossChecklistApp(QWidget):
 
         self.settings = QSettings("TheTarnishedChronicle", "App")
         
-        # UPRAVENO: Inicializujeme manažer s oběma soubory
-        self.boss_data_manager = BossDataManager(
-            base_filename=DEFAULT_BOSS_REFERENCE_FILENAME,
-            dlc_filename=DLC_BOSS_REFERENCE_FILENAME
-        )
-        self.achievement_manager = AchievementManager("data/achievements.json")
-        self.rust_cli_handler = RustCliHandler(RUST_CLI_TOOL_PATH_PLACEHOLDER)
-        self.save_monitor_logic = SaveMonitorLogic(self.rust_cli_handler, self.boss_data_manager, self)
-        self.last_known_stats = {}
-        self.location_widgets = {}
-        self.timestamp_manager = TimestampManager()
-        self.last_killed_boss_info = None
+        with startup_profiler.phase("backends"):
+            self._init_backends()
 
         # --- NEW TIMER ATTRIBUTES ---
         # This timer will tick every second to update the UI smoothly
         self.ui_timer = QTimer(self)
         self.ui_timer.setInterval(1000) # 1 second interval
 
+        # The search is applied once typing pauses
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
         # These will store the last known play time from the save file
         # and the real-world time we received it.
         self.last_play_time_snapshot = -1
@@ -64,10 +73,83 @@ class BossChecklistApp(QWidget):
         self.is_game_running = False # <--- NEW STATE VARIABLE
         # --- END NEW TIMER ATTRIBUTES ---
 
-        self.init_ui()
-        
-        # Load and apply saved filter settings on startup
-        self.load_and_apply_filters()
+        # Hidden settings panels and their managers are built after the first paint
+        # (_finish_startup), together with the first save read.
+        self.overlay_settings_panel = None
+        self.obs_panel = None
+        self.overlay_manager = None
+        self.obs_manager = None
+        self._startup_finished = False
+
+        with startup_profiler.phase("ui build"):
+            self.init_ui()
+            # Load and apply saved filter settings on startup
+            self.load_and_apply_filters()
+
+        with startup_profiler.phase("definitions load"):
+            self._load_initial_boss_data()
+        with startup_profiler.phase("styles + signals"):
+            apply_app_styles(self)
+            self.connect_signals()
+
+    def _init_backends(self):
+        # UPRAVENO: Inicializujeme manažer s oběma soubory
+        self.boss_data_manager = BossDataManager(
+            base_filename=DEFAULT_BOSS_REFERENCE_FILENAME,
+            dlc_filename=DLC_BOSS_REFERENCE_FILENAME
+        )
+        self.achievement_manager = AchievementManager("data/achievements.json")
+        self.save_backend = create_save_backend(SAVE_READER_BACKEND, RUST_CLI_TOOL_PATH_PLACEHOLDER)
+        self.run_history = RunHistoryStore(get_app_data_path(RUN_HISTORY_DB_FILENAME)) if RUN_HISTORY_ENABLED else None
+        if self.run_history is not None and not self.run_history.is_available():
+            self.run_history = None  # the database could not be opened
+        self.save_monitor_logic = SaveMonitorLogic(self.save_backend, self.boss_data_manager, self, run_history=self.run_history)
+        self.last_known_stats = {}
+        self.stats_feed = None
+        if STATS_FEED_ENABLED:
+            self.stats_feed = StatsFeedServer()
+            started, _ = self.stats_feed.start()
+            if not started:
+                self.stats_feed = None
+        self.boss_tree_model = BossTreeModel(self)
+        self.boss_filter_model = BossFilterProxyModel(self)
+        self.boss_filter_model.setSourceModel(self.boss_tree_model)
+        self.expanded_locations = set()
+        self.timestamp_manager = TimestampManager()
+        self.last_killed_boss_info = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._startup_finished:
+            self._startup_finished = True
+            startup_profiler.mark("first paint")
+            # Runs once this paint has been flushed to the screen.
+            QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self):
+        """Deferred part of startup: hidden panels, then the first save read."""
+        with startup_profiler.phase("hidden panels"):
+            self._ensure_settings_panels()
+        saved_path = self.settings.value("saveFilePath", "")
+        if os.path.exists(saved_path):
+            with startup_profiler.phase("first save read request"):
+                self.on_save_file_path_changed(saved_path)
+        # The profile is reported with the first stats; this covers startups without a character.
+        QTimer.singleShot(STARTUP_PROFILE_TIMEOUT_MS, startup_profiler.finish)
+
+    def _ensure_settings_panels(self):
+        """Builds the overlay / OBS settings panels and their managers on first use."""
+        if self.overlay_manager is not None:
+            return
+        # Right below the top buttons, where the panels toggle open.
+        panel_index = self.content_layout.indexOf(self.search_bar)
+        self.overlay_settings_panel = create_overlay_settings_panel_layout(self)
+        self.overlay_settings_panel.setVisible(False)
+        self.content_layout.insertWidget(panel_index, self.overlay_settings_panel)
+
+        self.obs_panel = create_obs_panel_layout(self)
+        self.obs_panel.setVisible(False)
+        self.content_layout.insertWidget(panel_index + 1, self.obs_panel)
 
         self.overlay_manager = OverlayManager(
             main_app_ref=self,
@@ -102,10 +184,12 @@ class BossChecklistApp(QWidget):
             obs_undo_reset_button_ref=self.obs_undo_reset_button,
             character_slot_combobox_ref=self.character_slot_combobox
         )
-
-        self._load_initial_boss_data()
-        apply_app_styles(self)
-        self.connect_signals()
+        self.character_slot_combobox.currentIndexChanged.connect(self.obs_manager.on_character_changed)
+        self.toggle_overlay_button.toggled.connect(self.overlay_manager.on_toggle_overlay)
+        # Catch up on stats that arrived before the managers existed.
+        if self.last_known_stats:
+            self.overlay_manager.update_text(self.last_known_stats)
+            self.obs_manager.update_obs_files(self.last_known_stats)
     
     def init_ui(self):
         overall_layout = QVBoxLayout(self)
@@ -136,7 +220,7 @@ class BossChecklistApp(QWidget):
 
         content_widget = QWidget()
         content_widget.setObjectName("mainContent")
-        content_layout = QVBoxLayout(content_widget)
+        content_layout = self.content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(15, 10, 15, 10)
         content_layout.setSpacing(10)
         
@@ -152,18 +236,10 @@ class BossChecklistApp(QWidget):
         top_buttons_layout.addWidget(self.obs_settings_button)
         content_layout.addLayout(top_buttons_layout)
         
-        self.overlay_settings_panel = create_overlay_settings_panel_layout(self)
-        self.overlay_settings_panel.setVisible(False)
-        content_layout.addWidget(self.overlay_settings_panel)
-        
-        self.obs_panel = create_obs_panel_layout(self)
-        self.obs_panel.setVisible(False)
-        content_layout.addWidget(self.obs_panel)
-        
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search for a boss or location...")
         content_layout.addWidget(self.search_bar)
-        self.main_boss_area_widget = create_main_boss_area(self)
+        self.main_boss_area_widget = create_main_boss_area(self, self.boss_filter_model)
         content_layout.addWidget(self.main_boss_area_widget)
 
         main_h_layout.addWidget(sidebar_frame)
@@ -175,17 +251,16 @@ class BossChecklistApp(QWidget):
         
         saved_path = self.settings.value("saveFilePath", "")
         self.save_file_path_label.setText(saved_path or "Please select a save file...")
-        if os.path.exists(saved_path):
-            self.on_save_file_path_changed(saved_path)
+        # The characters of saved_path are listed after the first paint (_finish_startup).
 
     def connect_signals(self):
         self.save_monitor_logic.monitoring_started.connect(self._handle_monitoring_started)
         self.save_monitor_logic.monitoring_stopped.connect(self._handle_monitoring_stopped)
         self.save_monitor_logic.stats_updated.connect(self.handle_stats_update)
+        self.save_monitor_logic.characters_loaded.connect(self._on_characters_loaded)
         
         self.browse_button.clicked.connect(self.browse_for_save_file)
         self.character_slot_combobox.currentIndexChanged.connect(self.handle_character_selection_change)
-        self.character_slot_combobox.currentIndexChanged.connect(self.obs_manager.on_character_changed)
         
         # --- NEW/MODIFIED SIGNAL CONNECTIONS ---
         self.content_filter_combobox.currentIndexChanged.connect(self.handle_content_filter_change)
@@ -193,8 +268,11 @@ class BossChecklistApp(QWidget):
         # --- END NEW/MODIFIED ---
         
         self.search_bar.textChanged.connect(self.on_search_text_changed)
+        self.search_debounce_timer.timeout.connect(self.apply_search)
+        self.main_boss_area_widget.clicked.connect(self._on_boss_tree_clicked)
+        self.main_boss_area_widget.expanded.connect(self._on_boss_tree_expanded)
+        self.main_boss_area_widget.collapsed.connect(self._on_boss_tree_collapsed)
         
-        self.toggle_overlay_button.toggled.connect(self.overlay_manager.on_toggle_overlay)
         self.overlay_settings_button.clicked.connect(self.toggle_overlay_settings)
         self.obs_settings_button.clicked.connect(self.toggle_obs_settings)
 
@@ -218,6 +296,7 @@ class BossChecklistApp(QWidget):
         # Hide Defeated Filter
         hide_defeated = self.settings.value("filters/hideDefeated", False, type=bool)
         self.hide_defeated_checkbox.setChecked(hide_defeated)
+        self.boss_filter_model.set_hide_defeated(hide_defeated)
 
     def _load_initial_boss_data(self):
         """Loads definitions and sets the content filter based on the UI control."""
@@ -254,8 +333,7 @@ class BossChecklistApp(QWidget):
         self.settings.setValue("filters/hideDefeated", is_checked)
         
         # Apply the filter visually without reloading all data
-        for section_widget in self.location_widgets.values():
-            section_widget.apply_status_filter(is_checked)
+        self.boss_filter_model.set_hide_defeated(is_checked)
         
     def on_game_process_status_changed(self, is_running: bool):
         """Starts or stops the smooth UI timer based on game process status."""
@@ -281,7 +359,8 @@ class BossChecklistApp(QWidget):
         self.last_snapshot_real_time = -1
         self.is_game_running = False # <--- ADD THIS
         self.footer.update_time(-1)
-        self.overlay_manager.update_text(self._get_current_stats_payload())
+        if self.overlay_manager is not None:
+            self.overlay_manager.update_text(self._get_current_stats_payload())
 
     def update_live_timer(self):
         """
@@ -299,14 +378,9 @@ class BossChecklistApp(QWidget):
         # Update the UI components
         self.footer.update_time(int(live_play_time))
         
-        # Update overlay if it's visible
-        if self.overlay_manager.overlay_window.isVisible():
-            stats = self.last_known_stats.get("stats", {}).copy()
-            stats['seconds_played'] = int(live_play_time)
-            # Create a temporary payload for the overlay to prevent modifying the main one
-            temp_payload = self.last_known_stats.copy()
-            temp_payload['stats'] = stats
-            self.overlay_manager.update_text(temp_payload)
+        # Only the time segment of the overlay changes; it repaints only if visible and the text differs.
+        if self.overlay_manager is not None:
+            self.overlay_manager.update_play_time(int(live_play_time))
 
     def _handle_monitoring_started(self, char_name, interval):
         self.footer.update_monitoring_status(True, text=f"Monitoring: {char_name}")
@@ -314,14 +388,19 @@ class BossChecklistApp(QWidget):
     def _handle_monitoring_stopped(self):
         self.footer.update_monitoring_status(False)
 
-    def handle_stats_update(self, data: dict):
+    def handle_stats_update(self, data: dict, delta=None):
         """
         OPRAVENÁ VERZE: Zpracuje nová data, sjednotí je a aktualizuje celé UI najednou.
+        `delta` (StatusDelta) lets us skip the boss list and achievements when only
+        stats changed; None means a full refresh.
         """
         stats_from_rust = data.get("stats", {})
         boss_statuses = data.get("boss_statuses", {})
+        flags_changed = delta is None or delta.is_initial or delta.has_flag_changes
 
-        self.boss_data_manager.update_boss_statuses(boss_statuses)
+        changed_bosses = []
+        if flags_changed:
+            changed_bosses = self.boss_data_manager.update_boss_statuses(boss_statuses, delta)
         defeated_count, total_count = self.boss_data_manager.get_boss_counts()
 
         final_stats_payload = stats_from_rust.copy()
@@ -346,19 +425,33 @@ class BossChecklistApp(QWidget):
         
         # This will now update the timer to the snapshot value instantly
         self.footer.update_stats(final_stats_payload)
-        self.overlay_manager.update_text(self.last_known_stats)
-        self.obs_manager.update_obs_files(self.last_known_stats)
-        
-        self.update_main_boss_area()
+        # The managers exist once _finish_startup built the settings panels.
+        if self.overlay_manager is not None:
+            self.overlay_manager.update_text(self.last_known_stats)
+            self.obs_manager.update_obs_files(self.last_known_stats)
+        if self.stats_feed is not None:
+            self.stats_feed.publish(self.last_known_stats)
+
+        if not flags_changed:
+            return
 
-        # Update achievements
+        # Only the rows whose status changed are repainted.
+        self.boss_tree_model.update_bosses(changed_bosses)
+
+        # Update achievements (only those that require one of the changed bosses are checked)
         character_name = self.character_slot_combobox.currentData().get("character_name")
-        defeated_bosses = self.boss_data_manager.get_defeated_bosses_for_character(character_name)
-        self.achievement_manager.check_and_update_achievements(character_name, defeated_bosses)
+        defeated_bosses, cleared_bosses = self.boss_data_manager.split_changed_bosses(changed_bosses)
+        newly_unlocked = self.achievement_manager.update_for_boss_changes(character_name, defeated_bosses, cleared_bosses)
+        if not newly_unlocked and delta is not None and not delta.is_initial:
+            return
         unlocked_achievements = self.achievement_manager.get_unlocked_achievements(character_name)
         all_achievements = self.achievement_manager.get_all_achievements()
         self.achievements_section.update_achievements(all_achievements, unlocked_achievements)
 
+        if not startup_profiler.finished:
+            startup_profiler.mark("first save read")
+            startup_profiler.finish()
+
     def handle_character_selection_change(self, index):
         self.save_monitor_logic.stop_monitoring()
         selected_data = self.character_slot_combobox.itemData(index)
@@ -369,7 +462,8 @@ class BossChecklistApp(QWidget):
             self.footer.update_monitoring_status(False)
             self.footer.update_stats({})
             self.update_main_boss_area(clear=True)
-            self.overlay_manager.update_text({})
+            if self.overlay_manager is not None:
+                self.overlay_manager.update_text({})
             self.achievements_section.update_achievements([], set())
             return
         
@@ -377,14 +471,7 @@ class BossChecklistApp(QWidget):
         
         save_file_path = self.save_file_path_label.text()
         slot_index = selected_data["slot_index"]
-        all_event_ids = self.boss_data_manager.get_all_event_ids_to_monitor()
-        
-        initial_data, err = self.rust_cli_handler.get_full_status(save_file_path, slot_index, all_event_ids)
 
-        if err or not initial_data:
-            print(f"Failed to get initial status: {err}")
-            return
-            
         # --- PŘIDÁNO: Zjištění posledního zabitého bosse pro načtenou postavu ---
         char_name = selected_data.get("character_name")
         all_timestamps = self.timestamp_manager.get_timestamps_for_character(char_name)
@@ -396,9 +483,14 @@ class BossChecklistApp(QWidget):
         else:
             self.last_killed_boss_info = None
         # --- KONEC PŘIDANÉ ČÁSTI ---
-            
-        self.handle_stats_update(initial_data)
-        
+
+        # Fresh boss and achievement state for this character; the first read fills it in.
+        self.boss_data_manager.reset_statuses()
+        self.achievement_manager.reset_progress(char_name)
+        # Lay out the tree with this character's timestamps; statuses arrive through stats_updated.
+        self.update_main_boss_area()
+
+        # The initial status is read on the worker thread and arrives through stats_updated.
         self.save_monitor_logic.start_monitoring(
             save_file_path,
             slot_index,
@@ -407,13 +499,11 @@ class BossChecklistApp(QWidget):
 
     def force_stats_update_for_obs(self):
        """Forces a manual recalculation and pushes the latest data to OBS files."""
-       if self.last_known_stats:
+       if self.last_known_stats and self.obs_manager is not None:
            self.obs_manager.update_obs_files(self.last_known_stats)
 
     def on_boss_defeated(self, boss_event_id: str, play_time: int):
         """Slot to handle a newly defeated boss."""
-        # We need to find which boss corresponds to this event ID
-        all_boss_data = self.boss_data_manager.get_boss_data_by_location()
         # --- FIX IS HERE ---
         # The key is 'character_name', not 'character_id'
         character_name = self.character_slot_combobox.currentData().get("character_name")
@@ -421,47 +511,35 @@ class BossChecklistApp(QWidget):
         if not character_name:
             return
 
-        for location, bosses in all_boss_data.items():
-            for boss_info in bosses:
-                event_ids = boss_info.get("event_id", [])
-                if not isinstance(event_ids, list):
-                    event_ids = [event_ids]
-                
-                if str(boss_event_id) in [str(eid) for eid in event_ids]:
-                    boss_name = boss_info.get("name")
-                    self.timestamp_manager.add_timestamp(character_name, boss_name, play_time)
-                    
-                    # --- PŘIDÁNO: Aktualizujeme informaci o posledním zabití ---
-                    self.last_killed_boss_info = {"name": boss_name, "time": play_time}
-                    print(f"New last killed boss: {self.last_killed_boss_info}")
-                    # --- KONEC PŘIDANÉ ČÁSTI ---
-                    
-                    return # Exit once found
+        # We need to find which boss corresponds to this event ID
+        entry = self.boss_data_manager.get_boss_by_event_id(boss_event_id)
+        if entry is None:
+            return
+        _location, boss_info = entry
+        boss_name = boss_info.get("name")
+        self.timestamp_manager.add_timestamp(character_name, boss_name, play_time)
+        char_timestamps = self.timestamp_manager.get_timestamps_for_character(character_name)
+        self.boss_tree_model.set_timestamp(boss_name, char_timestamps.get(boss_name))
+
+        # --- PŘIDÁNO: Aktualizujeme informaci o posledním zabití ---
+        self.last_killed_boss_info = {"name": boss_name, "time": play_time}
+        print(f"New last killed boss: {self.last_killed_boss_info}")
+        # --- KONEC PŘIDANÉ ČÁSTI ---
 
     def update_main_boss_area(self, clear: bool = False):
-        # --- PRESERVE EXPANDED STATE ---
-        expanded_states = {
-            name: widget.is_expanded
-            for name, widget in self.location_widgets.items()
-        }
-        
-        # ... (The robust clearing logic remains the same) ...
-        layout = self.main_boss_area_widget.widget().layout()
-        while layout.count() > 1:
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        self.location_widgets.clear()
-        # ...
-
+        """
+        Lays out the boss tree for the current filter and character.
+        Only needed when those change; stats updates go through boss_tree_model.update_bosses.
+        """
         if clear:
+            self.boss_tree_model.clear()
             self.footer.update_stats({})
             return
         
-        # ... (The logic for getting and sorting boss data remains the same) ...
         boss_data = self.boss_data_manager.get_boss_data_by_location()
-        if not boss_data: return
+        if not boss_data:
+            self.boss_tree_model.clear()
+            return
         dlc_location_names = self.boss_data_manager.get_dlc_location_names()
         
         base_game_items = []
@@ -481,51 +559,46 @@ class BossChecklistApp(QWidget):
         character_name = self.character_slot_combobox.currentData().get("character_name") if self.character_slot_combobox.currentIndex() > 0 else None
         char_timestamps = self.timestamp_manager.get_timestamps_for_character(character_name) if character_name else {}
         # --- END FIX ---
-        
-        def enrich_boss_list(bosses_list):
-            for boss in bosses_list:
-                boss['timestamp'] = char_timestamps.get(boss.get('name'))
-            return bosses_list
 
-        # --- UI Building Phase ---
-        # (This entire section is almost the same, we just add one line)
-        
-        # 1. Add all base game widgets
-        for location_name, bosses_list in sorted_base_game_items:
-            # ... (header logic is unchanged)
+        # 1. Base game locations, with a phase heading in front of the first location of each phase
+        layout = []
+        for location_name, _bosses in sorted_base_game_items:
             if location_name in GAME_PHASE_HEADINGS:
                 header_data = GAME_PHASE_HEADINGS[location_name]
-                header_label = QLabel(header_data["text"])
-                header_label.setObjectName("gamePhaseHeader")
-                header_label.setAlignment(Qt.AlignCenter)
-                header_label.setProperty("phase", header_data["property"])
-                layout.insertWidget(layout.count() - 1, header_label)
-            section = LocationSectionWidget(location_name, enrich_boss_list(bosses_list), self.main_boss_area_widget.widget())
-            layout.insertWidget(layout.count() - 1, section)
-            self.location_widgets[location_name] = section
-            # --- RESTORE STATE ---
-            if expanded_states.get(location_name):
-                section.set_expanded(True)
+                layout.append(("heading", header_data["text"], header_data["property"]))
+            layout.append(("location", location_name))
 
         # 2. Add the DLC section
         current_filter_mode = self.content_filter_combobox.currentData()
         if current_filter_mode in ["all", "dlc"] and sorted_dlc_items:
-            # ... (dlc header logic)
             dlc_header_data = GAME_PHASE_HEADINGS['dlc_header']
-            dlc_header_label = QLabel(dlc_header_data["text"])
-            dlc_header_label.setObjectName("gamePhaseHeader")
-            dlc_header_label.setAlignment(Qt.AlignCenter)
-            dlc_header_label.setProperty("phase", dlc_header_data["property"])
-            layout.insertWidget(layout.count() - 1, dlc_header_label)
-            for location_name, bosses_list in sorted_dlc_items:
-                section = LocationSectionWidget(location_name, enrich_boss_list(bosses_list), self.main_boss_area_widget.widget())
-                layout.insertWidget(layout.count() - 1, section)
-                self.location_widgets[location_name] = section
-                # --- RESTORE STATE ---
-                if expanded_states.get(location_name):
-                    section.set_expanded(True)
-
-        self.handle_status_filter_change()
+            layout.append(("heading", dlc_header_data["text"], dlc_header_data["property"]))
+            for location_name, _bosses in sorted_dlc_items:
+                layout.append(("location", location_name))
+
+        self.boss_filter_model.set_search_index(self.boss_data_manager.get_search_index())
+        self.boss_tree_model.load(layout, self.boss_data_manager.status_store, char_timestamps)
+
+        # --- RESTORE EXPANDED STATE ---
+        tree_view = self.main_boss_area_widget
+        for row in range(self.boss_filter_model.rowCount()):
+            index = self.boss_filter_model.index(row, 0)
+            if index.data(ROW_NAME_ROLE) in self.expanded_locations:
+                tree_view.expand(index)
+
+    def _on_boss_tree_clicked(self, index):
+        """Clicking a location row toggles it, like the old card headers."""
+        index = index.siblingAtColumn(0)
+        if index.data(ROW_KIND_ROLE) != "location":
+            return
+        tree_view = self.main_boss_area_widget
+        tree_view.setExpanded(index, not tree_view.isExpanded(index))
+
+    def _on_boss_tree_expanded(self, index):
+        self.expanded_locations.add(index.data(ROW_NAME_ROLE))
+
+    def _on_boss_tree_collapsed(self, index):
+        self.expanded_locations.discard(index.data(ROW_NAME_ROLE))
         
     def on_save_file_path_changed(self, new_path):
         self.save_monitor_logic.stop_monitoring()
@@ -540,12 +613,18 @@ class BossChecklistApp(QWidget):
         self.character_slot_combobox.clear()
         self.character_slot_combobox.setEnabled(False)
         self.character_slot_combobox.addItem("Select Character...", userData=None)
-        
-        characters_data, _ = self.rust_cli_handler.list_characters(save_file_path)
+        self.character_slot_combobox.blockSignals(False)
+
+        # Listing runs on the worker thread; _on_characters_loaded fills the combobox.
+        self.save_monitor_logic.request_character_list(save_file_path)
+
+    def _on_characters_loaded(self, save_file_path, characters_data, err):
+        if save_file_path != self.save_file_path_label.text():
+            return # A different save was selected in the meantime
         if not characters_data:
-            self.character_slot_combobox.blockSignals(False)
             return
-            
+
+        self.character_slot_combobox.blockSignals(True)
         for char_info in characters_data:
             if char_info.get("character_name"):
                 display_name = f"{char_info['character_name']} (Level {char_info['character_level']})"
@@ -572,11 +651,18 @@ class BossChecklistApp(QWidget):
             self.on_save_file_path_changed(filepath)
 
     def on_search_text_changed(self, text):
-        search_term = text.lower().strip()
-        for section in self.location_widgets.values():
-            location_matches = search_term in section.location_name.lower()
-            boss_matches = any(search_term in b.get("name", "").lower() for b in section.bosses_data)
-            section.setVisible(location_matches or boss_matches or not search_term)
+        if text.strip():
+            self.search_debounce_timer.start()
+        else:
+            # Clearing the search shows everything right away
+            self.search_debounce_timer.stop()
+            self.apply_search()
+
+    def apply_search(self):
+        self.boss_filter_model.set_search_term(self.search_bar.text())
+        best_match = self.boss_filter_model.best_match_index()
+        if best_match.isValid():
+            self.main_boss_area_widget.scrollTo(best_match, QAbstractItemView.ScrollHint.PositionAtTop)
 
     def _get_current_stats_payload(self) -> dict:
         return self.last_known_stats or {
@@ -584,14 +670,30 @@ class BossChecklistApp(QWidget):
             "boss_statuses": {}
         }
 
+    def closeEvent(self, event):
+        """Shuts down background helpers before the window closes."""
+        self.save_monitor_logic.shutdown()
+        self.save_backend.close()
+        self.timestamp_manager.close()
+        if self.obs_manager is not None:
+            self.obs_manager.close()
+        if self.run_history is not None:
+            self.run_history.close()
+        if self.stats_feed is not None:
+            self.stats_feed.stop()
+        stats = get_pixmap_cache_stats()
+        print(f"Icon cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions.")
+        super().closeEvent(event)
+
     def toggle_overlay_settings(self):
         """Toggles the visibility of the overlay settings panel, ensuring the OBS panel is hidden."""
         # Hide the other panel first
-        if self.obs_panel.isVisible():
+        if self.obs_panel is not None and self.obs_panel.isVisible():
             self.obs_panel.setVisible(False)
             self.obs_settings_button.setText("OBS Settings")
 
         # Toggle the desired panel
+        self._ensure_settings_panels()
         is_visible = not self.overlay_settings_panel.isVisible()
         self.overlay_settings_panel.setVisible(is_visible)
         self.overlay_settings_button.setText("Hide Overlay Settings" if is_visible else "Overlay Settings")
@@ -599,26 +701,41 @@ class BossChecklistApp(QWidget):
     def toggle_obs_settings(self):
         """Toggles the visibility of the OBS settings panel, ensuring the overlay panel is hidden."""
         # Hide the other panel first
-        if self.overlay_settings_panel.isVisible():
+        if self.overlay_settings_panel is not None and self.overlay_settings_panel.isVisible():
             self.overlay_settings_panel.setVisible(False)
             self.overlay_settings_button.setText("Overlay Settings")
 
         # Toggle the desired panel
+        self._ensure_settings_panels()
         is_visible = not self.obs_panel.isVisible()
         self.obs_panel.setVisible(is_visible)
         self.obs_settings_button.setText("Hide OBS Settings" if is_visible else "OBS Settings")
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="The Tarnished's Chronicle")
+    parser.add_argument("--profile-startup", nargs="?", const="", default=None, metavar="JSONL_PATH",
+                        help="Print per-phase startup timings; with a path, also append them there as a JSON line")
+    args, qt_args = parser.parse_known_args()
+    if args.profile_startup is not None:
+        startup_profiler.enable(args.profile_startup or None)
+    startup_profiler.record_since_start("imports")
+
+    with startup_profiler.phase("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
     
     # Set application icon
     icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'icons', 'app_logo.png')
     app_icon = QIcon(icon_path)
     app.setWindowIcon(app_icon)
+
+    if PIXMAP_CACHE_PREWARM:
+        with startup_profiler.phase("icon prewarm"):
+            prewarm_pixmap_cache(ICON_PIXMAPS + list(STATUS_ICONS.values()))
     
-    window = BossChecklistApp()
+    with startup_profiler.phase("main window"):
+        window = BossChecklistApp()
     window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,321 @@
+# src/headless.py
+"""
+Headless monitoring service: the GUI's monitoring pipeline without Qt.
+
+Reads the save, tracks boss kills and timestamps, writes the OBS text files,
+run history and (optionally) the stats feed, configured from a JSON file.
+Run with `python -m src.headless [--config PATH] [--write-default-config]`.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+
+from .app_config import (
+    RUST_CLI_TOOL_PATH_PLACEHOLDER,
+    SAVE_READER_BACKEND,
+    DEFAULT_BOSS_REFERENCE_FILENAME,
+    DLC_BOSS_REFERENCE_FILENAME,
+    DEFAULT_MONITORING_INTERVAL_SEC,
+    RUN_HISTORY_ENABLED,
+    RUN_HISTORY_DB_FILENAME,
+    STATS_FEED_HOST,
+    STATS_FEED_PORT,
+    HEADLESS_CONFIG_FILENAME
+)
+from .boss_data_manager import BossDataManager
+from .file_utils import get_app_data_path
+from .game_process_tracker import GameProcessTracker
+from .multi_slot_monitor import MultiSlotMonitor
+from .obs_outputs import ObsOutputs, OBS_FILES, DEFAULT_OBS_FORMATS
+from .run_history_store import RunHistoryStore
+from .save_change_detector import SaveChangeDetector
+from .save_reader import create_save_backend
+from .stats_feed_server import StatsFeedServer
+from .status_delta import compute_status_delta
+from .timestamp_manager import TimestampManager
+
+DEFAULT_CONFIG = {
+    "save_file_path": "",
+    # The character is picked by name; slot_index is used when the name is empty.
+    "character_name": "",
+    "slot_index": 0,
+    "backend": SAVE_READER_BACKEND,
+    "content_filter": "all",
+    "poll_interval_sec": DEFAULT_MONITORING_INTERVAL_SEC,
+    # Like the GUI, only read the save while the game is running.
+    "require_game_running": True,
+    # Also track every other populated slot (kill timestamps and run history);
+    # OBS files and the stats feed follow the selected character only.
+    "monitor_all_slots": False,
+    "run_history": RUN_HISTORY_ENABLED,
+    "obs": {
+        "enabled": True,
+        "folder": "",
+        "death_offset": 0,
+        "files": {key: {"enabled": True, "format": template} for key, template in DEFAULT_OBS_FORMATS.items()},
+    },
+    "stats_feed": {"enabled": False, "host": STATS_FEED_HOST, "port": STATS_FEED_PORT},
+}
+
+
+def _merge_config(defaults, overrides):
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(defaults.get(key), dict):
+            merged[key] = _merge_config(defaults[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_config(path):
+    """Returns (config, None) with defaults filled in, or (None, error message)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        return None, f"Could not read config '{path}': {e}"
+    if not isinstance(overrides, dict):
+        return None, f"Config '{path}' must contain a JSON object."
+    unknown_files = set(overrides.get("obs", {}).get("files", {})) - set(OBS_FILES)
+    if unknown_files:
+        return None, f"Unknown OBS files in config: {', '.join(sorted(unknown_files))}"
+    return _merge_config(DEFAULT_CONFIG, overrides), None
+
+
+class HeadlessMonitor:
+    """
+    Same steps as SaveMonitorWorker / BossChecklistApp.handle_stats_update, driven
+    by a plain loop: check the game process, skip unchanged saves, read and diff
+    the status, then update boss state, timestamps, history, OBS files and feed.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.save_file_path = config["save_file_path"]
+        self.slot_index = -1
+        self.character_name = ""
+
+        self.save_backend = create_save_backend(config["backend"], RUST_CLI_TOOL_PATH_PLACEHOLDER)
+        self.boss_data_manager = BossDataManager(DEFAULT_BOSS_REFERENCE_FILENAME, DLC_BOSS_REFERENCE_FILENAME)
+        self.change_detector = SaveChangeDetector()
+        self.process_tracker = GameProcessTracker()
+        self.timestamp_manager = TimestampManager()
+        self.run_history = RunHistoryStore(get_app_data_path(RUN_HISTORY_DB_FILENAME)) if config["run_history"] else None
+        if self.run_history is not None and not self.run_history.is_available():
+            self.run_history = None  # the database could not be opened
+
+        obs_config = config["obs"]
+        self.obs_outputs = None
+        if obs_config["enabled"] and obs_config["folder"]:
+            self.obs_outputs = ObsOutputs(obs_config["folder"])
+            self.obs_outputs.death_offset = obs_config["death_offset"]
+            for key, file_config in obs_config["files"].items():
+                self.obs_outputs.set_enabled(key, file_config.get("enabled", True))
+                err = self.obs_outputs.set_format(key, file_config.get("format", DEFAULT_OBS_FORMATS[key]))
+                if err:
+                    print(f"Invalid OBS format for {OBS_FILES[key]}: {err} Using the default.")
+
+        self.stats_feed = None
+        feed_config = config["stats_feed"]
+        if feed_config["enabled"]:
+            self.stats_feed = StatsFeedServer(feed_config["host"], feed_config["port"])
+
+        self.multi_slot_monitor = MultiSlotMonitor(self.save_backend) if config["monitor_all_slots"] else None
+        self.last_known_data = None
+        self.last_kill = None
+        self.last_known_stats = {}
+        self.reads = 0
+
+    def start(self):
+        """Resolves the character and loads definitions. Returns (True, None) or (False, error message)."""
+        if not os.path.isfile(self.save_file_path):
+            return False, f"Save file not found: '{self.save_file_path}'"
+        characters, err = self.save_backend.list_characters(self.save_file_path)
+        if err or not characters:
+            return False, f"Could not list characters: {err or 'no characters found'}"
+
+        wanted_name = self.config["character_name"]
+        for char_info in characters:
+            if (wanted_name and char_info.get("character_name") == wanted_name) or \
+                    (not wanted_name and char_info.get("slot_index") == self.config["slot_index"]):
+                self.slot_index = char_info["slot_index"]
+                self.character_name = char_info.get("character_name", "")
+                break
+        else:
+            wanted = f"'{wanted_name}'" if wanted_name else f"in slot {self.config['slot_index']}"
+            return False, f"Character {wanted} not found in the save."
+
+        self.boss_data_manager.load_definitions()
+        self.boss_data_manager.set_content_filter(self.config["content_filter"])
+
+        timestamps = self.timestamp_manager.get_timestamps_for_character(self.character_name)
+        if timestamps:
+            last_boss_name = max(timestamps, key=timestamps.get)
+            self.last_kill = {"name": last_boss_name, "time": timestamps[last_boss_name]}
+
+        if self.stats_feed is not None:
+            started, _ = self.stats_feed.start()
+            if not started:
+                self.stats_feed = None
+        print(f"Monitoring {self.character_name} (slot {self.slot_index}) in {self.save_file_path}")
+        return True, None
+
+    def tick(self):
+        """One monitoring pass. Returns the StatusDelta that was applied, or None."""
+        if self.config["require_game_running"] and not self.process_tracker.is_running():
+            return None
+        event_ids = self.boss_data_manager.get_all_event_ids_to_monitor()
+        if self.multi_slot_monitor is not None:
+            return self._tick_all_slots(event_ids)
+        if not self.change_detector.needs_read(self.save_file_path, self.slot_index):
+            return None
+
+        new_data, err = self.save_backend.get_full_status(self.save_file_path, self.slot_index, event_ids)
+        if err or new_data is None:
+            print(f"Monitoring Error: {err or 'No data returned'}")
+            return None
+        self.change_detector.mark_read()
+        self.reads += 1
+
+        delta = compute_status_delta(self.last_known_data, new_data)
+        if delta.is_empty():
+            return None
+        self.last_known_data = new_data
+        self._apply_update(new_data, delta)
+        return delta
+
+    def _tick_all_slots(self, event_ids):
+        """Reads only the slots that changed; returns the selected character's delta, if any."""
+        updates, err = self.multi_slot_monitor.poll(self.save_file_path, event_ids)
+        if err:
+            print(f"Monitoring Error: {err}")
+            return None
+        selected_delta = None
+        for slot_index, (new_data, delta) in updates.items():
+            self.reads += 1
+            if slot_index == self.slot_index:
+                self.last_known_data = new_data
+                self._apply_update(new_data, delta)
+                selected_delta = delta
+                continue
+            character_name = new_data.get("stats", {}).get("character_name", "")
+            print(f"Slot {slot_index} ({character_name}): {delta}")
+            self._record_slot_update(slot_index, character_name, new_data, delta)
+        return selected_delta
+
+    def _record_slot_update(self, slot_index, character_name, new_data, delta):
+        """Run history and kill timestamps of one slot. Returns the last kill seen, or None."""
+        stats = new_data.get("stats", {})
+        play_time = stats.get("seconds_played", 0)
+        character_key = (self.save_file_path, slot_index, character_name)
+
+        if self.run_history is not None and (delta.is_initial or delta.stats_changed):
+            self.run_history.record_stats(character_key, stats)
+        if delta.is_initial:
+            return None  # Flags that were already set have no known kill time.
+        last_kill = None
+        for boss_id in delta.flags_set:
+            entry = self.boss_data_manager.get_boss_by_event_id(boss_id)
+            boss_name = entry[1].get("name") if entry else None
+            if self.run_history is not None:
+                self.run_history.record_kill(character_key, boss_id, boss_name, play_time)
+            if boss_name:
+                print(f"Boss defeated: {boss_name} at {play_time}s")
+                self.timestamp_manager.add_timestamp(character_name, boss_name, play_time)
+                last_kill = {"name": boss_name, "time": play_time}
+        return last_kill
+
+    def _apply_update(self, new_data, delta):
+        stats = new_data.get("stats", {})
+        last_kill = self._record_slot_update(self.slot_index, self.character_name, new_data, delta)
+        if last_kill is not None:
+            self.last_kill = last_kill
+
+        if delta.is_initial or delta.has_flag_changes:
+            self.boss_data_manager.update_boss_statuses(new_data.get("boss_statuses", {}), delta)
+        defeated_count, total_count = self.boss_data_manager.get_boss_counts()
+
+        stats_payload = dict(stats)
+        stats_payload['defeated'] = defeated_count
+        stats_payload['total'] = total_count
+        self.last_known_stats = {"stats": stats_payload, "last_kill": self.last_kill}
+
+        if self.obs_outputs is not None:
+            self.obs_outputs.update(self.last_known_stats)
+        if self.stats_feed is not None:
+            self.stats_feed.publish(self.last_known_stats)
+
+    def run(self, stop_event):
+        """Ticks every poll_interval_sec until stop_event is set."""
+        interval = self.config["poll_interval_sec"]
+        while True:
+            self.tick()
+            if stop_event.wait(interval):
+                break
+
+    def close(self):
+        if self.stats_feed is not None:
+            self.stats_feed.stop()
+        if self.obs_outputs is not None:
+            self.obs_outputs.close()
+        if self.run_history is not None:
+            self.run_history.close()
+        self.timestamp_manager.close()
+        self.save_backend.close()
+        if self.multi_slot_monitor is not None:
+            counters = self.multi_slot_monitor.change_detector.get_counters()
+            print(f"Stopped after {self.reads} slot reads. Hashed {counters['slots_hashed']} slots, "
+                  f"{counters['slots_changed']} changed, {counters['skipped_stat']}/{counters['checked']} stat-only checks.")
+            return
+        counters = self.change_detector.get_counters()
+        print(f"Stopped after {self.reads} reads. Skipped {counters['skipped']}/{counters['checked']} unchanged save checks.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="The Tarnished's Chronicle headless monitor (no Qt)")
+    parser.add_argument("--config", default=get_app_data_path(HEADLESS_CONFIG_FILENAME),
+                        help="JSON config file (default: %(default)s)")
+    parser.add_argument("--write-default-config", action="store_true",
+                        help="Write a config with the default values to --config and exit")
+    args = parser.parse_args(argv)
+
+    if args.write_default_config:
+        if os.path.exists(args.config):
+            print(f"Config '{args.config}' already exists; not overwriting it.")
+            return 1
+        with open(args.config, 'w', encoding='utf-8') as f:
+            json.dump(DEFAULT_CONFIG, f, indent=4)
+        print(f"Default config written to '{args.config}'.")
+        return 0
+
+    config, err = load_config(args.config)
+    if err:
+        print(err)
+        return 1
+
+    monitor = HeadlessMonitor(config)
+    started, err = monitor.start()
+    if not started:
+        print(err)
+        monitor.close()
+        return 1
+
+    stop_event = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop_event.set())
+    started_at = time.monotonic()
+    try:
+        monitor.run(stop_event)
+    finally:
+        monitor.close()
+        print(f"Ran for {time.monotonic() - started_at:.0f} s.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# src/multi_slot_monitor.py
+from .save_change_detector import MultiSlotChangeDetector
+from .save_reader import CHARACTER_SLOT_COUNT
+from .status_delta import compute_status_delta
+
+
+class MultiSlotMonitor:
+    """
+    Tracks every populated slot of one save (e.g. several players on a shared PC).
+
+    poll() fingerprints the slots to find the ones that changed, reads only those
+    with one get_multi_slot_status call and diffs each against its previous
+    payload. The cost of a tick grows with the number of changed slots, not with
+    the number of slots watched.
+
+    With `slot_indexes` None every slot is watched and the populated ones are
+    looked up (list_characters) whenever something changed, so characters
+    created or deleted while monitoring are picked up.
+    """
+
+    def __init__(self, save_backend, slot_indexes=None):
+        self.save_backend = save_backend
+        self.slot_indexes = list(slot_indexes) if slot_indexes is not None else None
+        self.change_detector = MultiSlotChangeDetector()
+        self.last_known_data = {}   # slot index -> last payload
+
+    def reset(self):
+        self.change_detector.reset()
+        self.last_known_data = {}
+
+    def poll(self, save_file_path, event_ids):
+        """
+        Returns ({slot_index: (payload, StatusDelta)}, None) for the slots that changed,
+        or (None, error). A slot read for the first time gets an initial delta.
+        """
+        watched = self.slot_indexes if self.slot_indexes is not None else range(CHARACTER_SLOT_COUNT)
+        changed_slots = self.change_detector.changed_slots(save_file_path, watched)
+        if not changed_slots:
+            return {}, None
+
+        read_slots = changed_slots
+        if self.slot_indexes is None:
+            characters, err = self.save_backend.list_characters(save_file_path)
+            if err:
+                return None, err
+            populated = {char_info["slot_index"] for char_info in characters or ()}
+            read_slots = [slot_index for slot_index in changed_slots if slot_index in populated]
+
+        statuses = {}
+        if read_slots:
+            statuses, err = self.save_backend.get_multi_slot_status(save_file_path, event_ids, read_slots)
+            if err:
+                return None, err
+        self.change_detector.mark_read(changed_slots)
+
+        updates = {}
+        for slot_index in changed_slots:
+            new_data = statuses.get(slot_index)
+            if new_data is None:
+                # Empty (or deleted) slot; a new character there starts with an initial delta.
+                self.last_known_data.pop(slot_index, None)
+                continue
+            delta = compute_status_delta(self.last_known_data.get(slot_index), new_data)
+            if delta.is_empty():
+                continue
+            self.last_known_data[slot_index] = new_data
+            updates[slot_index] = (new_data, delta)
+        return updates, None
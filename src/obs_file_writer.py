@@ -0,0 +1,95 @@
+# src/obs_file_writer.py
+import threading
+
+from .file_utils import atomic_write_text
+
+
+class ObsFileWriter:
+    """
+    Writes OBS text files off the GUI thread.
+
+    write() remembers the last content per path and drops identical writes
+    right away. Changed content is handed to a writer thread that replaces the
+    file through temp-file-plus-rename, so OBS never reads a half-written file.
+    If several changes to one path queue up before the thread gets to them, only
+    the newest is written. A failed write is forgotten, and `on_failure(path)`
+    (called on the writer thread) tells the owner to render that file again.
+    """
+
+    def __init__(self, on_failure=None):
+        self.on_failure = on_failure
+        self.writes_issued = 0
+        self.writes_skipped = 0
+        self.writes_coalesced = 0   # replaced by newer content before reaching the disk
+        self.writes_failed = 0
+
+        self._last_content = {}   # path -> content last accepted by write()
+        self._pending = {}        # path -> content waiting for the writer thread
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="ObsFileWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, path, content):
+        """Queues `content` for `path` unless it is what the file already holds."""
+        with self._lock:
+            if self._last_content.get(path) == content:
+                self.writes_skipped += 1
+                return
+            self._last_content[path] = content
+            if path in self._pending:
+                self.writes_coalesced += 1
+            self._pending[path] = content
+        self._wakeup.set()
+
+    def forget(self):
+        """Drops the remembered contents, so the next write of every file goes to disk."""
+        with self._lock:
+            self._last_content.clear()
+
+    def get_counters(self):
+        return {
+            "issued": self.writes_issued,
+            "skipped": self.writes_skipped,
+            "coalesced": self.writes_coalesced,
+            "failed": self.writes_failed
+        }
+
+    def close(self):
+        """Writes whatever is still pending and stops the thread."""
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for path, content in pending.items():
+                self._write_file(path, content)
+            if self._stopping:
+                with self._lock:
+                    if not self._pending:
+                        return
+
+    def _write_file(self, path, content):
+        try:
+            try:
+                atomic_write_text(path, content, fsync=False)
+            except PermissionError:
+                # Windows refuses to replace a file another process holds open; write in place instead.
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            self.writes_issued += 1
+        except OSError as e:
+            print(f"Error writing to OBS file '{path}': {e}")
+            self.writes_failed += 1
+            with self._lock:
+                # Let the next update retry this file.
+                if self._last_content.get(path) == content:
+                    del self._last_content[path]
+            if self.on_failure is not None:
+                self.on_failure(path)
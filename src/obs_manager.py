@@ -3,7 +3,9 @@
 import os
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QGroupBox
 from PySide6.QtCore import QSettings, Qt
-from .utils import format_seconds_to_hms
+from .obs_outputs import ObsOutputs, OBS_FILES
+
+_INVALID_FORMAT_STYLE = "border: 1px solid #BF616A;"
 
 class ObsManager:
     def __init__(self, main_app_ref, obs_panel_ref, settings_button_ref,
@@ -45,8 +47,22 @@ class ObsManager:
         ]
 
         self.settings = QSettings("TheTarnishedChronicle", "App")
+        # Rendering and writing live in ObsOutputs (shared with the headless service).
+        self.outputs = ObsOutputs()
+        self.file_writer = self.outputs.file_writer
         self.death_offset = 0 # This will hold the offset for the CURRENT character
+
+        # file key -> (enabled checkbox, format line edit)
+        self.obs_files = {
+            "bosses": (self.bosses_enabled, self.bosses_format),
+            "deaths": (self.deaths_enabled, self.deaths_format),
+            "time": (self.time_enabled, self.time_format),
+            "last_boss": (self.last_boss_enabled, self.last_boss_format),
+        }
+
         self._load_settings()
+        for key in self.obs_files:
+            self._compile_format(key)
         self.connect_signals()
         self.handle_state_change() # Apply initial enabled/disabled state
         self.on_character_changed() # Load initial offset and set button state
@@ -70,6 +86,11 @@ class ObsManager:
         self.obs_reset_deaths_button.clicked.connect(self.reset_obs_deaths)
         self.obs_undo_reset_button.clicked.connect(self.undo_obs_deaths_reset)
 
+        # Formats are compiled once per edit, not on every update.
+        for key, (_, format_edit) in self.obs_files.items():
+            format_edit.textChanged.connect(lambda _text, key=key: self._on_format_changed(key))
+        self.enable_toggle.toggled.connect(self.outputs.invalidate)
+
     def _load_settings(self):
         """Load all OBS settings from QSettings and apply them to the UI."""
         self.enable_toggle.setChecked(self.settings.value("obs/enabled", False, type=bool))
@@ -245,55 +266,35 @@ class ObsManager:
         self.update_obs_files(self.app.last_known_stats) # Force update
         print(f"Removed death offset for {char_key}")
 
+    def _compile_format(self, key):
+        """Compiles the format of one file. An invalid format is flagged and the last valid one stays in use."""
+        format_edit = self.obs_files[key][1]
+        err = self.outputs.set_format(key, format_edit.text())
+        if err:
+            print(f"Invalid OBS format for {OBS_FILES[key]}: {err}")
+            format_edit.setStyleSheet(_INVALID_FORMAT_STYLE)
+            format_edit.setToolTip(err)
+            return False
+        format_edit.setStyleSheet("")
+        format_edit.setToolTip("")
+        return True
+
+    def _on_format_changed(self, key):
+        if self._compile_format(key):
+            self.update_obs_files(self.app.last_known_stats)
+
     def update_obs_files(self, data: dict):
-        """Zapíše data do všech povolených souborů."""
+        """Zapíše data do všech povolených souborů; soubor se přepočítá jen když se změnil některý z jeho vstupů."""
         if not self.enable_toggle.isChecked(): return
         folder = self.folder_label.text()
         if not folder or folder == "Not set.": return
 
-        stats = data.get("stats", {})
-        last_kill = data.get("last_kill")
+        self.outputs.set_folder(folder)
+        self.outputs.death_offset = self.death_offset
+        for key, (enabled_checkbox, _) in self.obs_files.items():
+            self.outputs.set_enabled(key, enabled_checkbox.isChecked())
+        self.outputs.update(data)
 
-        # Formátování času
-        s = stats.get('seconds_played', -1)
-        time_str = format_seconds_to_hms(s) if s >= 0 else "--:--:--"
-        
-        # Zápis do bosses.txt
-        if self.bosses_enabled.isChecked():
-            path = os.path.join(folder, "bosses.txt")
-            text = self.bosses_format.text().format(defeated=stats.get('defeated', '--'), total=stats.get('total', '--'))
-            self._write_file(path, text)
-
-        # Zápis do deaths.txt
-        if self.deaths_enabled.isChecked():
-            path = os.path.join(folder, "deaths.txt")
-            obs_deaths = stats.get('deaths', 0) + self.death_offset
-            text = self.deaths_format.text().format(deaths=obs_deaths)
-            self._write_file(path, text)
-            
-        # Zápis do time.txt
-        if self.time_enabled.isChecked():
-            path = os.path.join(folder, "time.txt")
-            text = self.time_format.text().format(time=time_str)
-            self._write_file(path, text)
-
-        # Zápis do last_boss.txt
-        if self.last_boss_enabled.isChecked():
-            path = os.path.join(folder, "last_boss.txt")
-            if last_kill:
-                kill_time_str = format_seconds_to_hms(last_kill.get("time", 0))
-                text = self.last_boss_format.text().format(
-                    boss_name=last_kill.get("name", "N/A"),
-                    kill_time=kill_time_str
-                )
-            else:
-                text = "" # Clear the file if no boss has been killed
-            self._write_file(path, text)
-
-    def _write_file(self, path, content):
-        """Pomocná metoda pro bezpečný zápis do souboru."""
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except IOError as e:
-            print(f"Error writing to OBS file '{path}': {e}")
\ No newline at end of file
+    def close(self):
+        """Finishes pending writes; call before the application exits."""
+        self.outputs.close()
@@ -0,0 +1,115 @@
+# src/obs_outputs.py
+import os
+
+from .formatting import format_seconds_to_hms
+from .obs_file_writer import ObsFileWriter
+from .obs_templates import compile_format
+
+# file key -> file name in the output folder
+OBS_FILES = {
+    "bosses": "bosses.txt",
+    "deaths": "deaths.txt",
+    "time": "time.txt",
+    "last_boss": "last_boss.txt",
+}
+
+DEFAULT_OBS_FORMATS = {
+    "bosses": "Bosses: {defeated}/{total}",
+    "deaths": "Deaths: {deaths}",
+    "time": "Time: {time}",
+    "last_boss": "Last Kill: {boss_name} ({kill_time})",
+}
+
+
+class ObsOutputs:
+    """
+    Renders the OBS text files from a stats payload, without any Qt.
+
+    ObsManager feeds it from the panel widgets, the headless service from its
+    config file. Formats are compiled once (obs_templates); a file is only
+    re-rendered when one of the placeholders it uses changed, and unchanged
+    text never reaches the disk (ObsFileWriter).
+    """
+
+    def __init__(self, folder=None, file_writer=None):
+        self.folder = folder
+        self.death_offset = 0
+        self.enabled = set(OBS_FILES)
+        self.file_writer = file_writer or ObsFileWriter()
+        self.file_writer.on_failure = self._on_write_failed
+        self.compiled_formats = {}   # file key -> CompiledFormat (last valid one)
+        self._rendered_inputs = {}   # file path -> inputs the current file text was rendered from
+        for key, template in DEFAULT_OBS_FORMATS.items():
+            self.set_format(key, template)
+
+    def set_format(self, key, template):
+        """Compiles a format. Returns None, or the error message (the last valid format stays in use)."""
+        compiled, err = compile_format(template)
+        if err:
+            return err
+        self.compiled_formats[key] = compiled
+        return None
+
+    def set_enabled(self, key, is_enabled):
+        if is_enabled == (key in self.enabled):
+            return
+        if is_enabled:
+            self.enabled.add(key)
+        else:
+            self.enabled.discard(key)
+        self.invalidate()
+
+    def set_folder(self, folder):
+        self.folder = folder
+
+    def invalidate(self):
+        """Makes the next update() render every enabled file again."""
+        self._rendered_inputs.clear()
+
+    def _on_write_failed(self, path):
+        # Runs on the writer thread; the next update() renders and writes this file again.
+        self._rendered_inputs.pop(path, None)
+
+    def get_template_values(self, data: dict):
+        """Placeholder values for the OBS formats; boss_name / kill_time are None until a boss is killed."""
+        stats = data.get("stats", {})
+        last_kill = data.get("last_kill")
+
+        s = stats.get('seconds_played', -1)
+        time_str = format_seconds_to_hms(s) if s >= 0 else "--:--:--"
+
+        return {
+            "defeated": stats.get('defeated', '--'),
+            "total": stats.get('total', '--'),
+            "deaths": stats.get('deaths', 0) + self.death_offset,
+            "time": time_str,
+            "boss_name": last_kill.get("name", "N/A") if last_kill else None,
+            "kill_time": format_seconds_to_hms(last_kill.get("time", 0)) if last_kill else None,
+        }
+
+    def update(self, data: dict):
+        """Writes every enabled file whose inputs changed since it was last written."""
+        if not self.folder:
+            return
+        values = self.get_template_values(data)
+        for key, file_name in OBS_FILES.items():
+            compiled = self.compiled_formats.get(key)
+            if compiled is None or key not in self.enabled:
+                continue
+            path = os.path.join(self.folder, file_name)
+            no_kill_yet = key == "last_boss" and values["boss_name"] is None
+            inputs = (compiled.template, no_kill_yet, compiled.inputs(values))
+            if self._rendered_inputs.get(path) == inputs:
+                continue
+            self._rendered_inputs[path] = inputs
+            if no_kill_yet:
+                text = "" # Clear the file if no boss has been killed
+            else:
+                text = compiled.render(values)
+            self.file_writer.write(path, text)
+
+    def close(self):
+        """Finishes pending writes."""
+        self.file_writer.close()
+        counters = self.file_writer.get_counters()
+        print(f"OBS files: {counters['issued']} writes, {counters['skipped']} unchanged skipped, {counters['failed']} failed.")
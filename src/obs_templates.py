@@ -0,0 +1,89 @@
+# src/obs_templates.py
+from string import Formatter
+
+# Placeholders the OBS text formats may use (see ObsManager.show_instructions).
+OBS_PLACEHOLDERS = ("defeated", "total", "deaths", "time", "boss_name", "kill_time")
+
+# Typed stand-ins used to check format specs such as {deaths:03d} at compile time.
+_SAMPLE_VALUES = {
+    "defeated": 0,
+    "total": 0,
+    "deaths": 0,
+    "time": "00:00:00",
+    "boss_name": "Boss",
+    "kill_time": "00:00:00",
+}
+
+_CONVERSIONS = {None: None, "s": str, "r": repr, "a": ascii}
+
+
+class CompiledFormat:
+    """
+    One OBS text format, parsed and validated once.
+
+    `fields` holds the placeholders the text depends on, so callers can skip
+    rendering when none of them changed. render() never raises: a value that
+    doesn't fit its format spec (e.g. "--" for {deaths:03d}) is written as str().
+    """
+    __slots__ = ("template", "fields", "_parts")
+
+    def __init__(self, template, parts):
+        self.template = template
+        self._parts = tuple(parts)
+        self.fields = frozenset(part[0] for part in self._parts if not isinstance(part, str))
+
+    def inputs(self, values):
+        """The values this format depends on, in a stable order (for change checks)."""
+        return tuple(values.get(name) for name in sorted(self.fields))
+
+    def render(self, values):
+        chunks = []
+        for part in self._parts:
+            if isinstance(part, str):
+                chunks.append(part)
+                continue
+            name, convert, spec = part
+            value = values.get(name, "--")
+            if convert is not None:
+                value = convert(value)
+            try:
+                chunks.append(format(value, spec))
+            except (ValueError, TypeError):
+                chunks.append(str(value))
+        return "".join(chunks)
+
+
+def compile_format(template: str, allowed=OBS_PLACEHOLDERS):
+    """
+    Parses a format string into a CompiledFormat.
+    Returns (CompiledFormat, None) or (None, error message).
+    """
+    parts = []
+    try:
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if literal:
+                parts.append(literal)
+            if field is None:
+                continue
+            if field == "" or field.isdigit():
+                return None, "Positional placeholders like {} are not supported; use a name such as {deaths}."
+            if field not in allowed:
+                return None, f"Unknown placeholder {{{field}}}. Available: " + ", ".join(f"{{{name}}}" for name in allowed)
+            if "{" in spec:
+                return None, f"Nested placeholders in the format of {{{field}}} are not supported."
+            if conversion not in _CONVERSIONS:
+                return None, f"Unknown conversion !{conversion} in {{{field}}}."
+            parts.append((field, _CONVERSIONS[conversion], spec))
+    except ValueError as e:
+        return None, f"Malformed format: {e}"
+
+    for part in parts:
+        if isinstance(part, str):
+            continue
+        name, convert, spec = part
+        sample = _SAMPLE_VALUES.get(name, "")
+        try:
+            format(sample if convert is None else convert(sample), spec)
+        except (ValueError, TypeError) as e:
+            return None, f"Invalid format spec in {{{name}}}: {e}"
+    return CompiledFormat(template, parts), None
@@ -29,8 +29,16 @@ class OverlayManager:
         
         self.settings = QSettings("TheTarnishedChronicle", "App")
         self.last_known_stats = {}
-        
+        self.live_seconds_played = None   # ticking play time from the GUI timer, None = use the snapshot
+
+        # Předpočítaná šablona řádku: které části se zobrazují (mění se jen při změně nastavení)
+        self._line_template = ()
+        self._show_seconds = True
+        self._show_last_boss = True
+        self._segment_cache = {}          # segment key -> (inputs, rendered text)
+
         self.load_settings()
+        self._rebuild_line_template()
         self.connect_signals()
 
     def connect_signals(self):
@@ -126,18 +134,58 @@ class OverlayManager:
         """
         Aktualizuje text na základě kompletních dat (např. z monitoringu).
         Tato metoda se volá, když už je overlay pravděpodobně viditelný.
+        The payload is replaced, never mutated, by the caller, so it is kept without a copy.
         """
-        self.last_known_stats = stats.copy()
+        self.last_known_stats = stats
+        self.live_seconds_played = None
         # Pokud je overlay viditelný, okamžitě překreslíme text.
         if self.overlay_window.isVisible():
             self._render_text()
 
+    def update_play_time(self, seconds_played: int):
+        """Per-second timer tick: only the time segment can change."""
+        self.live_seconds_played = seconds_played
+        if self.overlay_window.isVisible():
+            self._render_text()
+
     def force_ui_update(self):
         """Vynutí překreslení textu na základě posledních známých dat a aktuálního nastavení."""
+        self._rebuild_line_template()
         # Pokud máme vybranou postavu, překreslíme.
         if self.app.save_monitor_logic.current_slot_index != -1:
             self._render_text()
-            
+
+    def _rebuild_line_template(self):
+        """Zjistí z nastavení, které části se zobrazují, aby se to nemuselo zjišťovat při každém překreslení."""
+        self._line_template = tuple(key for key, checkbox in (
+            ("bosses", self.show_bosses_checkbox),
+            ("deaths", self.show_deaths_checkbox),
+            ("time", self.show_time_checkbox),
+        ) if checkbox.isChecked())
+        self._show_seconds = self.show_seconds_checkbox.isChecked()
+        self._show_last_boss = self.show_last_boss_checkbox.isChecked()
+        self._segment_cache.clear()
+
+    def _segment(self, key, inputs, render):
+        """Returns the cached text of a segment, rendering it only when its inputs changed."""
+        cached = self._segment_cache.get(key)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+        text = render(*inputs)
+        self._segment_cache[key] = (inputs, text)
+        return text
+
+    def _format_time(self, seconds):
+        if seconds < 0:
+            return "Time: --:--:--"
+        h, rem = divmod(seconds, 3600)
+        m, s = divmod(rem, 60)
+        time_str = f"{int(h):02d}:{int(m):02d}"
+        if self._show_seconds:
+            time_str += f":{int(s):02d}"
+        return f"Time: {time_str}"
+
+
     def _render_text(self):
         """Interní metoda, která sestaví a zobrazí finální text v overlayi."""
         if not self.last_known_stats:
@@ -146,41 +194,30 @@ class OverlayManager:
 
         parts = []
         stats = self.last_known_stats.get("stats", {})
-        
-        if self.show_bosses_checkbox.isChecked():
-            parts.append(f"Bosses: {stats.get('defeated', '--')}/{stats.get('total', '--')}")
-        if self.show_deaths_checkbox.isChecked():
-            parts.append(f"Deaths: {stats.get('deaths', '--')}")
-        if self.show_time_checkbox.isChecked():
-            # ... (logika pro zobrazení času zůstává stejná)
-            seconds = stats.get('seconds_played', -1)
-            if seconds >= 0:
-                h, rem = divmod(seconds, 3600)
-                m, s = divmod(rem, 60)
-                time_str = f"{int(h):02d}:{int(m):02d}"
-                if self.show_seconds_checkbox.isChecked():
-                    time_str += f":{int(s):02d}"
-                parts.append(f"Time: {time_str}")
+        for key in self._line_template:
+            if key == "bosses":
+                parts.append(self._segment(key, (stats.get('defeated', '--'), stats.get('total', '--')),
+                                           lambda defeated, total: f"Bosses: {defeated}/{total}"))
+            elif key == "deaths":
+                parts.append(self._segment(key, (stats.get('deaths', '--'),), lambda deaths: f"Deaths: {deaths}"))
             else:
-                parts.append("Time: --:--:--")
+                seconds = self.live_seconds_played
+                if seconds is None:
+                    seconds = stats.get('seconds_played', -1)
+                parts.append(self._segment(key, (seconds,), self._format_time))
 
-        
         # Sestavíme první řádek
         final_text = " | ".join(parts)
-        
-        # --- NOVÁ LOGIKA PRO DRUHÝ ŘÁDEK ---
-        if self.show_last_boss_checkbox.isChecked():
+
+        # --- DRUHÝ ŘÁDEK ---
+        if self._show_last_boss:
             last_kill = self.last_known_stats.get("last_kill")
             if last_kill and last_kill.get("name"):
-                boss_name = last_kill["name"]
-                kill_time_str = format_seconds_to_hms(last_kill["time"])
-                
+                kill_line = self._segment("last_kill", (last_kill["name"], last_kill["time"]),
+                                          lambda name, seconds: f"{name} {format_seconds_to_hms(seconds)}")
                 # Pokud je první řádek prázdný, nepřidáváme zbytečný newline
-                if final_text:
-                    final_text += f"\n{boss_name} {kill_time_str}"
-                else:
-                    final_text = f"{boss_name} {kill_time_str}"
-
-        # Pokud je po všem text stále prázdný, zobrazíme výchozí
-        final_text = final_text or "Overlay Active"
-        self.overlay_window.set_text(final_text)
\ No newline at end of file
+                final_text = f"{final_text}\n{kill_line}" if final_text else kill_line
+
+        # Pokud je po všem text stále prázdný, zobrazíme výchozí.
+        # OverlayWindow.set_text nic nedělá, pokud se text nezměnil.
+        self.overlay_window.set_text(final_text or "Overlay Active")
@@ -1,8 +1,24 @@
 # src/overlay_window.py
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtWidgets import QWidget, QApplication
+from PySide6.QtCore import Qt, QPoint, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QStaticText, QTextOption
+
+_BACKGROUND_COLOR = QColor(30, 30, 30, 204)   # Tmavší průhledné pozadí pro lepší čitelnost
+_BORDER_COLOR = QColor("#4C566A")
+_BORDER_RADIUS = 8
+_MARGINS = (10, 5, 10, 5)                      # left, top, right, bottom
+
 
 class OverlayWindow(QWidget):
+    """
+    Frameless always-on-top stats window.
+
+    The text is drawn in paintEvent from a cached QStaticText (its layout is
+    computed once per text change, not per paint). set_text() ignores an
+    unchanged string and only resizes the window when the text's size changes,
+    so the once-per-second timer update normally costs one repaint at most.
+    """
+
     def __init__(self, parent=None, text_color="white", font_size="15pt"):
         super().__init__(parent)
         # Nastavení okna, aby bylo bez rámečků, vždy nahoře a s průhledným pozadím
@@ -16,37 +32,35 @@ class OverlayWindow(QWidget):
 
         self.text_color = text_color
         self.font_size = font_size
+        self.text = ""
+        self.repaints_requested = 0
+        self.unchanged_texts_skipped = 0
 
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(10, 5, 10, 5)
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+        text_option = QTextOption(Qt.AlignmentFlag.AlignHCenter)
+        text_option.setWrapMode(QTextOption.WrapMode.NoWrap)
+        self._static_text.setTextOption(text_option)
+        self._text_pen = QPen(QColor(text_color))
+        self._font = QFont()
 
-        self.label = QLabel("Overlay Active", self)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.main_layout.addWidget(self.label)
-        
-        self.setLayout(self.main_layout)
         self._apply_styles()
+        self.set_text("Overlay Active")
 
         # Uložíme si pozici pro přesouvání myší
         self._drag_pos = QPoint(0,0)
 
     def _apply_styles(self):
-        """Aplikuje aktuální CSS styly na widgety."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba(30, 30, 30, 0.8); /* Tmavší průhledné pozadí pro lepší čitelnost */
-                border: 1px solid #4C566A;
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: {self.text_color};
-                font-size: {self.font_size};
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-            }}
-        """)
-        self.adjustSize() # Přizpůsobí velikost okna obsahu
+        """Aplikuje aktuální barvu a velikost písma a přepočítá rozložení textu."""
+        self._text_pen = QPen(QColor(self.text_color))
+        self._font = QFont(self.font())
+        self._font.setBold(True)
+        try:
+            self._font.setPointSizeF(float(str(self.font_size).lower().removesuffix("pt")))
+        except ValueError:
+            print(f"Invalid overlay font size '{self.font_size}', keeping the default.")
+        self._static_text.prepare(font=self._font)
+        self._update_size()
         self.update()
 
     def update_styles(self, text_color, font_size):
@@ -56,9 +70,42 @@ class OverlayWindow(QWidget):
         self._apply_styles()
 
     def set_text(self, text):
-        """Nastaví zobrazovaný text a přizpůsobí velikost okna."""
-        self.label.setText(text)
-        self.adjustSize()
+        """Nastaví zobrazovaný text; stejný text nic nepřekresluje a velikost se mění jen když je potřeba."""
+        if text == self.text:
+            self.unchanged_texts_skipped += 1
+            return
+        self.text = text
+        # In plain text QStaticText draws "\n" as a space; U+2028 is its line separator.
+        self._static_text.setText(text.replace("\n", "\u2028"))
+        self._static_text.prepare(font=self._font)
+        self._update_size()
+        self.repaints_requested += 1
+        self.update()
+
+    def _update_size(self):
+        text_size = self._static_text.size()
+        left, top, right, bottom = _MARGINS
+        new_size = QSize(int(text_size.width()) + left + right + 2, int(text_size.height()) + top + bottom + 2)
+        if new_size != self.size():
+            self.setFixedSize(new_size)
+
+    def sizeHint(self):
+        return self.size()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(_BORDER_COLOR, 1))
+        painter.setBrush(_BACKGROUND_COLOR)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), _BORDER_RADIUS, _BORDER_RADIUS)
+
+        painter.setFont(self._font)
+        painter.setPen(self._text_pen)
+        left, top, right, _ = _MARGINS
+        text_width = self._static_text.size().width()
+        x = left + 1 + (self.width() - left - right - 2 - text_width) / 2
+        painter.drawStaticText(QPoint(int(x), top + 1), self._static_text)
+        painter.end()
 
     def show_overlay(self):
         """Zobrazí okno vpravo nahoře."""
@@ -0,0 +1,221 @@
+# src/run_history_store.py
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from .app_config import RUN_HISTORY_BATCH_SIZE, RUN_HISTORY_FLUSH_INTERVAL_SEC
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY,
+    save_path TEXT NOT NULL,
+    slot_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    UNIQUE (save_path, slot_index, name)
+);
+CREATE TABLE IF NOT EXISTS kills (
+    id INTEGER PRIMARY KEY,
+    character_id INTEGER NOT NULL REFERENCES characters(id),
+    event_id TEXT NOT NULL,
+    boss_name TEXT,
+    seconds_played INTEGER,
+    recorded_at REAL NOT NULL,
+    UNIQUE (character_id, event_id)
+);
+CREATE TABLE IF NOT EXISTS stat_samples (
+    id INTEGER PRIMARY KEY,
+    character_id INTEGER NOT NULL REFERENCES characters(id),
+    recorded_at REAL NOT NULL,
+    seconds_played INTEGER,
+    deaths INTEGER,
+    character_level INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_kills_character_time ON kills (character_id, seconds_played);
+CREATE INDEX IF NOT EXISTS idx_samples_character_time ON stat_samples (character_id, seconds_played);
+"""
+
+_STOP = object()
+
+
+class RunHistoryStore:
+    """
+    SQLite history of characters, kills and stat samples.
+
+    Callers only enqueue records (cheap, any thread). A writer thread owns the
+    write connection and commits whatever has queued up in one transaction per
+    batch. The database runs in WAL mode, so the query methods can read through
+    their own connections while the writer is busy.
+
+    A character is identified by (save path, slot index, name).
+    """
+
+    def __init__(self, db_path, batch_size=RUN_HISTORY_BATCH_SIZE, flush_interval_sec=RUN_HISTORY_FLUSH_INTERVAL_SEC):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.records_written = 0
+        self.batches_committed = 0
+
+        self._queue = queue.Queue()
+        self._ready = threading.Event()
+        self._init_error = None
+        self._thread = threading.Thread(target=self._run, name="RunHistoryWriter", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._init_error:
+            print(f"Run history disabled: {self._init_error}")
+
+    def is_available(self) -> bool:
+        return self._init_error is None and self._thread.is_alive()
+
+    # --- RECORDING (any thread) ---
+
+    def record_stats(self, character_key, stats: dict):
+        if not self.is_available():
+            return  # nothing would ever drain the queue
+        self._queue.put(("sample", character_key, (
+            time.time(),
+            stats.get("seconds_played"),
+            stats.get("deaths"),
+            stats.get("character_level")
+        )))
+
+    def record_kill(self, character_key, event_id, boss_name, seconds_played):
+        if not self.is_available():
+            return
+        self._queue.put(("kill", character_key, (str(event_id), boss_name, seconds_played, time.time())))
+
+    def close(self):
+        """Writes everything still queued and stops the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    # --- WRITER THREAD ---
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only syncs at checkpoints; a power cut can lose the last batches, not corrupt the file.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            self._init_error = str(e)
+            self._ready.set()
+            return
+        self._ready.set()
+
+        character_ids = {}
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval_sec
+            # Gather more records until the batch is full or the flush interval has passed.
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+            if batch:
+                try:
+                    self._write_batch(conn, batch, character_ids)
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    character_ids.clear()
+                    print(f"Error writing run history: {e}")
+        conn.close()
+
+    def _character_id(self, conn, character_key, character_ids):
+        character_id = character_ids.get(character_key)
+        if character_id is None:
+            save_path, slot_index, name = character_key
+            conn.execute(
+                "INSERT OR IGNORE INTO characters (save_path, slot_index, name, first_seen) VALUES (?, ?, ?, ?)",
+                (save_path, slot_index, name, time.time())
+            )
+            character_id = conn.execute(
+                "SELECT id FROM characters WHERE save_path = ? AND slot_index = ? AND name = ?",
+                character_key
+            ).fetchone()[0]
+            character_ids[character_key] = character_id
+        return character_id
+
+    def _write_batch(self, conn, batch, character_ids):
+        samples = []
+        kills = []
+        with conn:
+            for kind, character_key, values in batch:
+                character_id = self._character_id(conn, character_key, character_ids)
+                (samples if kind == "sample" else kills).append((character_id, *values))
+            if samples:
+                conn.executemany(
+                    "INSERT INTO stat_samples (character_id, recorded_at, seconds_played, deaths, character_level) "
+                    "VALUES (?, ?, ?, ?, ?)", samples)
+            if kills:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO kills (character_id, event_id, boss_name, seconds_played, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?)", kills)
+        self.records_written += len(batch)
+        self.batches_committed += 1
+
+    # --- QUERIES (own read connection, any thread) ---
+
+    def _query(self, sql, params=()):
+        if not os.path.exists(self.db_path):
+            return []
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def get_characters(self):
+        """Returns [(save_path, slot_index, name)] of every character with recorded history."""
+        return self._query("SELECT save_path, slot_index, name FROM characters ORDER BY first_seen")
+
+    def get_deaths_per_hour(self, character_key):
+        """Returns [(hour of play time, deaths during that hour)] from the stat samples."""
+        # Deaths are attributed to the hour of the sample that first showed them.
+        return self._query(
+            """
+            WITH ordered AS (
+                SELECT s.seconds_played, s.deaths,
+                       LAG(s.deaths) OVER (ORDER BY s.seconds_played, s.id) AS previous_deaths
+                FROM stat_samples s JOIN characters c ON c.id = s.character_id
+                WHERE c.save_path = ? AND c.slot_index = ? AND c.name = ?
+                  AND s.seconds_played IS NOT NULL AND s.deaths IS NOT NULL
+            )
+            SELECT seconds_played / 3600 AS hour,
+                   SUM(CASE WHEN deaths > previous_deaths THEN deaths - previous_deaths ELSE 0 END)
+            FROM ordered GROUP BY hour ORDER BY hour
+            """, character_key)
+
+    def get_kill_pace(self, character_key):
+        """Returns [(hour of play time, kills in that hour, kills so far)]."""
+        rows = self._query(
+            """
+            SELECT k.seconds_played / 3600 AS hour, COUNT(*)
+            FROM kills k JOIN characters c ON c.id = k.character_id
+            WHERE c.save_path = ? AND c.slot_index = ? AND c.name = ? AND k.seconds_played IS NOT NULL
+            GROUP BY hour ORDER BY hour
+            """, character_key)
+        pace = []
+        total = 0
+        for hour, kills in rows:
+            total += kills
+            pace.append((hour, kills, total))
+        return pace
@@ -74,4 +74,27 @@ class RustCliHandler:
             
             return json.loads(process.stdout), None
         except Exception as e:
-            return None, f"Error executing get-full-status: {e}"
\ No newline at end of file
+            return None, f"Error executing get-full-status: {e}"
+
+    def get_multi_slot_status(self, save_file_path, event_ids, slot_indexes=None):
+        """
+        Same result shape as SaveReader.get_multi_slot_status. The CLI reads one
+        slot per call, so this is one get-full-status (one process) per slot;
+        the in-process SaveReader parses the file once.
+        """
+        if slot_indexes is None:
+            characters, err = self.list_characters(save_file_path)
+            if err:
+                return None, err
+            slot_indexes = [char_info["slot_index"] for char_info in characters or ()]
+        statuses = {}
+        for slot_index in slot_indexes:
+            data, err = self.get_full_status(save_file_path, slot_index, event_ids)
+            if err:
+                return None, err
+            statuses[slot_index] = data
+        return statuses, None
+
+    def close(self):
+        """Nothing to release; every call runs its own CLI process."""
+        pass
@@ -1,107 +1,289 @@
 # src/save_monitor_logic.py
 import os
-import time
-import json
-import psutil # <--- NEW IMPORT
-from PySide6.QtCore import QObject, Signal, QTimer
-from .rust_cli_handler import RustCliHandler
+from PySide6.QtCore import QObject, Signal, QTimer, QFileSystemWatcher, QThread
 from .boss_data_manager import BossDataManager
-from .app_config import DEFAULT_MONITORING_INTERVAL_SEC
+from .save_monitor_worker import SaveMonitorWorker
+from .app_config import (
+    DEFAULT_MONITORING_INTERVAL_SEC,
+    MONITORING_MODE,
+    SAVE_WATCH_DEBOUNCE_MS,
+    SAVE_STAT_POLL_INTERVAL_MS
+)
 
 class SaveMonitorLogic(QObject):
     monitoring_started = Signal(str, int)
     monitoring_stopped = Signal()
-    stats_updated = Signal(dict)
+    stats_updated = Signal(dict, object) # (payload, StatusDelta)
     boss_defeated = Signal(str, int)
     game_process_status = Signal(bool) # <--- NEW SIGNAL (is_running)
-    
-    def __init__(self, rust_cli_handler: RustCliHandler, boss_data_manager: BossDataManager, parent=None):
+    characters_loaded = Signal(str, object, str) # (save path, characters or None, error)
+
+    # Requests to the worker thread (queued connections).
+    _reset_requested = Signal(int)
+    _process_check_requested = Signal(int, bool, str, int, object)
+    _read_requested = Signal(int, str, int, object)
+    _character_list_requested = Signal(int, str)
+
+    def __init__(self, save_backend, boss_data_manager: BossDataManager, parent=None, run_history=None):
+        """
+        `save_backend` is a RustCliHandler or SaveReader (see create_save_backend).
+        `run_history` is an optional RunHistoryStore that receives stat samples and kills.
+        """
         super().__init__(parent)
-        self.rust_cli = rust_cli_handler
+        self.save_backend = save_backend
         self.boss_data_manager = boss_data_manager
-        
+        self.run_history = run_history
+
         self.monitoring_timer = QTimer(self)
         self.monitoring_timer.timeout.connect(self.on_monitoring_timeout)
         self.monitoring_interval_sec = DEFAULT_MONITORING_INTERVAL_SEC
-        
+        self.monitoring_mode = MONITORING_MODE
+
+        # --- WORKER THREAD ---
+        # Process detection, extraction and diffing never run on the GUI thread.
+        self.worker_thread = QThread(self)
+        self.worker = SaveMonitorWorker(save_backend)
+        self.worker.moveToThread(self.worker_thread)
+        self._reset_requested.connect(self.worker.reset)
+        self._process_check_requested.connect(self.worker.check_game_process)
+        self._read_requested.connect(self.worker.read_status)
+        self._character_list_requested.connect(self.worker.list_characters)
+        self.worker.process_checked.connect(self._on_process_checked)
+        self.worker.status_read.connect(self._on_status_read)
+        self.worker.read_finished.connect(self._on_read_finished)
+        self.worker.characters_listed.connect(self._on_characters_listed)
+        self.worker_thread.start()
+
+        self.generation = 0
+        self._read_in_flight = False
+        self._read_pending = False
+        # --- END WORKER THREAD ---
+
+        # --- WATCH MODE ---
+        # File system notifications (or a cheap stat poll as fallback) start the
+        # debounce timer; the save is parsed once its mtime/size stop changing.
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self._on_save_file_event)
+        self.file_watcher.directoryChanged.connect(self._on_save_file_event)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(SAVE_WATCH_DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self._on_debounce_timeout)
+
+        self.stat_poll_timer = QTimer(self)
+        self.stat_poll_timer.setInterval(SAVE_STAT_POLL_INTERVAL_MS)
+        self.stat_poll_timer.timeout.connect(self._poll_save_file_stat)
+
+        self._settle_stat = None     # (mtime_ns, size) when the last change was seen
+        self._last_read_stat = None  # (mtime_ns, size) of the last successfully parsed save
+        self._read_stat = None       # (mtime_ns, size) taken before the running read was queued
+        # --- END WATCH MODE ---
+
         self.current_save_file_path = ""
         self.current_slot_index = -1
+        self.current_character_name = ""
         self.last_known_data = None
         self.game_process_is_running = False # <--- NEW STATE VARIABLE
 
-    def _is_game_running(self):
-        """Checks if eldenring.exe is a running process."""
-        for proc in psutil.process_iter(['name']):
-            if proc.info['name'].lower() == "eldenring.exe":
-                return True
-        return False
+    @property
+    def change_detector(self):
+        return self.worker.change_detector
+
+    def _next_generation(self):
+        """Invalidates every queued or running worker job."""
+        self.generation += 1
+        self.worker.current_generation = self.generation
+        self._read_in_flight = False
+        self._read_pending = False
+        self._read_stat = None
+        return self.generation
 
     def start_monitoring(self, save_file_path: str, slot_index: int, character_name: str):
         self.stop_monitoring()
         self.current_save_file_path = save_file_path
         self.current_slot_index = slot_index
-        
+        self.current_character_name = character_name
+        generation = self._next_generation()
+        self._reset_requested.emit(generation)
+
+        if self.monitoring_mode == "watch":
+            self._start_watching()
+        # The first read always runs so the UI gets the character's data right away.
+        self._request_read()
         self.on_monitoring_timeout()
-        
+
         self.monitoring_timer.start(self.monitoring_interval_sec * 1000)
         self.monitoring_started.emit(character_name, self.monitoring_interval_sec)
 
     def stop_monitoring(self):
+        self._stop_watching()
         if self.monitoring_timer.isActive():
             self.monitoring_timer.stop()
+            self._next_generation()
             self.current_slot_index = -1
             self.last_known_data = None
+            counters = self.change_detector.get_counters()
+            print(f"Monitoring stopped. Skipped {counters['skipped']}/{counters['checked']} unchanged save checks.")
             self.monitoring_stopped.emit()
 
+    def shutdown(self):
+        """Stops monitoring and the worker thread; call before the application exits."""
+        self.stop_monitoring()
+        self._next_generation()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+
+    def request_character_list(self, save_file_path: str):
+        """Lists characters on the worker thread; the result arrives via characters_loaded."""
+        self._character_list_requested.emit(self.generation, save_file_path)
+
     def on_monitoring_timeout(self):
-        """Loads full data from the file and compares it."""
-        # --- NEW PROCESS CHECK ---
-        is_running = self._is_game_running()
-        if is_running != self.game_process_is_running:
-            self.game_process_is_running = is_running
-            self.game_process_status.emit(is_running)
-        
-        # If the game isn't running, we don't need to read the save file
-        if not is_running:
-            return
-        # --- END NEW PROCESS CHECK ---
+        """Checks the game process; in poll mode the worker also reads the save if the game runs."""
+        if self.monitoring_mode == "watch":
+            # Retries a save version whose read failed; the file watcher only reports new writes.
+            self._poll_save_file_stat()
+        read_if_running = self.monitoring_mode != "watch" and not self._read_in_flight
+        if read_if_running:
+            self._read_in_flight = True
+        self._process_check_requested.emit(
+            self.generation,
+            read_if_running,
+            self.current_save_file_path,
+            self.current_slot_index,
+            self.boss_data_manager.get_all_event_ids_to_monitor()
+        )
 
+    def _request_read(self):
+        """Queues a read, coalescing requests while one is already running."""
         if self.current_slot_index == -1:
             return
-
-        all_event_ids = self.boss_data_manager.get_all_event_ids_to_monitor()
-        if not all_event_ids:
+        if self._read_in_flight:
+            self._read_pending = True
             return
-
-        new_data, err = self.rust_cli.get_full_status(
+        self._read_in_flight = True
+        self._read_stat = self._stat_save_file() if self.monitoring_mode == "watch" else None
+        self._read_requested.emit(
+            self.generation,
             self.current_save_file_path,
             self.current_slot_index,
-            all_event_ids
+            self.boss_data_manager.get_all_event_ids_to_monitor()
         )
 
-        if err or new_data is None:
-            print(f"Monitoring Error: {err or 'No data returned'}")
+    # --- WORKER RESULTS (GUI thread) ---
+
+    def _on_process_checked(self, generation, is_running):
+        if generation != self.generation:
+            return
+        if is_running != self.game_process_is_running:
+            self.game_process_is_running = is_running
+            self.game_process_status.emit(is_running)
+
+    def _on_status_read(self, generation, new_data, delta):
+        if generation != self.generation:
             return
 
         # Check for newly defeated bosses before emitting the general update
-        if self.last_known_data:
-            old_statuses = self.last_known_data.get("boss_statuses", {})
-            new_statuses = new_data.get("boss_statuses", {})
+        if not delta.is_initial:
             current_play_time = new_data.get("stats", {}).get("seconds_played", 0)
+            for boss_id in delta.flags_set:
+                # We emit the ID and let the GUI find the name.
+                self.boss_defeated.emit(boss_id, current_play_time)
+
+        if self.run_history is not None:
+            self._record_history(new_data, delta)
+
+        print(f"Change detected in save data. Emitting update: {delta}")
+        self.last_known_data = new_data
+        self.stats_updated.emit(new_data, delta)
+
+    def _record_history(self, new_data, delta):
+        """Queues a stat sample (when stats moved) and live kills; the store writes them on its own thread."""
+        character_key = (self.current_save_file_path, self.current_slot_index, self.current_character_name)
+        stats = new_data.get("stats", {})
+        if delta.is_initial or delta.stats_changed:
+            self.run_history.record_stats(character_key, stats)
+        if delta.is_initial:
+            return  # Flags that were already set have no known kill time.
+        for boss_id in delta.flags_set:
+            entry = self.boss_data_manager.get_boss_by_event_id(boss_id)
+            boss_name = entry[1].get("name") if entry else None
+            self.run_history.record_kill(character_key, boss_id, boss_name, stats.get("seconds_played"))
+
+    def _on_read_finished(self, generation, ok):
+        if generation != self.generation:
+            return
+        self._read_in_flight = False
+        if ok and self._read_stat is not None:
+            # Only a successful read marks this version of the save as seen; a failed one is read again.
+            self._last_read_stat = self._read_stat
+        self._read_stat = None
+        if self._read_pending:
+            self._read_pending = False
+            self._request_read()
+
+    def _on_characters_listed(self, generation, save_file_path, characters, err):
+        if generation != self.generation:
+            return
+        if err:
+            print(f"Failed to list characters: {err}")
+        self.characters_loaded.emit(save_file_path, characters, err)
+
+    # --- WATCH MODE ---
+
+    def _stat_save_file(self):
+        try:
+            st = os.stat(self.current_save_file_path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _start_watching(self):
+        # Nothing is read yet; the forced first read in start_monitoring sets _last_read_stat.
+        self._last_read_stat = None
+        self._settle_stat = self._stat_save_file()
+        save_dir = os.path.dirname(self.current_save_file_path)
+        # The directory is watched too: a save replaced via rename drops the file watch.
+        watching_file = self.file_watcher.addPath(self.current_save_file_path)
+        if save_dir:
+            self.file_watcher.addPath(save_dir)
+        if not watching_file:
+            print("File system watcher unavailable for the save file. Falling back to stat polling.")
+            self.stat_poll_timer.start()
+
+    def _stop_watching(self):
+        self.debounce_timer.stop()
+        self.stat_poll_timer.stop()
+        watched = self.file_watcher.files() + self.file_watcher.directories()
+        if watched:
+            self.file_watcher.removePaths(watched)
+
+    def _on_save_file_event(self, path=""):
+        """A change was seen; (re)start the debounce window."""
+        if self.current_slot_index == -1:
+            return
+        if self.current_save_file_path not in self.file_watcher.files() and os.path.exists(self.current_save_file_path):
+            self.file_watcher.addPath(self.current_save_file_path)
+        self._settle_stat = self._stat_save_file()
+        self.debounce_timer.start()
+
+    def _poll_save_file_stat(self):
+        if self.debounce_timer.isActive():
+            return
+        if self._stat_save_file() != self._last_read_stat:
+            self._on_save_file_event(self.current_save_file_path)
+
+    def _on_debounce_timeout(self):
+        current_stat = self._stat_save_file()
+        if current_stat is None:
+            return
+        if current_stat != self._settle_stat:
+            # Still being written; wait for another quiet window.
+            self._settle_stat = current_stat
+            self.debounce_timer.start()
+            return
+        if current_stat == self._last_read_stat:
+            return
+        self._request_read()
 
-            for boss_id, is_defeated in new_statuses.items():
-                # If the boss is now defeated but wasn't before
-                if is_defeated and not old_statuses.get(boss_id, False):
-                    # We need to find the boss name from its ID.
-                    # This is a bit tricky here. We will emit the ID and let the GUI find the name.
-                    self.boss_defeated.emit(boss_id, current_play_time)
-
-        # --- ROBUST COMPARISON FIX ---
-        # Convert dictionaries to sorted JSON strings for a reliable, order-independent comparison.
-        new_data_str = json.dumps(new_data, sort_keys=True)
-        last_data_str = json.dumps(self.last_known_data, sort_keys=True) if self.last_known_data else ""
-
-        if new_data_str != last_data_str:
-            print("Change detected in save data. Emitting update.")
-            self.last_known_data = new_data
-            self.stats_updated.emit(new_data)
\ No newline at end of file
+    # --- END WATCH MODE ---
@@ -0,0 +1,93 @@
+# src/save_monitor_worker.py
+from PySide6.QtCore import QObject, Signal, Slot
+
+from .game_process_tracker import GameProcessTracker
+from .save_change_detector import SaveChangeDetector
+from .status_delta import compute_status_delta
+
+
+class SaveMonitorWorker(QObject):
+    """
+    Runs everything that blocks (process scan, change detection, extraction and
+    diffing) on SaveMonitorLogic's worker thread. Results go back through queued
+    signals.
+
+    Every job carries the generation it was requested for. SaveMonitorLogic bumps
+    `current_generation` when the character or save changes. Jobs still waiting in
+    the queue are then skipped, and a read already in flight has its result dropped.
+    """
+    process_checked = Signal(int, bool)                 # generation, is_running
+    status_read = Signal(int, dict, object)             # generation, payload, StatusDelta
+    read_finished = Signal(int, bool)                   # generation, save read (or unchanged) without error
+    characters_listed = Signal(int, str, object, str)   # generation, path, characters, error
+
+    def __init__(self, save_backend):
+        super().__init__()
+        self.save_backend = save_backend
+        self.change_detector = SaveChangeDetector()
+        self.process_tracker = GameProcessTracker()
+        self.last_known_data = None
+        # Written from the GUI thread; a plain int store is atomic.
+        self.current_generation = 0
+
+    def _is_current(self, generation):
+        return generation == self.current_generation
+
+    @Slot(int)
+    def reset(self, generation):
+        """Forgets the previous payload so the next read produces an initial delta."""
+        if not self._is_current(generation):
+            return
+        self.last_known_data = None
+        self.change_detector.reset()
+
+    @Slot(int, bool, str, int, object)
+    def check_game_process(self, generation, read_if_running, save_file_path, slot_index, event_ids):
+        if not self._is_current(generation):
+            return
+        is_running = self.process_tracker.is_running()
+        self.process_checked.emit(generation, is_running)
+        if not read_if_running:
+            return
+        if is_running:
+            self.read_status(generation, save_file_path, slot_index, event_ids)
+        else:
+            # If the game isn't running, we don't need to read the save file
+            self.read_finished.emit(generation, False)
+
+    @Slot(int, str, int, object)
+    def read_status(self, generation, save_file_path, slot_index, event_ids):
+        ok = False
+        try:
+            ok = self._read_status(generation, save_file_path, slot_index, event_ids)
+        finally:
+            self.read_finished.emit(generation, ok)
+
+    def _read_status(self, generation, save_file_path, slot_index, event_ids):
+        """Returns True when the save was read, or skipped as unchanged since the last read."""
+        if not self._is_current(generation) or slot_index == -1 or not event_ids:
+            return False
+        if not self.change_detector.needs_read(save_file_path, slot_index):
+            return True
+
+        new_data, err = self.save_backend.get_full_status(save_file_path, slot_index, event_ids)
+        if not self._is_current(generation):
+            return False  # Cancelled while the extractor was running.
+        if err or new_data is None:
+            print(f"Monitoring Error: {err or 'No data returned'}")
+            return False
+        self.change_detector.mark_read()
+
+        # One pass over stats and flags replaces the old JSON string comparison.
+        delta = compute_status_delta(self.last_known_data, new_data)
+        if not delta.is_empty():
+            self.last_known_data = new_data
+            self.status_read.emit(generation, new_data, delta)
+        return True
+
+    @Slot(int, str)
+    def list_characters(self, generation, save_file_path):
+        if not self._is_current(generation):
+            return
+        characters, err = self.save_backend.list_characters(save_file_path)
+        self.characters_listed.emit(generation, save_file_path, characters, err or "")
@@ -0,0 +1,310 @@
+# src/save_reader.py
+import os
+import mmap
+import struct
+
+from .app_config import EVENT_FLAG_BST_FILENAME
+from .rust_cli_handler import RustCliHandler
+
+# --- BND4 container ---
+BND4_MAGIC = b"BND4"
+BND4_FILE_COUNT_OFFSET = 0x0C
+BND4_ENTRY_HEADERS_OFFSET = 0x40
+BND4_ENTRY_HEADER_SIZE = 0x20
+BND4_ENTRY_SIZE_OFFSET = 0x08          # i64, inside an entry header
+BND4_ENTRY_DATA_OFFSET = 0x10          # u32, inside an entry header
+
+# Every entry starts with an MD5 checksum of its data.
+ENTRY_CHECKSUM_SIZE = 0x10
+CHARACTER_SLOT_COUNT = 10
+USER_DATA_10_INDEX = 10
+
+# --- USER_DATA_10 (profile summaries shown on the load screen) ---
+PROFILE_ACTIVE_FLAGS_OFFSET = 0x1954
+PROFILE_SUMMARIES_OFFSET = 0x195E
+PROFILE_SUMMARY_SIZE = 0x24C
+PROFILE_NAME_SIZE = 0x22               # 16 UTF-16 chars + terminator
+PROFILE_LEVEL_OFFSET = 0x22
+PROFILE_SECONDS_PLAYED_OFFSET = 0x26
+
+# --- Character slot ---
+SLOT_HEADER_SIZE = 0x20                # version, map id, unknown block
+SLOT_GAITEM_COUNT = 0x1400
+SLOT_GAITEM_COUNT_OLD = 0x13FE         # slot versions <= 81
+GAITEM_BASE_SIZE = 8                   # handle + item id
+GAITEM_WEAPON_EXTRA = 13
+GAITEM_ARMOR_EXTRA = 8
+GAITEM_TYPE_MASK = 0xF0000000
+GAITEM_TYPE_WEAPON = 0x80000000
+GAITEM_TYPE_ARMOR = 0x90000000
+
+# Fixed-size sections between the gaitem map and the projectile list.
+SLOT_SECTIONS_AFTER_GAITEMS = (
+    0x1B0,                             # player game data
+    0xD0,                              # active special effects
+    0x58 + 0x1C + 0x58 + 0x58,         # equipment indexes, arm style, item ids, gaitem handles
+    4 + 0xA80 * 0xC + 4 + 0x180 * 0xC + 4 + 4,  # held inventory
+    0x74 + 0x8C + 0x18,                # equipped spells, quick items, gestures
+)
+PROJECTILE_ENTRY_SIZE = 8
+# Fixed-size sections between the projectile list and the unlocked regions list.
+SLOT_SECTIONS_AFTER_PROJECTILES = (
+    0x9C + 0xC,                        # equipped armaments/items, physick
+    0x12F,                             # face data
+    4 + 0x780 * 0xC + 4 + 0x80 * 0xC + 4 + 4,   # storage box inventory
+    0x100,                             # gestures
+)
+REGION_ENTRY_SIZE = 4
+# Fixed-size sections between the unlocked regions list and the death counter.
+SLOT_SECTIONS_AFTER_REGIONS = (
+    0x28,                              # torrent
+    0x1,                               # control byte
+    0x44,                              # blood stain
+    0x4 + 0x4,                         # unknown
+    0x1008,                            # menu profile
+    0x34,                              # trophy equip data
+    0x8 + 0x1B58 * 0x10,               # gaitem game data
+    0x408,                             # tutorial data
+    0x3,                               # game manager bytes
+)
+# Death counter is followed by these fields before the event flags start.
+DEATHS_TO_EVENT_FLAGS = 0x4 + 0x4 + 0x1 + 0x4 + 0x4 + 0x1 + 0x4 + 0x4
+EVENT_FLAGS_SIZE = 0x1BF99F
+EVENT_FLAG_BLOCK_SIZE = 0x7D           # 1000 flags per block
+
+
+class SaveFormatError(Exception):
+    pass
+
+
+class SaveReader:
+    """
+    In-process reader for Elden Ring .sl2 saves.
+
+    The file is memory-mapped only for the duration of a call, so the game can
+    keep writing it. Only the BND4 headers, USER_DATA_10 summaries and the
+    requested slot are touched. Return values match RustCliHandler.
+
+    The monitor keeps one reader for the whole session: the event flag table
+    and the bit positions of the last event ID list are resolved once and
+    reused by every tick until the list changes.
+    """
+
+    def __init__(self, bst_filename=EVENT_FLAG_BST_FILENAME, event_flag_bst=None):
+        self.bst_filename = bst_filename
+        # {block: index}; loaded lazily from data/<bst_filename> unless given.
+        self._event_flag_bst = event_flag_bst
+        # (bst, tuple of event IDs, flag positions) of the last status call
+        self._flag_positions_cache = None
+
+    def is_available(self):
+        """The reader needs the event flag block table (data/<bst_filename>) to resolve any flag."""
+        return self._event_flag_bst is not None or os.path.isfile(self._get_bst_path())
+
+    def close(self):
+        pass
+
+    # --- Event flag block table ---
+
+    def _get_bst_path(self):
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(script_dir)
+        return os.path.join(project_root, "data", self.bst_filename)
+
+    def _load_event_flag_bst(self):
+        """Loads 'block,index' pairs that map event flag blocks to their position in the slot."""
+        if self._event_flag_bst is not None:
+            return self._event_flag_bst
+        path = self._get_bst_path()
+        table = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                block, index = line.split(",")
+                table[int(block)] = int(index)
+        self._event_flag_bst = table
+        return table
+
+    # --- Container helpers ---
+
+    @staticmethod
+    def _open_view(save_file_path):
+        with open(save_file_path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def get_entry_range(view, entry_index):
+        """Returns (start, end) of a BND4 entry's data, checksum excluded."""
+        if view[:4] != BND4_MAGIC:
+            raise SaveFormatError("Not a BND4 save file.")
+        (file_count,) = struct.unpack_from("<i", view, BND4_FILE_COUNT_OFFSET)
+        if not 0 <= entry_index < file_count:
+            raise SaveFormatError(f"Save file has no entry {entry_index}.")
+        header = BND4_ENTRY_HEADERS_OFFSET + entry_index * BND4_ENTRY_HEADER_SIZE
+        (size,) = struct.unpack_from("<q", view, header + BND4_ENTRY_SIZE_OFFSET)
+        (data_offset,) = struct.unpack_from("<I", view, header + BND4_ENTRY_DATA_OFFSET)
+        if data_offset + size > len(view):
+            raise SaveFormatError(f"Entry {entry_index} extends past the end of the file.")
+        return data_offset + ENTRY_CHECKSUM_SIZE, data_offset + size
+
+    def _read_profiles(self, view):
+        user_data_start, _ = self.get_entry_range(view, USER_DATA_10_INDEX)
+        active_flags = view[user_data_start + PROFILE_ACTIVE_FLAGS_OFFSET:
+                            user_data_start + PROFILE_ACTIVE_FLAGS_OFFSET + CHARACTER_SLOT_COUNT]
+        profiles = []
+        for slot_index in range(CHARACTER_SLOT_COUNT):
+            if not active_flags[slot_index]:
+                continue
+            base = user_data_start + PROFILE_SUMMARIES_OFFSET + slot_index * PROFILE_SUMMARY_SIZE
+            raw_name = view[base:base + PROFILE_NAME_SIZE]
+            name = raw_name.decode('utf-16-le', errors='ignore').split("\x00", 1)[0]
+            (level,) = struct.unpack_from("<I", view, base + PROFILE_LEVEL_OFFSET)
+            (seconds_played,) = struct.unpack_from("<I", view, base + PROFILE_SECONDS_PLAYED_OFFSET)
+            profiles.append({
+                "slot_index": slot_index,
+                "character_name": name,
+                "character_level": level,
+                "seconds_played": seconds_played,
+            })
+        return profiles
+
+    @staticmethod
+    def _find_deaths_offset(view, slot_start):
+        """Walks the variable-length parts of a slot and returns the death counter position."""
+        (version,) = struct.unpack_from("<I", view, slot_start)
+        gaitem_count = SLOT_GAITEM_COUNT_OLD if version <= 81 else SLOT_GAITEM_COUNT
+        pos = slot_start + SLOT_HEADER_SIZE
+        unpack_u32 = struct.Struct("<I").unpack_from
+        for _ in range(gaitem_count):
+            (handle,) = unpack_u32(view, pos)
+            pos += GAITEM_BASE_SIZE
+            if handle != 0:
+                item_type = handle & GAITEM_TYPE_MASK
+                if item_type == GAITEM_TYPE_WEAPON:
+                    pos += GAITEM_WEAPON_EXTRA
+                elif item_type == GAITEM_TYPE_ARMOR:
+                    pos += GAITEM_ARMOR_EXTRA
+
+        pos += sum(SLOT_SECTIONS_AFTER_GAITEMS)
+        (projectile_count,) = unpack_u32(view, pos)
+        pos += 4 + projectile_count * PROJECTILE_ENTRY_SIZE
+        pos += sum(SLOT_SECTIONS_AFTER_PROJECTILES)
+        (region_count,) = unpack_u32(view, pos)
+        pos += 4 + region_count * REGION_ENTRY_SIZE
+        pos += sum(SLOT_SECTIONS_AFTER_REGIONS)
+        return pos
+
+    # --- Public API (same shapes as RustCliHandler) ---
+
+    def list_characters(self, save_file_path):
+        try:
+            view = self._open_view(save_file_path)
+        except (OSError, ValueError) as e:
+            return None, f"Error opening save file: {e}"
+        try:
+            return self._read_profiles(view), None
+        except (SaveFormatError, struct.error) as e:
+            return None, f"Error reading characters: {e}"
+        finally:
+            view.close()
+
+    @staticmethod
+    def _flag_positions(bst, event_ids):
+        """(payload key, byte offset from the event flags start, bit mask) per event ID; None = unknown block."""
+        positions = []
+        for eid in event_ids:
+            eid = int(eid)
+            block_index = bst.get(eid // 1000)
+            if block_index is None:
+                positions.append((str(eid), None, 0))
+                continue
+            remainder = eid % 1000
+            positions.append((str(eid), block_index * EVENT_FLAG_BLOCK_SIZE + remainder // 8, 1 << (7 - remainder % 8)))
+        return positions
+
+    def _cached_flag_positions(self, bst, event_ids):
+        """_flag_positions of the last event ID list; a new list (e.g. content filter switch) replaces it."""
+        event_ids = tuple(event_ids)
+        cached = self._flag_positions_cache
+        if cached is not None and cached[0] is bst and cached[1] == event_ids:
+            return cached[2]
+        positions = self._flag_positions(bst, event_ids)
+        self._flag_positions_cache = (bst, event_ids, positions)
+        return positions
+
+    def _read_slot_status(self, view, profile, flag_positions):
+        """Reads deaths and flags of one populated slot. Raises SaveFormatError / struct.error / IndexError."""
+        slot_index = profile["slot_index"]
+        slot_start, slot_end = self.get_entry_range(view, slot_index)
+        deaths_offset = self._find_deaths_offset(view, slot_start)
+        flags_start = deaths_offset + DEATHS_TO_EVENT_FLAGS
+        if flags_start + EVENT_FLAGS_SIZE > slot_end:
+            raise SaveFormatError(f"Event flags of slot {slot_index} fall outside the slot.")
+        (deaths,) = struct.unpack_from("<I", view, deaths_offset)
+
+        boss_statuses = {}
+        for key, offset, mask in flag_positions:
+            boss_statuses[key] = offset is not None and bool(view[flags_start + offset] & mask)
+
+        stats = {
+            "character_name": profile["character_name"],
+            "character_level": profile["character_level"],
+            "seconds_played": profile["seconds_played"],
+            "deaths": deaths,
+        }
+        return {"stats": stats, "boss_statuses": boss_statuses}
+
+    def get_full_status(self, save_file_path, slot_index, event_ids):
+        statuses, err = self.get_multi_slot_status(save_file_path, event_ids, [slot_index])
+        if err:
+            return None, err
+        if slot_index not in statuses:
+            return None, f"Slot {slot_index} is empty."
+        return statuses[slot_index], None
+
+    def get_multi_slot_status(self, save_file_path, event_ids, slot_indexes=None):
+        """
+        Reads several slots in one pass: the file is mapped and the profiles
+        parsed once, the event flag positions come from the cache. `slot_indexes`
+        None means every populated slot. Returns ({slot_index: payload}, None) or (None, error);
+        empty slots are left out, a slot that can't be read fails the whole call.
+        """
+        if not event_ids:
+            return None, "No event IDs provided for status check."
+        try:
+            bst = self._load_event_flag_bst()
+        except (OSError, ValueError) as e:
+            return None, f"Event flag table '{self.bst_filename}' could not be loaded: {e}"
+        try:
+            view = self._open_view(save_file_path)
+        except (OSError, ValueError) as e:
+            return None, f"Error opening save file: {e}"
+
+        flag_positions = self._cached_flag_positions(bst, event_ids)
+        wanted = None if slot_indexes is None else set(slot_indexes)
+        statuses = {}
+        slot_index = None
+        try:
+            for profile in self._read_profiles(view):
+                slot_index = profile["slot_index"]
+                if wanted is None or slot_index in wanted:
+                    statuses[slot_index] = self._read_slot_status(view, profile, flag_positions)
+        except (SaveFormatError, struct.error, IndexError) as e:
+            return None, f"Error reading slot {slot_index}: {e}"
+        finally:
+            view.close()
+        return statuses, None
+
+
+def create_save_backend(backend_name, cli_path_placeholder):
+    """Returns the configured save backend; both expose list_characters/get_full_status."""
+    if backend_name == "python":
+        reader = SaveReader()
+        if reader.is_available():
+            print("Using the in-process Python save reader.")
+            return reader
+        print(f"ERROR: Event flag table '{reader._get_bst_path()}' not found; "
+              f"the Python save reader can't resolve boss flags. Falling back to the Rust CLI.")
+    return RustCliHandler(cli_path_placeholder)
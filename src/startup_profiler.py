@@ -0,0 +1,79 @@
+# src/startup_profiler.py
+import json
+import time
+from contextlib import contextmanager
+
+# Taken when gui.py imports this module first, so "imports" covers the app's own imports.
+_IMPORT_TIME = time.perf_counter()
+
+
+class StartupProfiler:
+    """
+    Records how long the startup phases take (imports, definitions load, UI build,
+    first paint, first save read).
+
+    Phases are timed with phase() or record_since_start(); mark() stores a
+    milestone as the time since this module was imported. Recording is always
+    on and costs a perf_counter() call; finish() only prints / saves the report
+    when main() enabled it with --profile-startup.
+    """
+
+    def __init__(self, clock=time.perf_counter, start=_IMPORT_TIME):
+        self._clock = clock
+        self._start = start
+        self.phases = []      # (name, duration in seconds)
+        self.marks = {}       # milestone name -> seconds since start
+        self.enabled = False
+        self.output_path = None
+        self.finished = False
+
+    def enable(self, output_path=None):
+        self.enabled = True
+        self.output_path = output_path
+
+    @contextmanager
+    def phase(self, name):
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.phases.append((name, self._clock() - started))
+
+    def record_since_start(self, name):
+        """Records a phase that began when the profiler was imported (e.g. the imports)."""
+        self.phases.append((name, self._clock() - self._start))
+
+    def mark(self, name):
+        """Stores a milestone once; later calls with the same name are ignored."""
+        if name not in self.marks:
+            self.marks[name] = self._clock() - self._start
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for name, duration in self.phases:
+            lines.append(f"  {name:<24} {duration * 1000:8.1f} ms")
+        for name, offset in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  @ {name:<22} {offset * 1000:8.1f} ms after start")
+        return "\n".join(lines)
+
+    def finish(self):
+        """Prints the report and appends it as one JSON line to output_path (if enabled, once)."""
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        print(self.report())
+        if not self.output_path:
+            return
+        record = {
+            "timestamp": time.time(),
+            "phases_ms": {name: round(duration * 1000, 2) for name, duration in self.phases},
+            "marks_ms": {name: round(offset * 1000, 2) for name, offset in self.marks.items()},
+        }
+        try:
+            with open(self.output_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"Could not write startup profile to {self.output_path}: {e}")
+
+
+startup_profiler = StartupProfiler()
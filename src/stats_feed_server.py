@@ -0,0 +1,220 @@
+# src/stats_feed_server.py
+import asyncio
+import json
+import threading
+
+from .app_config import (
+    STATS_FEED_HOST,
+    STATS_FEED_PORT,
+    STATS_FEED_CLIENT_QUEUE_SIZE,
+    STATS_FEED_KEEPALIVE_SEC
+)
+
+_MISSING = object()
+_CLOSE = None   # queued to a client to end its stream
+
+
+def _sse_message(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode('utf-8')
+
+
+def _http_response(status, content_type, body):
+    head = (f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Connection: close\r\n\r\n")
+    return head.encode('ascii') + body
+
+
+class StatsFeedServer:
+    """
+    Localhost HTTP feed of the stats payload built by handle_stats_update.
+
+    GET /stats   JSON snapshot: {"seq", "stats", "last_kill"}
+    GET /events  Server-Sent Events: one "snapshot" event on connect, then a
+                 "delta" event with only the changed fields for every update.
+
+    The server runs on its own asyncio loop in a daemon thread. publish() can be
+    called from any thread. Every delta is encoded once and queued to each
+    client. A client whose queue fills up is disconnected; when it reconnects it
+    gets a fresh snapshot.
+    """
+
+    def __init__(self, host=STATS_FEED_HOST, port=STATS_FEED_PORT,
+                 client_queue_size=STATS_FEED_CLIENT_QUEUE_SIZE, keepalive_sec=STATS_FEED_KEEPALIVE_SEC):
+        self.host = host
+        self.port = port
+        self.client_queue_size = client_queue_size
+        self.keepalive_sec = keepalive_sec
+        self.deltas_published = 0
+        self.clients_dropped = 0
+
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._clients = {}   # asyncio.Queue -> StreamWriter (event loop thread only)
+        self._connection_tasks = set()
+        self._snapshot = {"seq": 0, "stats": {}, "last_kill": None}
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    def start(self):
+        """Starts the server thread. Returns (True, None) or (False, error message)."""
+        if self._thread is not None:
+            return True, None
+        started = threading.Event()
+        errors = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._server = loop.run_until_complete(
+                    asyncio.start_server(self._handle_connection, self.host, self.port))
+            except OSError as e:
+                errors.append(str(e))
+                loop.close()
+                started.set()
+                return
+            # Port 0 picks a free port; report the real one.
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._loop = loop
+            started.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.run_until_complete(self._shutdown())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="StatsFeedServer", daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            self._thread = None
+            print(f"Stats feed could not start on {self.host}:{self.port}: {errors[0]}")
+            return False, errors[0]
+        print(f"Stats feed running at http://{self.host}:{self.port}/stats and /events")
+        return True, None
+
+    def stop(self):
+        if self._thread is None:
+            return
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
+
+    def publish(self, payload: dict):
+        """Takes the stats payload (stats + last_kill); boss_statuses are not part of the feed."""
+        if self._loop is None:
+            return
+        stats = dict(payload.get("stats", {}))
+        last_kill = payload.get("last_kill")
+        last_kill = dict(last_kill) if last_kill else None
+        self._loop.call_soon_threadsafe(self._apply_update, stats, last_kill)
+
+    # --- EVENT LOOP THREAD ---
+
+    def _apply_update(self, stats, last_kill):
+        old_stats = self._snapshot["stats"]
+        changed = {key: value for key, value in stats.items() if old_stats.get(key, _MISSING) != value}
+        for key in old_stats.keys() - stats.keys():
+            changed[key] = None
+        kill_changed = last_kill != self._snapshot["last_kill"]
+        if not changed and not kill_changed:
+            return
+
+        seq = self._snapshot["seq"] + 1
+        self._snapshot = {"seq": seq, "stats": stats, "last_kill": last_kill}
+        delta = {"seq": seq, "stats": changed}
+        if kill_changed:
+            delta["last_kill"] = last_kill
+        message = _sse_message("delta", delta)
+        self.deltas_published += 1
+
+        for client_queue in list(self._clients):
+            try:
+                client_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._drop_client(client_queue)
+
+    def _drop_client(self, client_queue):
+        writer = self._clients.pop(client_queue, None)
+        if writer is not None:
+            self.clients_dropped += 1
+            writer.transport.abort()
+
+    async def _handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self._connection_tasks.add(task)
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=10)
+            while True:
+                header_line = await asyncio.wait_for(reader.readline(), timeout=10)
+                if header_line in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode('latin-1').split()
+            method, path = (parts[0], parts[1].split('?', 1)[0]) if len(parts) >= 2 else ("", "")
+
+            if method != "GET":
+                writer.write(_http_response("405 Method Not Allowed", "text/plain", b"Only GET is supported.\n"))
+            elif path == "/stats":
+                body = json.dumps(self._snapshot, separators=(',', ':')).encode('utf-8')
+                writer.write(_http_response("200 OK", "application/json", body))
+            elif path == "/events":
+                await self._stream_events(writer)
+            else:
+                writer.write(_http_response("404 Not Found", "text/plain", b"Use /stats or /events.\n"))
+            await writer.drain()
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass   # Server shutting down.
+        finally:
+            self._connection_tasks.discard(task)
+            writer.close()
+
+    async def _stream_events(self, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\n"
+                     b"Access-Control-Allow-Origin: *\r\n"
+                     b"Connection: keep-alive\r\n\r\n"
+                     b"retry: 2000\n\n")
+        writer.write(_sse_message("snapshot", self._snapshot))
+        client_queue = asyncio.Queue(maxsize=self.client_queue_size)
+        self._clients[client_queue] = writer
+        try:
+            await writer.drain()
+            while client_queue in self._clients:
+                try:
+                    message = await asyncio.wait_for(client_queue.get(), timeout=self.keepalive_sec)
+                except asyncio.TimeoutError:
+                    message = b": keepalive\n\n"
+                if message is _CLOSE:
+                    break
+                writer.write(message)
+                await writer.drain()
+        finally:
+            self._clients.pop(client_queue, None)
+
+    async def _shutdown(self):
+        self._server.close()
+        for client_queue in list(self._clients):
+            try:
+                client_queue.put_nowait(_CLOSE)
+            except asyncio.QueueFull:
+                self._drop_client(client_queue)
+        # Streams end on _CLOSE; anything still stuck (e.g. reading a request) is cancelled.
+        tasks = list(self._connection_tasks)
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=1)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self._server.wait_closed()
@@ -0,0 +1,74 @@
+# src/status_delta.py
+
+
+class StatusDelta:
+    """
+    Change set between two get_full_status payloads.
+
+    stats_changed: {field: (old_value, new_value)}
+    flags_set / flags_cleared: event IDs (as strings, like the payload keys)
+    is_initial: there was no previous payload; every set flag is listed in flags_set.
+    """
+    __slots__ = ("stats_changed", "flags_set", "flags_cleared", "is_initial")
+
+    def __init__(self, stats_changed=None, flags_set=None, flags_cleared=None, is_initial=False):
+        self.stats_changed = stats_changed or {}
+        self.flags_set = flags_set or []
+        self.flags_cleared = flags_cleared or []
+        self.is_initial = is_initial
+
+    @property
+    def has_flag_changes(self):
+        return bool(self.flags_set or self.flags_cleared)
+
+    def is_empty(self):
+        return not (self.is_initial or self.stats_changed or self.flags_set or self.flags_cleared)
+
+    def __repr__(self):
+        return (f"StatusDelta(stats={list(self.stats_changed)}, set={self.flags_set}, "
+                f"cleared={self.flags_cleared}, initial={self.is_initial})")
+
+
+def compute_status_delta(old_data, new_data):
+    """Compares two payloads in a single pass over stats and boss_statuses."""
+    new_stats = new_data.get("stats", {})
+    new_statuses = new_data.get("boss_statuses", {})
+
+    if not old_data:
+        return StatusDelta(
+            stats_changed={key: (None, value) for key, value in new_stats.items()},
+            flags_set=[eid for eid, is_set in new_statuses.items() if is_set],
+            is_initial=True
+        )
+
+    old_stats = old_data.get("stats", {})
+    old_statuses = old_data.get("boss_statuses", {})
+
+    stats_changed = {}
+    if new_stats != old_stats:
+        for key, value in new_stats.items():
+            old_value = old_stats.get(key)
+            if old_value != value:
+                stats_changed[key] = (old_value, value)
+        for key in old_stats.keys() - new_stats.keys():
+            stats_changed[key] = (old_stats[key], None)
+
+    flags_set = []
+    flags_cleared = []
+    # Nearly every tick has identical flags; the C-level dict comparison settles that quickly.
+    if new_statuses != old_statuses:
+        matched = 0
+        for eid, is_set in new_statuses.items():
+            was_set = old_statuses.get(eid)
+            if was_set is not None:
+                matched += 1
+            if is_set and not was_set:
+                flags_set.append(eid)
+            elif was_set and not is_set:
+                flags_cleared.append(eid)
+        if matched != len(old_statuses):
+            # Some previously monitored IDs disappeared; a set flag that vanished counts as cleared.
+            flags_cleared.extend(eid for eid, was_set in old_statuses.items()
+                                 if was_set and eid not in new_statuses)
+
+    return StatusDelta(stats_changed, flags_set, flags_cleared)
@@ -60,54 +60,12 @@ QComboBox::down-arrow {
     height: 12px;
 }
 
-/* === KARTA LOKACE (LocationSectionWidget) === */
-QFrame#locationCard {
+/* === STROM BOSSŮ (BossTreeModel) === */
+QTreeView#bossTreeView {
     background-color: #2E3440;
-    border-radius: 8px;
     border: 1px solid #434C5E;
-    margin: 0px 0px 8px 0px;
-}
-
-/* Hlavička karty */
-#locationCard > QWidget {
-    background-color: #3B4252;
-    border-top-left-radius: 7px;
-    border-top-right-radius: 7px;
-    border-bottom-left-radius: 7px;
-    border-bottom-right-radius: 7px;
-}
-/* Hlavička karty, když je rozbalená */
-#locationCard > QWidget[expanded="true"] {
-    background-color: #434C5E;
-    border-bottom-left-radius: 0px;
-    border-bottom-right-radius: 0px;
-    border-bottom: 1px solid #4C566A;
-}
-
-/* ZMĚNA: Ujistíme se, že QLabel v hlavičce nemá žádné pozadí ani ohraničení */
-#locationCard QLabel {
-    background-color: transparent;
-    border: none; /* Toto explicitně odstraní nechtěné čáry */
-}
-
-#locationCard #location_name_label {
-    font-weight: bold;
-    font-size: 12pt;
-    color: #ECEFF4;
-}
-#locationCard QLabel#locationIcon {
-    border-image: url(assets/icons/map.svg);
-    background-color: transparent;
-    border: none;
-}
-
-/* === TABULKA BOSSŮ === */
-QTableWidget {
-    background-color: #2E3440;
-    border: none;
-    gridline-color: #434C5E;
-    border-bottom-left-radius: 7px;
-    border-bottom-right-radius: 7px;
+    border-radius: 8px;
+    outline: none;
 }
 
 /* Hlavička tabulky */
@@ -121,8 +79,8 @@ QHeaderView::section {
     font-weight: bold;
 }
 
-QTableWidget::item {
-    padding: 8px;
+QTreeView#bossTreeView::item {
+    padding: 6px;
     border-bottom: 1px solid #434C5E;
 }
 
@@ -147,54 +105,17 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
 }
 
-/* === SCROLL AREA A JEJÍ OBSAH === */
-QScrollArea#mainBossScrollArea {
-    border: none;
-    background-color: transparent;
-}
-
-QWidget#locationsContainer {
-    background-color: transparent;
-}
-
-/* === TLAČÍTKO PRO ROZBALENÍ KARTY === */
-QPushButton#expandButton {
-    background-color: transparent;
-    border: none;
-    padding: 0px;
-    margin: 0px;
-}
-QPushButton#expandButton:hover {
-    background-color: #4C566A;
-    border-radius: 4px;
-}
-
-/* === VYLEPŠENÝ CHECKBOX === */
-/* Cílíme POUZE na checkboxy uvnitř našich karet */
-#locationCard QCheckBox {
-    spacing: 0px; /* Žádné místo mezi indikátorem a textem (text nemáme) */
-    background-color: transparent; /* KLÍČOVÁ ZMĚNA: zprůhledníme pozadí kontejneru */
-    border: none;                  /* Pro jistotu odstraníme i okraj */
-}
-
-/* Pro konzistenci přidáme i hover efekt, stejně jako u šipky */
-#locationCard QCheckBox:hover {
-    background-color: #4C566A;
-    border-radius: 4px;
-}
-
-/* Styly pro samotný obrázek (indikátor) zůstávají stejné */
-#locationCard QCheckBox::indicator {
-    width: 20px;  /* Můžete si pohrát s velikostí obrázku */
+/* === CHECKBOX DOKONČENÉ LOKACE === */
+QTreeView#bossTreeView::indicator {
+    width: 20px;
     height: 20px;
 }
-#locationCard QCheckBox::indicator:unchecked {
-    image: url(assets/icons/square.svg); /* Vidím, že používáš square, což je super! */
+QTreeView#bossTreeView::indicator:unchecked {
+    image: url(assets/icons/square.svg);
 }
-#locationCard QCheckBox::indicator:checked {
+QTreeView#bossTreeView::indicator:checked {
     image: url(assets/icons/check-square.svg);
 }
-/* QCheckBox::indicator:disabled {} - Ponecháno pro případné budoucí úpravy, pokud by bylo potřeba */
 /* === STYLY PRO SIDEBAR === */
 
 /* Oprava pozadí pro všechny QLabel v sidebaru, aby nebyly tmavé */
@@ -239,34 +160,6 @@ QFrame#footer {
     color: #D8DEE9;
 }
 
-/* === UPRAVENÉ STYLY PRO NADPISY FÁZÍ HRY === */
-
-/* Obecný styl, který platí pro VŠECHNY nadpisy fází */
-QLabel#gamePhaseHeader {
-    font-size: 10pt;
-    font-weight: bold;
-    text-transform: uppercase;
-    padding-top: 15px;
-    padding-bottom: 8px;
-    margin: 0px 5px 10px 5px;
-    border-bottom: 1px solid #434C5E;
-}
-
-/* Specifická pravidla pro barvy na základě vlastnosti 'phase' */
-QLabel#gamePhaseHeader[phase="early"] {
-    color: rgb(78, 122, 81); /* Zelená */
-}
-QLabel#gamePhaseHeader[phase="mid"] {
-    color: rgb(183, 178, 87); /* Žlutá */
-}
-QLabel#gamePhaseHeader[phase="late"] {
-    color: rgb(110, 23, 23); /* Red */
-}
-/* --- ADDED RULE --- */
-QLabel#gamePhaseHeader[phase="dlc"] {
-    color: rgb(136, 99, 187); /* A nice purple for DLC */
-}
-/* --- END ADDED RULE --- */
 /* === NOVÝ STYL PRO VERZI V PATIČCE === */
 #footer QLabel#versionLabel {
     color: #616E88; /* Tlumená, méně výrazná barva */
@@ -345,4 +238,12 @@ LOCATION_TEXT_COLOR = QColor("#D8DEE9") # Default light text
 BOSS_NAME_TEXT_COLOR = QColor("#D8DEE9")
 
 LOCATION_ITEM_BG_COLOR = QColor("#3B4252") # Slightly lighter than tree background
-BOSS_ITEM_BG_COLOR = QColor("#2E3440") # Same as tree background or slightly different
\ No newline at end of file
+BOSS_ITEM_BG_COLOR = QColor("#2E3440") # Same as tree background or slightly different
+
+# Game phase heading rows, keyed by GAME_PHASE_HEADINGS "property"
+PHASE_HEADING_COLORS = {
+    "early": QColor(78, 122, 81),
+    "mid": QColor(183, 178, 87),
+    "late": QColor(110, 23, 23),
+    "dlc": QColor(136, 99, 187),
+}
\ No newline at end of file
@@ -1,41 +1,134 @@
 # src/timestamp_manager.py
 import os
 import json
+import time
+
+from .app_config import (
+    TIMESTAMP_JOURNAL_FSYNC_BATCH,
+    TIMESTAMP_JOURNAL_FSYNC_INTERVAL_SEC,
+    TIMESTAMP_JOURNAL_COMPACT_THRESHOLD
+)
+from .file_utils import atomic_write_text, get_app_data_path
 
 class TimestampManager:
-    def __init__(self, filename="timestamps.json"):
+    """
+    Kill timestamps per character: {character: {boss name: play time in seconds}}.
+
+    `timestamps.json` is a snapshot, replaced atomically. Each new kill is appended
+    as one compact JSON line to `timestamps.journal`; on load the journal is replayed
+    on top of the snapshot. Once the journal holds enough records it is folded into
+    a new snapshot and truncated. Replaying a record twice is harmless because only
+    the first kill time of a boss is kept.
+    """
+
+    def __init__(self, filename="timestamps.json", journal_filename="timestamps.journal",
+                 fsync_batch=TIMESTAMP_JOURNAL_FSYNC_BATCH,
+                 fsync_interval_sec=TIMESTAMP_JOURNAL_FSYNC_INTERVAL_SEC,
+                 compact_threshold=TIMESTAMP_JOURNAL_COMPACT_THRESHOLD):
         self.filepath = self._get_data_filepath(filename)
+        self.journal_path = self._get_data_filepath(journal_filename)
+        self.fsync_batch = fsync_batch
+        self.fsync_interval_sec = fsync_interval_sec
+        self.compact_threshold = compact_threshold
+
+        self._journal_file = None
+        self._journal_records = 0     # records in the journal since the last compaction
+        self._unsynced_records = 0
+        self._last_fsync = time.monotonic()
+
         self.timestamps = self._load()
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
 
     def _get_data_filepath(self, filename):
         """Constructs the full path to the data file."""
         # This places the timestamps.json file in the user's home directory
         # inside a dedicated folder, which is robust.
-        app_data_dir = os.path.join(os.path.expanduser("~"), ".TheTarnishedChronicle")
-        os.makedirs(app_data_dir, exist_ok=True)
-        return os.path.join(app_data_dir, filename)
+        return get_app_data_path(filename)
 
     def _load(self):
-        """Loads timestamps from the JSON file."""
-        if not os.path.exists(self.filepath):
-            return {}
-        try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading timestamps file: {e}")
-            return {}
-
-    def _save(self):
-        """Saves the current timestamps to the JSON file."""
+        """Loads the snapshot and replays the journal on top of it."""
+        timestamps = {}
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, 'r', encoding='utf-8') as f:
+                    timestamps = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading timestamps file: {e}")
+
+        if os.path.exists(self.journal_path):
+            try:
+                with open(self.journal_path, 'rb') as f:
+                    data = f.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    # A torn last line from a crash mid-append; cut it off so the next append
+                    # starts on its own line instead of being glued onto it.
+                    print("Warning: Dropping a torn record at the end of the timestamps journal.")
+                    with open(self.journal_path, 'r+b') as f:
+                        f.truncate(complete)
+                for line in data[:complete].decode('utf-8', errors='replace').splitlines():
+                    try:
+                        character_id, boss_name, play_time_seconds = json.loads(line)
+                    except (ValueError, TypeError):
+                        print("Warning: Skipping unreadable record in timestamps journal.")
+                        continue
+                    timestamps.setdefault(character_id, {}).setdefault(boss_name, play_time_seconds)
+                    self._journal_records += 1
+            except IOError as e:
+                print(f"Error reading timestamps journal: {e}")
+        return timestamps
+
+    def _append_to_journal(self, record):
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, 'a', encoding='utf-8')
+        self._journal_file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._journal_file.flush()
+        self._journal_records += 1
+        self._unsynced_records += 1
+
+        now = time.monotonic()
+        if self._unsynced_records >= self.fsync_batch or now - self._last_fsync >= self.fsync_interval_sec:
+            self._sync_journal()
+
+    def _sync_journal(self):
+        if self._journal_file is not None and self._unsynced_records:
+            os.fsync(self._journal_file.fileno())
+        self._unsynced_records = 0
+        self._last_fsync = time.monotonic()
+
+    def compact(self):
+        """Writes a new snapshot with everything in memory and empties the journal."""
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.timestamps, f, indent=4)
+            atomic_write_text(self.filepath, json.dumps(self.timestamps, ensure_ascii=False, separators=(',', ':')))
         except IOError as e:
             print(f"Error saving timestamps file: {e}")
+            return
+        # The journal's records are in the snapshot now; a crash before this point just replays them.
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        try:
+            open(self.journal_path, 'w', encoding='utf-8').close()
+        except IOError as e:
+            print(f"Error truncating timestamps journal: {e}")
+        self._journal_records = 0
+        self._unsynced_records = 0
+
+    def close(self):
+        """Syncs pending journal records and compacts; call before the application exits."""
+        try:
+            self._sync_journal()
+            if self._journal_records:
+                self.compact()
+        except (IOError, OSError) as e:
+            print(f"Error closing timestamps journal: {e}")
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
 
     def add_timestamp(self, character_id: str, boss_name: str, play_time_seconds: int):
-        """Adds a timestamp for a defeated boss and saves the file."""
+        """Adds a timestamp for a defeated boss and appends it to the journal."""
         if character_id not in self.timestamps:
             self.timestamps[character_id] = {}
         
@@ -43,8 +136,13 @@ class TimestampManager:
         if boss_name not in self.timestamps[character_id]:
             print(f"Recording kill for '{boss_name}' at {play_time_seconds}s for char '{character_id}'")
             self.timestamps[character_id][boss_name] = play_time_seconds
-            self._save()
+            try:
+                self._append_to_journal([character_id, boss_name, play_time_seconds])
+                if self._journal_records >= self.compact_threshold:
+                    self.compact()
+            except (IOError, OSError) as e:
+                print(f"Error saving timestamp: {e}")
 
     def get_timestamps_for_character(self, character_id: str) -> dict:
         """Gets all timestamps for a specific character."""
-        return self.timestamps.get(character_id, {})
\ No newline at end of file
+        return self.timestamps.get(character_id, {})
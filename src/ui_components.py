@@ -1,15 +1,26 @@
 # src/ui_components.py
 
-from PySide6.QtCore import Property, QPointF, QRectF, QPropertyAnimation, QEasingCurve, Qt, Signal, QTimer, QSize, QByteArray
+from PySide6.QtCore import Property, QPointF, QRectF, QPropertyAnimation, QEasingCurve, Qt, Signal, QSize, QByteArray
 from PySide6.QtGui import QPainter, QBrush, QColor, QIcon, QPixmap
 from PySide6.QtWidgets import (
     QAbstractButton, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox,
-    QVBoxLayout, QWidget, QTableWidget, QTableWidgetItem, QAbstractItemView,
-    QCheckBox, QSizePolicy, QFrame, QGraphicsDropShadowEffect, QScrollArea, QHeaderView, QGroupBox
+    QVBoxLayout, QWidget, QTreeView, QAbstractItemView,
+    QCheckBox, QFrame, QHeaderView, QGroupBox
 )
 from .app_config import APP_VERSION
 # --- ZDE JE KLÍČOVÁ OPRAVA ---
-from .utils import create_colored_pixmap, format_seconds_to_hms # <--- NEW IMPORT
+from .utils import create_colored_pixmap # <--- NEW IMPORT
+
+# Every (icon path, color, size) the widgets below render; pre-warmed into the pixmap cache at startup.
+ICON_PIXMAPS = [
+    *[(path, QColor(234, 179, 8), QSize(20, 20)) for path in (
+        "assets/icons/file-text.svg", "assets/icons/user.svg", "assets/icons/filter.svg", "assets/icons/award.svg")],
+    ("assets/icons/check-circle.svg", QColor("#A3BE8C"), QSize(16, 16)),
+    ("assets/icons/x.svg", QColor("#D8DEE9"), QSize(16, 16)),
+    *[("assets/icons/activity.svg", QColor(color), QSize(16, 16)) for color in ("#D8DEE9", "#A3BE8C", "#EBCB8B")],
+    *[(path, QColor("#D8DEE9"), QSize(16, 16)) for path in (
+        "assets/icons/check-circle.svg", "assets/icons/skull-and-crossbones.svg", "assets/icons/clock.svg")],
+]
 
 #==============================================================================
 # Custom widget for the toggle switch
@@ -218,21 +229,27 @@ class AchievementsSectionWidget(QFrame):
             
             self.content_layout.addLayout(achievement_layout)
 
-def create_main_boss_area(parent_widget):
-    # ... (tato funkce zůstává beze změny) ...
-    scroll_area = QScrollArea(parent_widget)
-    scroll_area.setWidgetResizable(True)
-    scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-    scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-    scroll_area.setObjectName("mainBossScrollArea")
-    main_container_widget = QWidget()
-    main_container_widget.setObjectName("locationsContainer")
-    parent_widget.locations_layout = QVBoxLayout(main_container_widget)
-    parent_widget.locations_layout.setContentsMargins(10, 10, 10, 10)
-    parent_widget.locations_layout.setSpacing(0)
-    parent_widget.locations_layout.addStretch()
-    scroll_area.setWidget(main_container_widget)
-    return scroll_area
+def create_main_boss_area(parent_widget, model):
+    """Single tree view over the boss model (locations -> bosses)."""
+    tree_view = QTreeView(parent_widget)
+    tree_view.setObjectName("bossTreeView")
+    tree_view.setModel(model)
+    # Every row has the same height, so the view never has to measure rows.
+    tree_view.setUniformRowHeights(True)
+    tree_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    tree_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    tree_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+    tree_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    tree_view.setIconSize(QSize(18, 18))
+    tree_view.setExpandsOnDoubleClick(False)
+    header = tree_view.header()
+    header.setStretchLastSection(False)
+    header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+    header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
+    header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+    header.resizeSection(1, 70)
+    header.resizeSection(2, 100)
+    return tree_view
 
 def create_overlay_settings_panel_layout(parent_widget):
     # ... (tato funkce zůstává beze změny) ...
@@ -381,193 +398,6 @@ def create_obs_panel_layout(parent_widget):
 #==============================================================================
 # Main Widgets (Cards, Footer)
 #==============================================================================
-class LocationSectionWidget(QFrame):
-    # ... (třída a její metody, včetně nové metody 'update_boss_info', zůstávají beze změny) ...
-    def __init__(self, location_name, bosses_data, parent=None):
-        super().__init__(parent)
-        self.setObjectName("locationCard")
-        self.location_name = location_name
-        self.bosses_data = bosses_data
-        self.is_expanded = False
-        self._init_ui()
-        self._apply_shadow()
-
-    def _apply_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        self.setGraphicsEffect(shadow)
-
-    def _init_ui(self):
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        self.header_widget = QWidget()
-        self.header_widget.setProperty("expanded", self.is_expanded)
-        header_layout = QHBoxLayout(self.header_widget)
-        header_layout.setContentsMargins(8, 12, 8, 12)
-        header_layout.setSpacing(10)
-        self.expand_button = QPushButton()
-        self.expand_button.setObjectName("expandButton")
-        self.expand_button.setFixedSize(24, 24)
-        self.location_icon_label = QLabel()
-        self.location_icon_label.setObjectName("locationIcon")
-        self.location_icon_label.setFixedSize(18, 18)
-        self.location_name_label = QLabel()
-        self.location_name_label.setObjectName("location_name_label")
-        self.location_complete_checkbox = QCheckBox()
-        self.location_complete_checkbox.setEnabled(False)
-        self.location_complete_checkbox.setFixedSize(24, 24)
-        header_layout.addWidget(self.expand_button)
-        header_layout.addWidget(self.location_icon_label)
-        header_layout.addWidget(self.location_name_label, 1)
-        header_layout.addWidget(self.location_complete_checkbox)
-        self.header_widget.mousePressEvent = self._header_clicked
-        self.expand_button.clicked.connect(self._toggle_expand)
-        main_layout.addWidget(self.header_widget)
-        self.boss_table = QTableWidget()
-        self.boss_table.setColumnCount(3)
-        self.boss_table.setHorizontalHeaderLabels(["Boss / Event", "Status", "Timestamp"])
-        self.boss_table.verticalHeader().setVisible(False)
-        self.boss_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.boss_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.boss_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.boss_table.setVisible(False)
-        self.boss_table.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        header = self.boss_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        main_layout.addWidget(self.boss_table)
-        self.setLayout(main_layout)
-        self._populate_boss_table()
-        self._update_header_text()
-
-    def _populate_boss_table(self):
-        self.boss_table.setRowCount(len(self.bosses_data))
-        for row, boss_info in enumerate(self.bosses_data):
-            # ... (boss name and status icon logic is unchanged) ...
-            boss_name_item = QTableWidgetItem(f" {boss_info.get('name', 'N/A')}")
-            boss_name_item.setData(Qt.ItemDataRole.UserRole, boss_info)
-            self.boss_table.setItem(row, 0, boss_name_item)
-            
-            status_icon_label = QLabel()
-            status_icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.boss_table.setCellWidget(row, 1, status_icon_label)
-            
-            # --- MODIFIED: Handle timestamp display ---
-            timestamp_seconds = boss_info.get('timestamp')
-            timestamp_str = format_seconds_to_hms(timestamp_seconds)
-            timestamp_item = QTableWidgetItem(timestamp_str)
-            # --- END MODIFIED ---
-            
-            timestamp_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.boss_table.setItem(row, 2, timestamp_item)
-
-        self.update_boss_info(self.bosses_data)
-
-    def update_boss_info(self, new_bosses_data):
-        self.bosses_data = new_bosses_data
-        defeated_count = 0
-
-        for row in range(self.boss_table.rowCount()):
-            boss_name_item = self.boss_table.item(row, 0)
-            original_boss_info = boss_name_item.data(Qt.ItemDataRole.UserRole)
-            
-            new_boss_info = next((b for b in new_bosses_data if b.get('name') == original_boss_info.get('name')), None)
-            
-            if not new_boss_info: continue
-
-            is_defeated = new_boss_info.get("is_defeated", False)
-            if is_defeated:
-                defeated_count += 1
-
-            status_icon_label = self.boss_table.cellWidget(row, 1)
-            if is_defeated:
-                pixmap = create_colored_pixmap("assets/icons/check.svg", QColor("#A3BE8C"), QSize(18, 18))
-                status_icon_label.setPixmap(pixmap)
-                status_icon_label.setToolTip("Defeated")
-            else:
-                pixmap = create_colored_pixmap("assets/icons/x.svg", QColor("#BF616A"), QSize(18, 18))
-                status_icon_label.setPixmap(pixmap)
-                status_icon_label.setToolTip("Active")
-            
-        self.defeated_count = defeated_count
-        self.total_bosses = len(self.bosses_data)
-        self.location_complete_checkbox.setChecked(self.total_bosses > 0 and self.defeated_count == self.total_bosses)
-        self._update_header_text()
-
-    def _update_header_text(self):
-        self.location_name_label.setText(f"{self.location_name} ({self.defeated_count}/{self.total_bosses})")
-        if self.is_expanded:
-            self.expand_button.setIcon(QIcon("assets/icons/chevron-down.svg"))
-        else:
-            self.expand_button.setIcon(QIcon("assets/icons/chevron-right.svg"))
-
-    def _update_table_height(self):
-        """Calculates and sets the correct fixed height for the boss table."""
-        if self.is_expanded:
-            header_h = self.boss_table.horizontalHeader().height()
-            # Calculate height based only on visible rows
-            content_h = sum(self.boss_table.rowHeight(i) for i in range(self.boss_table.rowCount()) if not self.boss_table.isRowHidden(i))
-            self.boss_table.setFixedHeight(header_h + content_h + 5)
-        else:
-            self.boss_table.setFixedHeight(0)
-        
-        # This is important to force the layout to re-evaluate
-        QTimer.singleShot(0, lambda: self.parentWidget().layout().activate())
-
-    def apply_status_filter(self, hide_defeated: bool):
-        """Hides or shows rows in the table based on their defeated status."""
-        # ... (the existing logic for hiding/showing rows is unchanged) ...
-        any_boss_visible = False
-        for row in range(self.boss_table.rowCount()):
-            item = self.boss_table.item(row, 0)
-            if not item: continue
-            
-            boss_info = item.data(Qt.ItemDataRole.UserRole)
-            is_defeated = boss_info.get("is_defeated", False)
-            
-            should_hide = hide_defeated and is_defeated
-            self.boss_table.setRowHidden(row, should_hide)
-            
-            if not should_hide:
-                any_boss_visible = True
-        
-        self.setVisible(any_boss_visible)
-        
-        # --- ADDED CALL ---
-        # After changing row visibility, we must update the table's height
-        self._update_table_height()
-
-    def set_expanded(self, expanded: bool):
-        """Programmatically sets the expanded state of the widget."""
-        # Only call toggle if the state is actually different, to avoid recursion
-        if self.is_expanded != expanded:
-            self._toggle_expand()
-
-    def _header_clicked(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self._toggle_expand()
-
-    def _toggle_expand(self):
-        self.is_expanded = not self.is_expanded
-        self.boss_table.setVisible(self.is_expanded)
-        self.header_widget.setProperty("expanded", self.is_expanded)
-        self.header_widget.style().unpolish(self.header_widget)
-        self.header_widget.style().polish(self.header_widget)
-        
-        # --- MODIFIED ---
-        # Use our new helper method here as well for consistency
-        self._update_table_height()
-        
-        self._update_header_text()
-        self.adjustSize()
-        if self.parentWidget() and self.parentWidget().layout():
-            self.parentWidget().layout().activate()
-
 class FooterWidget(QFrame):
     # ... (tato třída zůstává beze změny) ...
     def __init__(self, parent=None):
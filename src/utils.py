@@ -1,13 +1,24 @@
 # src/utils.py
+from collections import OrderedDict
 
 from PySide6.QtCore import QSize, QByteArray, Qt
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtGui import QColor, QPixmap, QGuiApplication
 
-def create_colored_pixmap(icon_path: str, color: QColor, size: QSize) -> QPixmap:
-    """
-    Loads an SVG icon, replaces its 'currentColor' with a specified QColor,
-    and returns it as a scaled QPixmap.
-    """
+from .app_config import PIXMAP_CACHE_MAX_ENTRIES
+from .formatting import format_seconds_to_hms  # Qt-free home, re-exported for the widgets
+
+# (path, color, width, height, device pixel ratio) -> QPixmap, least recently used first
+_pixmap_cache = OrderedDict()
+_pixmap_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _default_device_pixel_ratio() -> float:
+    app = QGuiApplication.instance()
+    screen = app.primaryScreen() if app else None
+    return screen.devicePixelRatio() if screen else 1.0
+
+
+def _render_colored_pixmap(icon_path: str, color: QColor, size: QSize, device_pixel_ratio: float) -> QPixmap:
     try:
         with open(icon_path, 'r', encoding='utf-8') as f:
             svg_data = f.read()
@@ -18,15 +29,51 @@ def create_colored_pixmap(icon_path: str, color: QColor, size: QSize) -> QPixmap
         pixmap = QPixmap()
         pixmap.loadFromData(byte_array)
         
-        return pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pixmap = pixmap.scaled(size * device_pixel_ratio, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
     except Exception as e:
         print(f"Error creating colored pixmap for {icon_path}: {e}")
         return QPixmap()
-def format_seconds_to_hms(seconds: int) -> str:
-    """Formats a duration in seconds to a HH:MM:SS string."""
-    if not isinstance(seconds, (int, float)) or seconds < 0:
-        return "--:--"
-    
-    h, rem = divmod(int(seconds), 3600)
-    m, s = divmod(rem, 60)
-    return f"{h:02d}:{m:02d}:{s:02d}"
\ No newline at end of file
+
+
+def create_colored_pixmap(icon_path: str, color: QColor, size: QSize, device_pixel_ratio: float = None) -> QPixmap:
+    """
+    Loads an SVG icon, replaces its 'currentColor' with a specified QColor,
+    and returns it as a scaled QPixmap.
+    Results are cached per (path, color, size, device pixel ratio); the returned
+    pixmap is shared, so callers must not paint on it.
+    """
+    if device_pixel_ratio is None:
+        device_pixel_ratio = _default_device_pixel_ratio()
+    key = (icon_path, color.rgba(), size.width(), size.height(), device_pixel_ratio)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is not None:
+        _pixmap_cache.move_to_end(key)
+        _pixmap_cache_stats["hits"] += 1
+        return pixmap
+
+    _pixmap_cache_stats["misses"] += 1
+    # Failed loads are cached too, so a missing icon is reported once.
+    pixmap = _render_colored_pixmap(icon_path, color, size, device_pixel_ratio)
+    _pixmap_cache[key] = pixmap
+    if len(_pixmap_cache) > PIXMAP_CACHE_MAX_ENTRIES:
+        _pixmap_cache.popitem(last=False)
+        _pixmap_cache_stats["evictions"] += 1
+    return pixmap
+
+
+def prewarm_pixmap_cache(icon_specs):
+    """Renders (icon_path, color, size) entries ahead of time, e.g. right after QApplication starts."""
+    for icon_path, color, size in icon_specs:
+        create_colored_pixmap(icon_path, color, size)
+
+
+def get_pixmap_cache_stats() -> dict:
+    return dict(_pixmap_cache_stats, size=len(_pixmap_cache))
+
+
+def clear_pixmap_cache():
+    _pixmap_cache.clear()
+    for counter in _pixmap_cache_stats:
+        _pixmap_cache_stats[counter] = 0
@@ -0,0 +1,44 @@
+# tests/test_save_change_detector.py
+from src import save_change_detector
+from src.benchmarks import build_synthetic_save
+from src.save_change_detector import MultiSlotChangeDetector
+
+BST = {10000: 0}
+
+
+def _write(path, deaths):
+    build_synthetic_save(str(path), {0: {"name": "A", "deaths": deaths}, 1: {"name": "B"}}, BST)
+
+
+def test_unread_change_is_reported_again(tmp_path):
+    path = tmp_path / "ER0000.sl2"
+    _write(path, 1)
+    detector = MultiSlotChangeDetector()
+    assert detector.changed_slots(str(path), [0, 1]) == [0, 1]
+    detector.mark_read([0, 1])
+    assert detector.changed_slots(str(path), [0, 1]) == []
+
+    _write(path, 2)
+    assert detector.changed_slots(str(path), [0, 1]) == [0]
+    # The read failed, so nothing is marked; the next tick must report slot 0 again.
+    assert detector.changed_slots(str(path), [0, 1]) == [0]
+
+
+def test_failed_stat_does_not_commit_an_earlier_stat_key(tmp_path, monkeypatch):
+    path = tmp_path / "ER0000.sl2"
+    _write(path, 1)
+    detector = MultiSlotChangeDetector()
+    detector.changed_slots(str(path), [0, 1])
+    detector.mark_read([0, 1])
+
+    _write(path, 2)
+    assert detector.changed_slots(str(path), [0, 1]) == [0]   # read of slot 0 then fails, not marked
+
+    def failing_stat(*args, **kwargs):
+        raise OSError("locked")
+    monkeypatch.setattr(save_change_detector.os, "stat", failing_stat)
+    assert detector.changed_slots(str(path), [0, 1]) == [0, 1]
+    detector.mark_read([1])
+    monkeypatch.undo()
+
+    assert detector.changed_slots(str(path), [0, 1]) == [0]
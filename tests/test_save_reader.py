@@ -0,0 +1,193 @@
+# tests/test_save_reader.py
+"""
+SaveReader against synthetic saves.
+
+The saves are laid out here from the .sl2 format description, without the
+reader's offset constants, so a wrong constant in save_reader shows up as a
+failing read instead of being mirrored by the fixture.
+"""
+import struct
+
+import pytest
+
+from src.rust_cli_handler import RustCliHandler
+from src.save_reader import SaveReader, create_save_backend
+
+SLOT_DATA_SIZE = 0x280000
+USER_DATA_10_SIZE = 0x60000
+CHECKSUM_SIZE = 0x10
+
+# Sizes of the fixed sections of a character slot, field by field.
+PLAYER_GAME_DATA = 0x1B0
+SPECIAL_EFFECTS = 0xD0
+EQUIPMENT = 0x58 + 0x1C + 0x58 + 0x58
+HELD_INVENTORY = 4 + 0xA80 * 12 + 4 + 0x180 * 12 + 4 + 4
+SPELLS_ITEMS_GESTURES = 0x74 + 0x8C + 0x18
+EQUIPPED_PHYSICK = 0x9C + 0xC
+FACE_DATA = 0x12F
+STORAGE_BOX = 4 + 0x780 * 12 + 4 + 0x80 * 12 + 4 + 4
+GESTURES = 0x100
+AFTER_REGIONS = 0x28 + 0x1 + 0x44 + 0x8 + 0x1008 + 0x34 + (0x8 + 0x1B58 * 0x10) + 0x408 + 0x3
+DEATHS_TO_FLAGS = 4 + 4 + 1 + 4 + 4 + 1 + 4 + 4
+
+BST = {10000: 3, 71: 0, 1042: 7}
+MARGIT = 10000800
+GODRICK = 10000801
+GRAFTED_SCION = 71000
+UNKNOWN_BLOCK = 99999001
+
+
+def _write_slot(buf, start, character):
+    version = character.get("version", 0xFF)
+    struct.pack_into("<I", buf, start, version)
+    pos = start + 0x20
+    gaitems = list(character.get("gaitems", ()))
+    gaitem_count = 0x13FE if version <= 81 else 0x1400
+    for i in range(gaitem_count):
+        handle = gaitems[i] if i < len(gaitems) else 0
+        struct.pack_into("<II", buf, pos, handle, 0x1234)
+        pos += 8
+        if handle & 0xF0000000 == 0x80000000:
+            pos += 13
+        elif handle & 0xF0000000 == 0x90000000:
+            pos += 8
+
+    pos += PLAYER_GAME_DATA + SPECIAL_EFFECTS + EQUIPMENT + HELD_INVENTORY + SPELLS_ITEMS_GESTURES
+    projectiles = character.get("projectiles", 0)
+    struct.pack_into("<I", buf, pos, projectiles)
+    pos += 4 + projectiles * 8
+    pos += EQUIPPED_PHYSICK + FACE_DATA + STORAGE_BOX + GESTURES
+    regions = character.get("regions", 0)
+    struct.pack_into("<I", buf, pos, regions)
+    pos += 4 + regions * 4
+    pos += AFTER_REGIONS
+
+    struct.pack_into("<I", buf, pos, character["deaths"])
+    flags_start = pos + DEATHS_TO_FLAGS
+    for eid in character.get("flags", ()):
+        byte = flags_start + BST[eid // 1000] * 0x7D + (eid % 1000) // 8
+        buf[byte] |= 0x80 >> (eid % 8)
+
+
+def build_save(path, characters):
+    """BND4 with 10 slot entries + USER_DATA_10; `characters` maps slot -> fields."""
+    entry_count = 11
+    data_start = 0x40 + entry_count * 0x20
+    sizes = [SLOT_DATA_SIZE + CHECKSUM_SIZE] * 10 + [USER_DATA_10_SIZE + CHECKSUM_SIZE]
+    buf = bytearray(data_start + sum(sizes))
+    buf[0:4] = b"BND4"
+    struct.pack_into("<i", buf, 0x0C, entry_count)
+    entry_data = []
+    pos = data_start
+    for i, size in enumerate(sizes):
+        struct.pack_into("<q", buf, 0x40 + i * 0x20 + 0x08, size)
+        struct.pack_into("<I", buf, 0x40 + i * 0x20 + 0x10, pos)
+        entry_data.append(pos + CHECKSUM_SIZE)
+        pos += size
+
+    user_data = entry_data[10]
+    for slot_index, character in characters.items():
+        buf[user_data + 0x1954 + slot_index] = 1
+        summary = user_data + 0x195E + slot_index * 0x24C
+        name = character["name"].encode("utf-16-le")
+        buf[summary:summary + len(name)] = name
+        struct.pack_into("<I", buf, summary + 0x22, character["level"])
+        struct.pack_into("<I", buf, summary + 0x26, character["seconds_played"])
+        _write_slot(buf, entry_data[slot_index], character)
+
+    path.write_bytes(bytes(buf))
+    return str(path)
+
+
+TARNISHED = {
+    "name": "Tarnished", "level": 42, "seconds_played": 3600, "deaths": 17,
+    # One weapon, one armor piece and one plain item shift everything after the gaitem map.
+    "gaitems": [0x80000001, 0x90000002, 0xA0000003],
+    "projectiles": 2, "regions": 5,
+    "flags": [MARGIT, GRAFTED_SCION],
+}
+OLD_SLOT = {
+    "name": "Old", "level": 1, "seconds_played": 10, "deaths": 3, "version": 81,
+    "gaitems": [0x80000001], "flags": [GODRICK],
+}
+
+
+@pytest.fixture
+def save_path(tmp_path):
+    return build_save(tmp_path / "ER0000.sl2", {0: TARNISHED, 4: OLD_SLOT})
+
+
+@pytest.fixture
+def reader():
+    return SaveReader(event_flag_bst=BST)
+
+
+def test_list_characters_returns_populated_slots(reader, save_path):
+    characters, err = reader.list_characters(save_path)
+    assert err is None
+    assert characters == [
+        {"slot_index": 0, "character_name": "Tarnished", "character_level": 42, "seconds_played": 3600},
+        {"slot_index": 4, "character_name": "Old", "character_level": 1, "seconds_played": 10},
+    ]
+
+
+def test_get_full_status_reads_deaths_and_flags(reader, save_path):
+    status, err = reader.get_full_status(save_path, 0, [MARGIT, GODRICK, GRAFTED_SCION, UNKNOWN_BLOCK])
+    assert err is None
+    assert status["stats"] == {"character_name": "Tarnished", "character_level": 42,
+                               "seconds_played": 3600, "deaths": 17}
+    assert status["boss_statuses"] == {str(MARGIT): True, str(GODRICK): False,
+                                       str(GRAFTED_SCION): True, str(UNKNOWN_BLOCK): False}
+
+
+def test_old_slot_version_uses_the_shorter_gaitem_map(reader, save_path):
+    status, err = reader.get_full_status(save_path, 4, [MARGIT, GODRICK])
+    assert err is None
+    assert status["stats"]["deaths"] == 3
+    assert status["boss_statuses"] == {str(MARGIT): False, str(GODRICK): True}
+
+
+def test_get_multi_slot_status_reads_every_populated_slot(reader, save_path):
+    statuses, err = reader.get_multi_slot_status(save_path, [MARGIT, GODRICK])
+    assert err is None
+    assert sorted(statuses) == [0, 4]
+    assert statuses[0]["boss_statuses"][str(MARGIT)] is True
+    assert statuses[4]["boss_statuses"][str(GODRICK)] is True
+
+
+def test_empty_slot_is_an_error(reader, save_path):
+    status, err = reader.get_full_status(save_path, 1, [MARGIT])
+    assert status is None
+    assert "empty" in err
+
+
+def test_not_a_save_file(reader, tmp_path):
+    path = tmp_path / "junk.sl2"
+    path.write_bytes(b"junk" * 100)
+    characters, err = reader.list_characters(str(path))
+    assert characters is None
+    assert "BND4" in err
+
+
+def test_missing_event_flag_table(save_path):
+    reader = SaveReader(bst_filename="missing_eventflag_bst.txt")
+    assert not reader.is_available()
+    status, err = reader.get_full_status(save_path, 0, [MARGIT])
+    assert status is None
+    assert "missing_eventflag_bst.txt" in err
+
+
+def test_python_backend_falls_back_without_event_flag_table(monkeypatch):
+    monkeypatch.setattr(SaveReader, "is_available", lambda self: False)
+    assert isinstance(create_save_backend("python", "RUST_CLI_TOOL_PATH_PLACEHOLDER"), RustCliHandler)
+
+
+def test_cached_flag_positions_follow_the_event_id_list(reader, save_path):
+    event_ids = [MARGIT]
+    reader.get_full_status(save_path, 0, event_ids)
+    event_ids.append(GRAFTED_SCION)   # changed in place, like a reused list
+    status, err = reader.get_full_status(save_path, 0, event_ids)
+    assert err is None
+    assert status["boss_statuses"] == {str(MARGIT): True, str(GRAFTED_SCION): True}
+    status, err = reader.get_full_status(save_path, 0, [GODRICK])
+    assert status["boss_statuses"] == {str(GODRICK): False}
@@ -0,0 +1,34 @@
+# tests/test_timestamp_manager.py
+import pytest
+
+from src import timestamp_manager
+from src.timestamp_manager import TimestampManager
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(timestamp_manager, "get_app_data_path", lambda filename: str(tmp_path / filename))
+    return tmp_path
+
+
+def test_torn_journal_line_does_not_swallow_the_next_record(data_dir):
+    # Crash mid-append: the last record is cut off without its newline.
+    (data_dir / "timestamps.journal").write_text('["A","Margit",100]\n["A","Godr', encoding="utf-8")
+
+    manager = TimestampManager()
+    assert manager.get_timestamps_for_character("A") == {"Margit": 100}
+    manager.add_timestamp("A", "Radahn", 300)
+    manager._journal_file.close()   # simulate another crash: no compaction on close
+    manager._journal_file = None
+
+    assert TimestampManager().get_timestamps_for_character("A") == {"Margit": 100, "Radahn": 300}
+
+
+def test_close_folds_the_journal_into_the_snapshot(data_dir):
+    manager = TimestampManager()
+    manager.add_timestamp("A", "Margit", 100)
+    manager.add_timestamp("A", "Margit", 200)   # only the first kill time is kept
+    manager.close()
+
+    assert (data_dir / "timestamps.journal").read_text(encoding="utf-8") == ""
+    assert TimestampManager().get_timestamps_for_character("A") == {"Margit": 100}